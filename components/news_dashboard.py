@@ -7,6 +7,7 @@ import streamlit.components.v1 as components
 from datetime import datetime
 import pytz
 import pandas as pd
+from modules import news_schema
 
 
 _CSS = """
@@ -154,7 +155,9 @@ def render_news_dashboard(news_df: pd.DataFrame, show_live: bool = True):
     if news_df.empty or "날짜" not in news_df.columns:
         today_news = pd.DataFrame()
     else:
-        today_news = news_df[news_df["날짜"].astype(str).str.startswith(today_str)].copy()
+        today = pd.Timestamp(today_str)
+        dates = news_schema.parse_dates(news_df["날짜"])
+        today_news = news_df[(dates >= today) & (dates < today + pd.Timedelta(days=1))].copy()
 
     total_today = len(today_news)
 
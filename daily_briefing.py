@@ -11,11 +11,12 @@ P-IRIS 일간 뉴스 브리핑 전송 스크립트
 import os
 import json
 import time
-import requests
 import pandas as pd
 from datetime import datetime, timezone, timedelta
 from html import escape
 
+from modules import http_client, news_archive, news_schema
+
 try:
     from dotenv import load_dotenv
     load_dotenv()
@@ -127,9 +128,9 @@ def _group(keyword: str) -> str:
     return keyword
 
 
-def _date_display(date_str: str) -> str:
-    """'2026-04-16 18:32' → '04-16 18:32'"""
-    s = str(date_str).strip()
+def _date_display(value) -> str:
+    """2026-04-16 18:32 → '04-16 18:32'"""
+    s = news_schema.format_date(value)
     if len(s) >= 16:
         return s[5:16]
     return s
@@ -141,52 +142,65 @@ def load_news_db() -> pd.DataFrame:
     if not os.path.exists(NEWS_DB_FILE):
         return pd.DataFrame()
     try:
-        df = pd.read_csv(NEWS_DB_FILE, encoding="utf-8")
-        if "sentiment" not in df.columns:
-            df["sentiment"] = "pos"
-        return df
+        return news_schema.read_csv(NEWS_DB_FILE)
     except Exception as e:
         print(f"[ERROR] DB 로드 실패: {e}")
         return pd.DataFrame()
 
 
-def get_yesterday_articles(df: pd.DataFrame) -> tuple[pd.DataFrame, str]:
+def _query_archive(start, end=None) -> pd.DataFrame:
+    """전체 이력 아카이브 조회 (아카이브가 없거나 실패하면 빈 프레임 → 호출부가 DB로 폴백)"""
+    try:
+        return news_archive.get_archive().query(start=start, end=end)
+    except Exception as e:
+        print(f"[WARNING] 아카이브 조회 실패 (DB로 대체): {e}")
+        return pd.DataFrame()
+
+
+def get_yesterday_articles(df: pd.DataFrame, use_archive: bool = False) -> tuple[pd.DataFrame, str]:
     """
     어제(KST 기준) 기사 필터링.
+    use_archive=True면 전체 이력 아카이브에서 조회 (200행 DB에서 잘린 기사 포함).
     Returns: (filtered_df, 'YYYY-MM-DD')
     """
     now_kst = datetime.now(KST)
     yesterday_kst = (now_kst - timedelta(days=1)).strftime("%Y-%m-%d")
 
+    if use_archive:
+        archived = _query_archive(yesterday_kst, pd.Timestamp(yesterday_kst) + pd.Timedelta(days=1))
+        if not archived.empty:
+            return archived, yesterday_kst
+
     if df.empty:
         return pd.DataFrame(), yesterday_kst
 
-    df = df.copy()
-    df["_dt"] = pd.to_datetime(df["날짜"], errors="coerce")
-    mask = df["_dt"].dt.strftime("%Y-%m-%d") == yesterday_kst
-    result = df[mask].drop(columns=["_dt"]).copy()
-    return result, yesterday_kst
+    mask = news_schema.parse_dates(df["날짜"]).dt.strftime("%Y-%m-%d") == yesterday_kst
+    return df[mask].copy(), yesterday_kst
 
 
-def get_recent_articles(df: pd.DataFrame, days: int = 7) -> tuple[pd.DataFrame, int]:
+def get_recent_articles(df: pd.DataFrame, days: int = 7, use_archive: bool = False) -> tuple[pd.DataFrame, int]:
     """
     최근 N일 기사 필터링 (어제 기사 0건일 때 폴백).
     Returns: (filtered_df, actual_days_covered)
     """
+    if use_archive:
+        cutoff = (datetime.now(KST) - timedelta(days=days)).replace(tzinfo=None)
+        archived = _query_archive(cutoff)
+        if not archived.empty:
+            df = archived
     if df.empty:
         return pd.DataFrame(), 0
 
-    df = df.copy()
-    df["_dt"] = pd.to_datetime(df["날짜"], errors="coerce")
+    dates = news_schema.parse_dates(df["날짜"])
     cutoff = datetime.now(KST) - timedelta(days=days)
     # timezone-naive 비교를 위해 cutoff를 naive datetime으로
     cutoff_naive = cutoff.replace(tzinfo=None)
-    mask = df["_dt"] >= cutoff_naive
-    result = df[mask].drop(columns=["_dt"]).copy()
+    mask = dates >= cutoff_naive
+    result = df[mask].copy()
 
     # 실제 커버 기간 계산
     if not result.empty:
-        oldest = pd.to_datetime(result["날짜"], errors="coerce").min()
+        oldest = dates[mask].min()
         if pd.notna(oldest):
             days_covered = (datetime.now() - oldest).days + 1
         else:
@@ -341,7 +355,7 @@ def build_message_summary(df: pd.DataFrame) -> str:
 
     # 그룹핑
     df = df.copy()
-    df["_group"] = df["검색키워드"].apply(_group)
+    df["_group"] = df["검색키워드"].astype(str).apply(_group)
     stats = (
         df.groupby("_group")
         .agg(total=("기사제목", "count"), neg=("sentiment", lambda x: (x == "neg").sum()))
@@ -383,7 +397,7 @@ def send_telegram(text: str, bot_token: str, chat_id: str) -> bool:
         return True
     try:
         url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-        resp = requests.post(
+        resp = http_client.post(
             url,
             json={
                 "chat_id": chat_id,
@@ -414,7 +428,7 @@ def main():
         return
 
     df_all = load_news_db()
-    df_yesterday, yesterday_str = get_yesterday_articles(df_all)
+    df_yesterday, yesterday_str = get_yesterday_articles(df_all, use_archive=True)
 
     print(f"[INFO] 브리핑 대상: {yesterday_str} · {len(df_yesterday)}건")
 
@@ -422,8 +436,8 @@ def main():
     df_target = df_yesterday
 
     # 어제 기사가 없으면 최근 7일 기사로 폴백
-    if df_yesterday.empty and not df_all.empty:
-        df_recent, days_covered = get_recent_articles(df_all, days=7)
+    if df_yesterday.empty:
+        df_recent, days_covered = get_recent_articles(df_all, days=7, use_archive=True)
         if not df_recent.empty:
             df_target = df_recent
             fallback_days = days_covered
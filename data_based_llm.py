@@ -6,6 +6,7 @@ import pandas as pd
 import os
 from typing import Dict, List, Any, Optional
 from llm_manager import LLMManager
+from modules import media_registry
 from naver_search import IssueResearchService
 try:
     from enhanced_research_service import EnhancedResearchService
@@ -1536,63 +1537,12 @@ class DataBasedLLM:
         return media_cases.head(limit)
     
     def _normalize_media_name(self, media_name: str) -> str:
-        """언론사명 정규화"""
-        # 공통 접미사/접두사 제거
-        normalized = media_name.strip()
-        
-        # 정규화 규칙들
-        normalization_rules = {
-            '조선일보': ['조선', '조선일보'],
-            '중앙일보': ['중앙', '중앙일보'],
-            '동아일보': ['동아', '동아일보'],
-            '한국경제': ['한경', '한국경제', '한국경제신문'],
-            '매일경제': ['매경', '매일경제', '매일경제신문'],
-            '서울경제': ['서울경제', '서울경제신문'],
-            '연합뉴스': ['연합', '연합뉴스'],
-            '뉴시스': ['뉴시스', 'newsis'],
-            '뉴스1': ['뉴스1', 'news1'],
-            '뉴스핌': ['뉴스핌', 'newspim'],
-            '머니투데이': ['머니투데이', 'mt', '머투'],
-            '이데일리': ['이데일리', 'edaily'],
-            '파이낸셜뉴스': ['파이낸셜뉴스', 'fn', '파이낸셜'],
-            '아시아경제': ['아시아경제', '아경'],
-            '헤럴드경제': ['헤럴드경제', '헤럴드'],
-            '한겨레': ['한겨레', 'hani'],
-            '경향신문': ['경향', '경향신문'],
-            '국민일보': ['국민일보', '국민']
-        }
-        
-        # 역방향 매핑 생성 (별칭 → 정규명)
-        for standard_name, aliases in normalization_rules.items():
-            if normalized.lower() in [alias.lower() for alias in aliases]:
-                return standard_name
-        
-        return normalized
+        """언론사명 정규화 (modules.media_registry 별칭 색인)"""
+        return media_registry.canonical_name(media_name)
     
     def _get_media_aliases(self, media_name: str) -> List[str]:
         """언론사의 모든 별칭 반환"""
-        normalization_rules = {
-            '조선일보': ['조선', '조선일보', 'chosun'],
-            '중앙일보': ['중앙', '중앙일보', 'joongang'],
-            '동아일보': ['동아', '동아일보', 'donga'],
-            '한국경제': ['한경', '한국경제', '한국경제신문', 'hankyung'],
-            '매일경제': ['매경', '매일경제', '매일경제신문', 'mk'],
-            '서울경제': ['서울경제', '서울경제신문', 'sedaily'],
-            '연합뉴스': ['연합', '연합뉴스', 'yonhap'],
-            '뉴시스': ['뉴시스', 'newsis'],
-            '뉴스1': ['뉴스1', 'news1'],
-            '뉴스핌': ['뉴스핌', 'newspim'],
-            '머니투데이': ['머니투데이', 'mt', '머투'],
-            '이데일리': ['이데일리', 'edaily'],
-            '파이낸셜뉴스': ['파이낸셜뉴스', 'fn', '파이낸셜'],
-            '아시아경제': ['아시아경제', '아경'],
-            '헤럴드경제': ['헤럴드경제', '헤럴드'],
-            '한겨레': ['한겨레', 'hani'],
-            '경향신문': ['경향', '경향신문'],
-            '국민일보': ['국민일보', '국민']
-        }
-        
-        return normalization_rules.get(media_name, [media_name])
+        return media_registry.aliases(media_name)
     
     def _multi_column_media_search(self, media_aliases: List[str]) -> pd.DataFrame:
         """다중 컬럼에서 언론사 정보 검색"""
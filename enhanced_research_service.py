@@ -4,12 +4,12 @@
 """
 
 import os
-import requests
 import json
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 from dotenv import load_dotenv
 import re
+from modules import http_client
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 
@@ -113,7 +113,7 @@ class EnhancedResearchService:
             
             response = None
             try:
-                response = requests.get(url, headers=self.naver_headers, params=params, timeout=15)
+                response = http_client.get(url, headers=self.naver_headers, params=params, timeout=15)
                 response.raise_for_status()
 
                 results = []
@@ -155,7 +155,7 @@ class EnhancedResearchService:
             for search_url in search_urls:
                 response = None
                 try:
-                    response = requests.get(search_url, timeout=10, headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
+                    response = http_client.get(search_url, timeout=10, headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
                     if response.status_code == 200:
                         # 간단한 HTML 파싱 (BeautifulSoup 없이)
                         html_content = response.text
@@ -209,7 +209,7 @@ class EnhancedResearchService:
                     
                     response = None
                     try:
-                        response = requests.get(dart_url, timeout=10, headers={'User-Agent': 'Mozilla/5.0'})
+                        response = http_client.get(dart_url, timeout=10, headers={'User-Agent': 'Mozilla/5.0'})
                         if response.status_code == 200:
                             results.append({
                                 "title": f"{keyword} 관련 DART 공시 정보",
@@ -240,7 +240,7 @@ class EnhancedResearchService:
             
             response = None
             try:
-                response = requests.get(krx_url, timeout=10, headers={'User-Agent': 'Mozilla/5.0'})
+                response = http_client.get(krx_url, timeout=10, headers={'User-Agent': 'Mozilla/5.0'})
                 if response.status_code == 200:
                     results.append({
                         "title": "한국거래소 포스코인터내셔널 공시정보",
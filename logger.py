@@ -60,7 +60,8 @@ class MonitoringLogger:
         except Exception as e:
             print(f"[WARNING] 로그 저장 실패: {e}")
 
-    def log_collection(self, keyword: str, count: int, api_calls: int = 1):
+    def log_collection(self, keyword: str, count: int, api_calls: int = 1,
+                       incremental: bool = False):
         """
         뉴스 수집 이벤트 로깅
 
@@ -68,12 +69,16 @@ class MonitoringLogger:
             keyword: 검색 키워드
             count: 수집된 기사 수
             api_calls: API 호출 횟수
+            incremental: 워터마크 기반 증분 수집 여부 (True면 count = 신규 도착 기사 수)
         """
-        self.log_event("collection", {
+        data = {
             "keyword": keyword,
             "articles_collected": count,
             "api_calls": api_calls
-        })
+        }
+        if incremental:
+            data["incremental"] = True
+        self.log_event("collection", data)
 
     def log_telegram(self, success: int, failed: int, total: int):
         """
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+alert_queue.py
+발송 대기 기사의 우선순위 큐 (힙) + 등급별 대기 지연 목표(SLO) 집계.
+
+발송 루프는 pending dict를 '날짜' 문자열로 정렬해 오래된 것부터 보냈다. 1회 발송 상한이 있으면
+방금 나온 포스코인터내셔널 부정 기사가 포스코 긍정 기사 백로그 뒤에서 기다렸다.
+
+  - 순서 키: (감성 등급, 태그 등급, 발행 시각) — 부정 먼저, 그다음 tag_priority(포스코인터 0 > 포스코 1 > 기타 2),
+    같은 등급 안에서는 오래된 기사부터. 날짜를 모르는 기사는 같은 등급의 맨 뒤.
+  - 항목은 __slots__ 객체 (대기열이 수백 건이어도 dict보다 작고 비교가 빠르다)
+  - 등급 이름: "neg/0" ~ "pos/2". LATENCY_TARGETS(초)가 등급별 목표 대기 시간이며
+    환경변수 ALERT_LATENCY_TARGETS="neg/0=60,pos/2=3600" 형식으로 덮어쓴다.
+  - 대기 지연 = 발송(또는 지금) 시각 - 대기열 진입 시각(queued_at, 없으면 발행 시각)
+"""
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+import os
+import time
+
+import pandas as pd
+
+from . import news_schema
+
+LATENCY_TARGETS = {
+    "neg/0": 180, "neg/1": 300, "neg/2": 600,
+    "pos/0": 600, "pos/1": 900, "pos/2": 1800,
+}
+KST = "Asia/Seoul"
+
+
+def _targets_from_env() -> dict:
+    targets = dict(LATENCY_TARGETS)
+    for item in os.getenv("ALERT_LATENCY_TARGETS", "").split(","):
+        name, _, value = item.partition("=")
+        try:
+            targets[name.strip()] = float(value)
+        except ValueError:
+            continue
+    return targets
+
+
+def tier_name(sentiment: str, tier: int) -> str:
+    return f"{'neg' if sentiment == 'neg' else 'pos'}/{tier}"
+
+
+def _published_epoch(date) -> float:
+    """'YYYY-MM-DD HH:MM'(KST) → epoch 초 (모르면 nan)"""
+    ts = news_schema.parse_date(date)
+    if pd.isna(ts):
+        return math.nan
+    if ts.tzinfo is None:
+        ts = ts.tz_localize(KST)
+    return ts.timestamp()
+
+
+class AlertEntry:
+    """대기열 항목 1건 (힙 원소)"""
+    __slots__ = ("rank", "url", "tier", "queued_at")
+
+    def __init__(self, rank: tuple, url: str, tier: str, queued_at: float):
+        self.rank = rank
+        self.url = url
+        self.tier = tier
+        self.queued_at = queued_at
+
+    def __lt__(self, other: "AlertEntry") -> bool:
+        return self.rank < other.rank
+
+
+class AlertQueue:
+    """
+    pending 항목을 우선순위대로 꺼내는 힙. priority_fn(keyword) → 태그 등급(int, 낮을수록 우선).
+
+    record()로 발송 시각을 남기면 report()가 등급별 대기 지연(건수·평균·최대·목표 초과 건수)을 돌려준다.
+    """
+
+    def __init__(self, priority_fn, targets: dict = None):
+        self.priority_fn = priority_fn
+        self.targets = targets if targets is not None else _targets_from_env()
+        self._heap: list = []
+        self._entries: dict = {}    # url → AlertEntry (꺼낸 뒤에도 지연 집계용으로 유지)
+        self._delays: dict = {}     # 등급 → [발송까지 걸린 초, ...]
+        self._seq = itertools.count()
+
+    @classmethod
+    def from_pending(cls, pending_queue: dict, priority_fn, targets: dict = None) -> "AlertQueue":
+        queue = cls(priority_fn, targets)
+        for url, article in pending_queue.items():
+            queue._add(url, article)
+        heapq.heapify(queue._heap)
+        return queue
+
+    def _add(self, url: str, article: dict) -> AlertEntry:
+        sentiment = article.get("sentiment", "pos")
+        tier = int(self.priority_fn(article.get("keyword", "")))
+        published = _published_epoch(article.get("date", ""))
+        queued_at = article.get("queued_at") or published
+        rank = (0 if sentiment == "neg" else 1, tier,
+                math.inf if math.isnan(published) else published, next(self._seq))
+        entry = AlertEntry(rank, url, tier_name(sentiment, tier),
+                           time.time() if queued_at is None or math.isnan(queued_at) else float(queued_at))
+        self._entries[url] = entry
+        self._heap.append(entry)
+        return entry
+
+    def push(self, url: str, article: dict):
+        heapq.heappush(self._heap, self._add(url, article))
+
+    def pop(self) -> str:
+        """가장 급한 항목의 url"""
+        return heapq.heappop(self._heap).url
+
+    def __iter__(self):
+        """우선순위 순서로 꺼내며 순회 (순회한 항목은 힙에서 빠짐)"""
+        while self._heap:
+            yield self.pop()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def tier_of(self, url: str):
+        entry = self._entries.get(url)
+        return entry.tier if entry else None
+
+    def record(self, url: str, sent_at: float = None):
+        """url 발송 완료 — 대기 지연 기록"""
+        entry = self._entries.get(url)
+        if entry is None:
+            return
+        sent_at = time.time() if sent_at is None else sent_at
+        self._delays.setdefault(entry.tier, []).append(max(0.0, sent_at - entry.queued_at))
+
+    def report(self, now: float = None, waiting=()) -> dict:
+        """
+        {등급: {sent, mean, max, target, breached, waiting, oldest_wait}}
+        waiting: 아직 발송되지 않은 url 목록 (현재까지의 대기 시간으로 집계)
+        """
+        now = time.time() if now is None else now
+        out: dict = {}
+        for tier, delays in self._delays.items():
+            target = self.targets.get(tier)
+            out[tier] = {
+                "sent": len(delays),
+                "mean": sum(delays) / len(delays),
+                "max": max(delays),
+                "target": target,
+                "breached": sum(1 for d in delays if target is not None and d > target),
+                "waiting": 0,
+                "oldest_wait": 0.0,
+            }
+        for url in waiting:
+            entry = self._entries.get(url)
+            if entry is None:
+                continue
+            row = out.setdefault(entry.tier, {"sent": 0, "mean": 0.0, "max": 0.0,
+                                              "target": self.targets.get(entry.tier), "breached": 0,
+                                              "waiting": 0, "oldest_wait": 0.0})
+            row["waiting"] += 1
+            row["oldest_wait"] = max(row["oldest_wait"], now - entry.queued_at)
+        return dict(sorted(out.items()))
+
+    def log_report(self, waiting=()):
+        for tier, row in self.report(waiting=waiting).items():
+            target = row["target"]
+            line = f"[DEBUG] ⏱️ 대기 지연 {tier}: 발송 {row['sent']}건"
+            if row["sent"]:
+                line += f" 평균 {row['mean']:.0f}초 최대 {row['max']:.0f}초"
+            if row["waiting"]:
+                line += f", 대기 {row['waiting']}건(최장 {row['oldest_wait']:.0f}초)"
+            if target is not None:
+                line += f" (목표 {target:.0f}초)"
+            print(line)
+            late = row["breached"] + (1 if target is not None and row["oldest_wait"] > target else 0)
+            if target is not None and late:
+                print(f"[WARNING] 대기 지연 목표 초과 {tier}: 발송 {row['breached']}건"
+                      + (f", 미발송 최장 {row['oldest_wait']:.0f}초" if row["oldest_wait"] > target else ""))
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""
+article_index.py
+저장된 기사의 식별자 인덱스 (정규화 URL + 제목|날짜 해시).
+
+detect_new_articles는 매 라운드 기존 DB를 iterrows로 돌며 URL·정규화 URL·해시 세트를
+다시 만들고, 신규 행도 행 단위로 정규화·해시했다. 이 인덱스는 save_news_db가 저장하는
+행만 증분으로 추가하고(append-only TSV), 감지는 컬럼 단위 집합 멤버십으로 끝낸다.
+
+  - 파일: data/article_index.tsv  (epoch \\t 정규화URL \\t 해시) — DB에서 재생성 가능한 파생 캐시라 git 제외
+  - 만료: INDEX_TTL_DAYS 지난 항목은 로드 시 제외, 죽은 줄이 절반을 넘으면 압축 재작성
+  - 정규화는 fingerprint_set.canonical_url 하나를 공유 (news_collector._normalize_url도 같은 함수),
+    해시 규칙은 news_collector._generate_article_hash 와 동일
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+
+import pandas as pd
+
+from .fingerprint_set import canonical_url
+
+INDEX_FILE = os.path.join("data", "article_index.tsv")
+INDEX_TTL_DAYS = 30
+
+
+def canonical_urls(urls: pd.Series) -> pd.Series:
+    """URL 컬럼 일괄 정규화 (canonical_url 규칙 그대로, 고유값마다 1회 계산)"""
+    s = urls.fillna("").astype(str)
+    return s.map({u: canonical_url(u) for u in s.unique()})
+
+
+def content_hashes(titles: pd.Series, dates: pd.Series) -> pd.Series:
+    """제목|날짜 해시 컬럼 (_generate_article_hash 와 같은 md5 앞 16자리)"""
+    combined = titles.astype(str) + "|" + dates.astype(str)
+    return pd.Series(
+        [hashlib.md5(c.strip().encode("utf-8")).hexdigest()[:16] for c in combined],
+        index=titles.index, dtype=object,
+    )
+
+
+class ArticleIndex:
+    """정규화 URL / 콘텐츠 해시 집합 (파일 백업, 증분 추가)"""
+
+    def __init__(self, path: str = INDEX_FILE):
+        self.path = path
+        self.urls: set = set()
+        self.hashes: set = set()
+        self._lock = threading.Lock()
+        self._lines = 0
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    def _load(self):
+        cutoff = time.time() - INDEX_TTL_DAYS * 86400
+        live = []
+        try:
+            if not os.path.exists(self.path):
+                return
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    self._lines += 1
+                    parts = line.rstrip("\n").split("\t")
+                    if len(parts) != 3:
+                        continue
+                    try:
+                        if float(parts[0]) < cutoff:
+                            continue
+                    except ValueError:
+                        continue
+                    if parts[1] in self.urls:
+                        continue
+                    self.urls.add(parts[1])
+                    if parts[2]:
+                        self.hashes.add(parts[2])
+                    live.append(line if line.endswith("\n") else line + "\n")
+            if self._lines > 2 * max(len(live), 1):
+                self._rewrite(live)
+        except Exception as e:
+            print(f"[WARNING] 기사 인덱스 로드 실패: {e}")
+
+    def _rewrite(self, lines: list):
+        folder = os.path.dirname(self.path) or "."
+        fd, tmp = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.writelines(lines)
+            os.replace(tmp, self.path)
+            self._lines = len(lines)
+        except Exception:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def add_frame(self, df: pd.DataFrame) -> int:
+        """DataFrame(URL·기사제목·날짜) 중 인덱스에 없는 행만 추가하고 추가 건수 반환"""
+        if df is None or df.empty or "URL" not in df.columns:
+            return 0
+        canon = canonical_urls(df["URL"])
+        with self._lock:
+            fresh = canon.ne("") & canon.ne("nan") & ~canon.map(self.urls.__contains__)
+            fresh &= ~canon.duplicated()
+            if not fresh.any():
+                return 0
+            sub = df.loc[fresh]
+            hashes = content_hashes(sub["기사제목"].astype(str).str.strip(),
+                                    sub["날짜"].astype(str).str.strip())
+            now = int(time.time())
+            lines = [f"{now}\t{u}\t{h}\n" for u, h in zip(canon[fresh], hashes)]
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.writelines(lines)
+                self._lines += len(lines)
+            except Exception as e:
+                print(f"[WARNING] 기사 인덱스 저장 실패: {e}")
+            self.urls.update(canon[fresh])
+            self.hashes.update(hashes)
+            return len(lines)
+
+
+_index: ArticleIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_index() -> ArticleIndex:
+    """프로세스 공유 인덱스 (최초 호출 시 로드)"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = ArticleIndex()
+    return _index
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+file_lock.py
+프로세스 간 배타 파일 락 (fcntl). Streamlit 백그라운드 스레드와 Actions 프로세스가
+같은 data/ 파일을 갱신할 때 읽기-수정-쓰기 구간을 직렬화한다.
+Windows 등 fcntl 미지원 환경에서는 락 없이 진행한다.
+"""
+from __future__ import annotations
+
+
+class FileLock:
+    """with FileLock("data/x.lock"): ... — 배타 락 (블로킹)"""
+
+    def __init__(self, path: str):
+        self._path = path
+        self._fd = None
+
+    def __enter__(self):
+        try:
+            import fcntl
+            self._fd = open(self._path, "w")
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        except (ImportError, OSError):
+            pass
+        return self
+
+    def __exit__(self, *exc):
+        if self._fd is not None:
+            try:
+                import fcntl
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            except (ImportError, OSError):
+                pass
+            self._fd.close()
+            self._fd = None
+        return False
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""
+http_client.py
+모든 외부 HTTP 호출(네이버·구글 RSS·텔레그램·OpenAI·GitHub 등)이 공유하는 커넥션 풀 클라이언트.
+
+  - keep-alive 커넥션 풀: 프로세스 전체가 requests.Session 하나를 공유 → 호출마다
+    TCP+TLS 핸드셰이크를 새로 하지 않는다 (3분 루프에서 라운드마다 수십 회 절감).
+  - 일관된 타임아웃: 호출부가 timeout을 주지 않으면 DEFAULT_TIMEOUT 적용 (무한 대기 차단).
+  - 일관된 재시도: 연결 실패 + 게이트웨이 오류(502/503/504)만 짧게 재시도.
+    429는 재시도하지 않는다 — 네이버는 할당량 초과, 텔레그램은 retry_after라 호출부가 판단.
+  - 호스트별 동시성 상한 / 초당 호출 상한: 병렬 수집에서도 특정 호스트에 몰리지 않게 제한.
+  - 요청 훅: 응답마다 등록된 훅을 호출 (quota_ledger가 실제 네이버 호출 수를 센다).
+
+사용법:
+    from modules import http_client
+    r = http_client.get(url, params=..., timeout=10)
+예외 타입은 requests와 동일(requests.exceptions.*)하므로 기존 except 절을 그대로 쓴다.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+import urllib.parse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_TIMEOUT = (3, 10)  # (connect, read)
+POOL_CONNECTIONS = 16      # 풀을 유지할 호스트 수
+POOL_MAXSIZE = 16          # 호스트당 유지 커넥션 수
+
+# 호스트별 동시 요청 상한 (없으면 DEFAULT_HOST_LIMIT)
+DEFAULT_HOST_LIMIT = 8
+HOST_LIMITS = {
+    "openapi.naver.com": int(os.getenv("NAVER_MAX_CONCURRENCY", "4")),
+    "api.telegram.org": 4,
+    "api.openai.com": 4,
+    "news.google.com": 2,
+    "api.github.com": 2,
+}
+
+# 호스트별 초당 호출 상한 (네이버 검색 API 초당 한도 10회보다 낮게 유지해 429 오판 방지)
+HOST_RATES = {
+    "openapi.naver.com": float(os.getenv("NAVER_RATE_PER_SEC", "8")),
+}
+
+
+class RateLimiter:
+    """스레드 안전 최소 간격 레이트 리미터 (호출 간격을 1/rate초 이상으로 벌린다)"""
+
+    def __init__(self, rate_per_sec: float):
+        self._interval = 1.0 / rate_per_sec if rate_per_sec > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_at - now
+            self._next_at = max(now, self._next_at) + self._interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+_lock = threading.Lock()
+_session: requests.Session | None = None
+_host_slots: dict[str, threading.BoundedSemaphore] = {}
+_host_limiters: dict[str, RateLimiter] = {}
+_request_hooks: list = []
+
+
+def _build_session() -> requests.Session:
+    retry = Retry(
+        total=2,
+        connect=2,
+        read=0,                      # 읽기 타임아웃은 재시도하지 않음 (POST 중복 전송 방지)
+        status=2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        backoff_factor=0.5,
+        raise_on_status=False,
+        respect_retry_after_header=False,
+    )
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE,
+                          max_retries=retry)
+    s = requests.Session()
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+
+def get_session() -> requests.Session:
+    """프로세스 공유 세션 (최초 호출 시 생성)"""
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def _host_of(url: str) -> str:
+    try:
+        return urllib.parse.urlsplit(url).hostname or ""
+    except Exception:
+        return ""
+
+
+def _slot(host: str) -> threading.BoundedSemaphore:
+    sem = _host_slots.get(host)
+    if sem is None:
+        with _lock:
+            sem = _host_slots.get(host)
+            if sem is None:
+                sem = threading.BoundedSemaphore(max(1, HOST_LIMITS.get(host, DEFAULT_HOST_LIMIT)))
+                _host_slots[host] = sem
+    return sem
+
+
+def _limiter(host: str) -> RateLimiter | None:
+    if host not in HOST_RATES:
+        return None
+    lim = _host_limiters.get(host)
+    if lim is None:
+        with _lock:
+            lim = _host_limiters.get(host)
+            if lim is None:
+                lim = RateLimiter(HOST_RATES[host])
+                _host_limiters[host] = lim
+    return lim
+
+
+def add_request_hook(hook):
+    """응답 수신 후 호출될 훅 등록: hook(method, url, response). (예: quota_ledger 호출 카운트)"""
+    if hook not in _request_hooks:
+        _request_hooks.append(hook)
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    """공유 풀로 HTTP 요청 (호스트 동시성·초당 호출 상한 적용)"""
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    host = _host_of(url)
+    limiter = _limiter(host)
+    with _slot(host):
+        if limiter is not None:
+            limiter.acquire()
+        response = get_session().request(method, url, **kwargs)
+    for hook in _request_hooks:
+        try:
+            hook(method, url, response)
+        except Exception as e:
+            print(f"[WARNING] HTTP 요청 훅 실패: {e}")
+    return response
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    return request("POST", url, **kwargs)
+
+
+def put(url: str, **kwargs) -> requests.Response:
+    return request("PUT", url, **kwargs)
+
+
+def patch(url: str, **kwargs) -> requests.Response:
+    return request("PATCH", url, **kwargs)
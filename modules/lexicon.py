@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+lexicon.py
+여러 키워드 사전을 한 번에 찾는 컴파일된 다중 패턴 매처.
+
+규칙 기반 감성 분석(부정·긍정 약 100개)과 키워드 필터(제외어·부동산어·키워드 토큰)는
+용어마다 `kw in text` 부분 문자열 검색을 따로 돌렸다. 여기서는 import 시 모든 용어를
+문자 트라이(trie) 형태의 정규식 하나로 컴파일해 텍스트를 한 번 훑어 전부 찾는다.
+
+  - 트라이 정규식: 공통 접두사를 묶은 (?:포스코(?:인터(?:내셔널)?)?|...) 형태 — 위치마다 분기 1회
+  - 겹치는 용어: 매치 시작 다음 글자부터 다시 검색하므로 '중대재해' 안의 '재해'도 잡히고,
+    같은 위치에서 시작하는 더 짧은 용어('포스코인터내셔널' → '포스코인터', '포스코')는 접두사 표로 보충
+  - 대소문자 무시 (casefold) — 'EOD', 'POSCO INTERNATIONAL' 등 영문 용어
+  - 결과는 용어 집합. 용어 → 그룹(neg/pos/exclude/...) 표로 그룹별 적중을 계산한다.
+  - 컬럼 필터(flags): 그룹마다 용어 교대(alternation) 정규식을 따로 컴파일해 두고
+    Series.str.contains로 컬럼 전체를 한 번에 판정 (행 단위 파이썬 루프 없음).
+    case_sensitive로 지정한 그룹은 flags에서 대소문자를 구분한다 (기존 필터의 `ex in title` 동작 유지).
+"""
+from __future__ import annotations
+
+import re
+
+import pandas as pd
+
+
+def _trie_pattern(terms) -> str:
+    """용어 목록 → 공통 접두사를 묶은 정규식 (같은 위치에서는 가장 긴 용어가 매치)"""
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        alts = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class Lexicon:
+    """그룹별 용어 사전 {그룹: [용어, ...]} 을 하나의 매처로 컴파일"""
+
+    def __init__(self, groups: dict, case_sensitive=()):
+        self.groups: dict = {}   # 용어(casefold) → 속한 그룹 집합
+        for group, terms in groups.items():
+            for term in terms:
+                key = str(term).strip().casefold()
+                if key:
+                    self.groups.setdefault(key, set()).add(group)
+        self.group_names = list(groups)
+        self._group_patterns: dict = {}   # 그룹 → flags용 정규식 (용어가 없는 그룹은 None)
+        for group, terms in groups.items():
+            keep = sorted({str(t).strip() for t in terms if str(t).strip()}, key=len, reverse=True)
+            flags = 0 if group in case_sensitive else re.IGNORECASE
+            self._group_patterns[group] = re.compile(_trie_pattern(keep), flags) if keep else None
+        terms = sorted(self.groups, key=len, reverse=True)
+        self._prefixes = {t: [s for s in terms if s != t and t.startswith(s)] for t in terms}
+        self._search = re.compile(_trie_pattern(terms)).search if terms else None
+
+    def terms(self, text) -> set:
+        """텍스트에 등장하는 모든 용어 (casefold 형태) — 1회 훑기"""
+        found = set()
+        if self._search is None or not text:
+            return found
+        text = str(text).casefold()
+        pos = 0
+        while True:
+            m = self._search(text, pos)
+            if m is None:
+                return found
+            term = m.group()
+            found.add(term)
+            found.update(self._prefixes[term])
+            pos = m.start() + 1
+
+    def hits(self, text) -> dict:
+        """{그룹: 적중 용어 집합} (적중 없는 그룹은 생략)"""
+        out: dict = {}
+        for term in self.terms(text):
+            for group in self.groups[term]:
+                out.setdefault(group, set()).add(term)
+        return out
+
+    def flags(self, texts: pd.Series, groups=None) -> pd.DataFrame:
+        """텍스트 컬럼 → 그룹별 포함 여부 bool 컬럼 (행 인덱스 유지, 그룹당 str.contains 1회)"""
+        groups = list(groups) if groups is not None else self.group_names
+        texts = texts.fillna("").astype(str)
+        out = {}
+        for group in groups:
+            pattern = self._group_patterns.get(group)
+            out[group] = (texts.str.contains(pattern, regex=True) if pattern is not None
+                          else pd.Series(False, index=texts.index))
+        return pd.DataFrame(out, index=texts.index, columns=groups, dtype=bool)
+
+    def __contains__(self, term) -> bool:
+        return str(term).strip().casefold() in self.groups
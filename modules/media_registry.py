@@ -0,0 +1,458 @@
+# -*- coding: utf-8 -*-
+"""
+media_registry.py
+URL → 매체명 해석과 매체명 별칭을 한곳에서 관리하는 매체 레지스트리.
+
+news_collector·streamlit_app의 _publisher_from_link, media_utils.DOMAIN_TO_MEDIA,
+DataBasedLLM의 별칭 규칙이 각자 다른 표를 들고 있어 같은 URL·매체가 화면·DB·알림마다 다르게
+나왔고, _publisher_from_link는 호출마다 사전 리터럴과 eTLD 집합을 새로 만들었다.
+
+  - 호스트 접미사 트라이: 도메인을 라벨 역순(kr → co → yna → en)으로 import 시 1회 컴파일,
+    가장 긴 접미사 매치를 사용 (en.yna.co.kr·it.chosun.com 같은 서브도메인 매핑이 우선)
+  - 해석 결과는 호스트 단위 LRU 캐시
+  - 별칭 색인: 별칭(소문자) → 정식 매체명, 정식 매체명 → 별칭 목록 (양방향)
+"""
+from __future__ import annotations
+
+import urllib.parse
+from functools import lru_cache
+
+import pandas as pd
+
+# 서브도메인 자체가 매체인 호스트 (기본 도메인 매핑보다 우선)
+HOST_MEDIA = {
+    "en.yna.co.kr": "연합뉴스",
+    "news.kbs.co.kr": "KBS",
+    "news.mtn.co.kr": "MTN",
+    "starin.edaily.co.kr": "이데일리",
+    "sports.donga.com": "동아일보",
+    "biz.heraldcorp.com": "헤럴드경제",
+    "daily.hankooki.com": "데일리한국",
+    "news.dealsitetv.com": "딜사이트TV",
+    "news.naver.com": "네이버뉴스",
+}
+
+# 기본 도메인(eTLD+1) → 매체명
+BASE_MEDIA = {
+    # 주요 종합지 / 방송
+    "chosun.com": "조선일보",
+    "donga.com": "동아일보",
+    "joongang.co.kr": "중앙일보",
+    "joins.com": "중앙일보",
+    "hani.co.kr": "한겨레",
+    "khan.co.kr": "경향신문",
+    "mk.co.kr": "매일경제",
+    "fnnews.com": "파이낸셜뉴스",
+    "hankyung.com": "한국경제",
+    "kmib.co.kr": "국민일보",
+    "seoul.co.kr": "서울신문",
+    "segye.com": "세계일보",
+    "naeil.com": "내일신문",
+    "imaeil.com": "매일신문",
+    "nongmin.com": "농민신문",
+    "yeongnam.com": "영남일보",
+    "kwnews.co.kr": "강원일보",
+    "kado.net": "강원도민일보",
+    "kihoilbo.co.kr": "기호일보",
+    "ksmnews.co.kr": "경상매일신문",
+    "kbmaeil.com": "경북매일",
+    "idaegu.co.kr": "IDN대구신문",
+    "hidomin.com": "하이도민",
+    "incheonilbo.com": "인천일보",
+    "incheonnews.com": "인천뉴스",
+    "ggilbo.com": "금강일보",
+    "joongdo.co.kr": "중도일보",
+    "dnews.co.kr": "대한경제",
+    "jeonmae.co.kr": "전국매일신문",
+
+    # 방송사
+    "kbs.co.kr": "KBS",
+    "mbc.co.kr": "MBC",
+    "sbs.co.kr": "SBS",
+    "ytn.co.kr": "YTN",
+    "yonhapnewstv.co.kr": "연합뉴스TV",
+    "ifm.kr": "경인방송",
+    "kbsm.net": "KBS부산·경남",
+    "spotvnews.co.kr": "스포TV",
+
+    # 통신사
+    "yna.co.kr": "연합뉴스",
+    "news1.kr": "뉴스1",
+    "newsis.com": "뉴시스",
+    "nocutnews.co.kr": "노컷뉴스",
+    "newspim.com": "뉴스핌",
+
+    # 경제 / 금융
+    "asiae.co.kr": "아시아경제",
+    "heraldcorp.com": "헤럴드경제",
+    "herald.co.kr": "헤럴드경제",
+    "sedaily.com": "서울경제",
+    "etoday.co.kr": "이투데이",
+    "edaily.co.kr": "이데일리",
+    "bizwatch.co.kr": "비즈워치",
+    "businesspost.co.kr": "비즈니스포스트",
+    "businesskorea.co.kr": "비즈니스코리아",
+    "finomy.com": "현대경제신문",
+    "econovill.com": "이코노빌",
+    "econonews.co.kr": "이코노뉴스",
+    "ezyeconomy.com": "이지경제",
+    "queen.co.kr": "이코노미퀸",
+    "widedaily.com": "와이드경제",
+    "goodkyung.com": "굿모닝경제",
+    "smartfn.co.kr": "스마트경제",
+    "megaeconomy.co.kr": "메가경제",
+    "pointe.co.kr": "포인트경제",
+    "pointdaily.co.kr": "포인트데일리",
+    "marketnews.co.kr": "마켓뉴스",
+    "womaneconomy.co.kr": "여성경제신문",
+
+    # 조선 계열
+    "chosunbiz.com": "조선비즈",
+    "investchosun.com": "인베스트조선",
+    "futurechosun.com": "더나은미래",
+    "it.chosun.com": "IT조선",
+    "dizzo.com": "디지틀조선일보",
+    "economist.co.kr": "이코노미스트",
+
+    # IT / 테크
+    "zdnet.co.kr": "지디넷코리아",
+    "ddaily.co.kr": "디지털데일리",
+    "bloter.net": "블로터",
+    "digitaltoday.co.kr": "디지털투데이",
+    "thelec.kr": "더일렉",
+    "theguru.co.kr": "더구루",
+    "techholic.co.kr": "테크홀릭",
+    "e-science.co.kr": "e사이언스",
+    "e-platform.net": "e플랫폼",
+    "irobotnews.com": "로봇신문사",
+    "koit.co.kr": "정보통신신문",
+
+    # 정치 / 시사
+    "polinews.co.kr": "폴리뉴스",
+    "sisajournal.com": "시사저널",
+    "sisajournal-e.com": "시사저널e",
+    "sisaweek.com": "시사위크",
+    "sisaon.co.kr": "시사ON",
+    "sisafocus.co.kr": "시사포커스",
+    "sisacast.kr": "시사캐스트",
+    "sateconomy.co.kr": "시사경제",
+    "straightnews.co.kr": "스트레이트뉴스",
+    "thepublic.kr": "더퍼블릭",
+    "mediapen.com": "미디어펜",
+    "newdaily.co.kr": "뉴데일리",
+    "breaknews.com": "브레이크뉴스",
+
+    # 온라인 / 기타
+    "wikitree.co.kr": "위키트리",
+    "insight.co.kr": "인사이트",
+    "insightkorea.co.kr": "인사이트코리아",
+    "newstapa.org": "뉴스타파",
+    "tf.co.kr": "더팩트",
+    "newsway.co.kr": "뉴스웨이",
+    "newspost.kr": "뉴스포스트",
+    "newswatch.kr": "뉴스워치",
+    "newsprime.co.kr": "뉴스프라임",
+    "newsinside.kr": "뉴스인사이드",
+    "news2day.co.kr": "뉴스2데이",
+    "newsquest.co.kr": "뉴스퀘스트",
+    "newsworker.co.kr": "뉴스워커",
+    "newsdream.kr": "뉴스드림",
+    "newsbrite.net": "뉴스브라이트",
+    "newsmaker.or.kr": "뉴스메이커",
+
+    # 산업 / 에너지
+    "ekn.kr": "에너지경제",
+    "energy-news.co.kr": "에너지뉴스",
+    "energydaily.co.kr": "에너지데일리",
+    "todayenergy.kr": "투데이에너지",
+    "gasnews.com": "가스신문",
+    "epj.co.kr": "일렉트릭파워",
+    "amenews.kr": "신소재경제신문",
+    "ferrotimes.com": "철강금속신문",
+
+    # 스포츠 / 엔터
+    "sportsseoul.com": "스포츠서울",
+    "xportsnews.com": "엑스포츠뉴스",
+    "starnewskorea.com": "스타뉴스",
+    "topstarnews.net": "탑스타뉴스",
+    "isplus.com": "일간스포츠",
+    "swtvnews.com": "스포츠W",
+
+    # 종교 / 특수
+    "bbsi.co.kr": "불교방송",
+    "bzeronews.com": "불교공뉴스",
+
+    # 기타
+    "kpinews.kr": "KPI뉴스",
+    "nbnews.kr": "NBN뉴스",
+    "nbntv.co.kr": "NBN뉴스",
+    "dkilbo.com": "대경일보",
+    "asiatime.co.kr": "아시아타임즈",
+    "kukinews.com": "쿠키뉴스",
+    "wikileaks-kr.org": "위키리크스한국",
+    "thepowernews.co.kr": "더파워",
+    "shinailbo.co.kr": "신아일보",
+    "pinpointnews.co.kr": "핀포인트뉴스",
+    "newsworks.co.kr": "뉴스웍스",
+    "newstomato.com": "뉴스토마토",
+    "munhwa.com": "문화일보",
+    "mt.co.kr": "머니투데이",
+    "metroseoul.co.kr": "메트로서울",
+    "m-i.kr": "매일일보",
+    "lawissue.co.kr": "법률저널",
+    "joongangenews.com": "중앙이코노미뉴스",
+    "hellot.net": "헬로티",
+    "enewstoday.co.kr": "이뉴스투데이",
+    "dt.co.kr": "디지털타임스",
+    "bokuennews.com": "복지뉴스",
+    "snmnews.com": "철강금속신문",
+    "whitepaper.co.kr": "화이트페이퍼",
+    "theviewers.co.kr": "더뷰어스",
+    "thevaluenews.co.kr": "더밸류뉴스",
+    "thebigdata.co.kr": "더빅데이터",
+    "stardailynews.co.kr": "스타데일리뉴스",
+    "smedaily.co.kr": "중소기업신문",
+    "smarttoday.co.kr": "스마트투데이",
+    "pressian.com": "프레시안",
+    "ntoday.co.kr": "엔투데이",
+    "nspna.com": "NSP통신",
+    "moneys.co.kr": "머니S",
+    "klnews.co.kr": "물류신문",
+    "job-post.co.kr": "잡포스트",
+    "ilyosisa.co.kr": "일요시사",
+    "greened.kr": "녹색경제신문",
+    "globalepic.co.kr": "글로벌이코노믹",
+    "electimes.com": "전기신문",
+    "einfomax.co.kr": "연합인포맥스",
+    "dealsite.co.kr": "딜사이트",
+    "dailycar.co.kr": "데일리카",
+    "cnbnews.com": "CNB뉴스",
+    "ceoscoredaily.com": "CEO스코어데일리",
+    "autodaily.co.kr": "오토데일리",
+    "weeklytoday.com": "위클리투데이",
+    "viva100.com": "브릿지경제",
+    "veritas-a.com": "베리타스알파",
+    "thetracker.co.kr": "더트래커",
+    "sportschosun.com": "스포츠조선",
+    "seoulfn.com": "서울파이낸스",
+    "nextdaily.co.kr": "넥스트데일리",
+    "newscj.com": "천지일보",
+    "newscape.co.kr": "뉴스스케이프",
+    "mhj21.com": "문화저널21",
+    "kpenews.com": "KPE",
+    "iminju.net": "경기민주언론시민연합",
+    "ilyoseoul.co.kr": "일요서울",
+    "ibabynews.com": "베이비뉴스",
+    "hansbiz.co.kr": "한스경제",
+    "gukjenews.com": "국제뉴스",
+    "ftoday.co.kr": "퓨쳐데일리",
+    "financialpost.co.kr": "파이낸셜포스트",
+    "fetv.co.kr": "FETV",
+    "etnews.com": "전자신문",
+    "dailian.co.kr": "데일리안",
+    "cstimes.com": "컨슈머타임스",
+    "bizwork.co.kr": "비즈웍스",
+    "betanews.net": "베타뉴스",
+    "banronbodo.com": "반론보도닷컴",
+    "topdaily.kr": "톱데일리",
+    "thebell.co.kr": "더벨",
+    "the-pr.co.kr": "더피알",
+    "stoo.com": "스포츠투데이",
+    "sportsworldi.com": "스포츠월드",
+    "seoulwire.com": "서울와이어",
+    "press9.kr": "프레스나인",
+    "newstown.co.kr": "뉴스타운",
+    "mhnse.com": "MHN스포츠(경제)",
+    "koreastocknews.com": "코리아스탁뉴스",
+    "fntimes.com": "파이낸셜뉴스타임즈",
+    "choicenews.co.kr": "초이스경제",
+    "asiatoday.co.kr": "아시아투데이",
+
+    # 수집 모듈(news_collector)에서 추가된 매체 (2025-11 ~ 2026-02)
+    "ajunews.com": "아주경제",
+    "hankooki.com": "한국일보",
+    "safetynews.co.kr": "안전신문",
+    "rpm9.com": "RPM9",
+    "gpkorea.com": "글로벌오토뉴스",
+    "newslock.co.kr": "뉴스락",
+    "mbn.co.kr": "MBN",
+    "koreatimes.co.kr": "코리아타임스",
+    "korea.kr": "대한민국 정책브리핑",
+    "goodnews1.com": "GOODTV",
+    "aitimes.kr": "AI타임스",
+    "worklaw.co.kr": "워크로",
+    "vop.co.kr": "민중의소리",
+    "thefairnews.co.kr": "더페어뉴스",
+    "newsfreezone.co.kr": "뉴스프리존",
+    "mtn.co.kr": "머니투데이방송",
+    "kyongbuk.co.kr": "경북일보",
+    "geconomy.co.kr": "G경제",
+    "enetnews.co.kr": "이넷뉴스",
+    "dailysportshankook.co.kr": "데일리스포츠한국",
+    "dailysecu.com": "데일리시큐",
+    "apparelnews.co.kr": "어패럴뉴스",
+    "suwonilbo.kr": "수원일보",
+    "newswhoplus.com": "뉴스후플러스",
+    "mdtoday.co.kr": "메디컬투데이",
+    "jeonmin.co.kr": "전민일보",
+    "economytalk.kr": "이코노미톡뉴스",
+    "delighti.co.kr": "딜라이트이슈",
+    "businessplus.kr": "비즈니스플러스",
+    "bizwnews.com": "비즈월드뉴스",
+    "wemakenews.co.kr": "위메이크뉴스",
+    "tournews21.com": "투어코리아",
+    "siminilbo.co.kr": "시민일보",
+    "public25.com": "퍼블릭타임스",
+    "ngetnews.com": "뉴스저널리즘",
+    "livesnews.com": "라이브뉴스",
+    "lawleader.co.kr": "로리더",
+    "koreaittimes.com": "코리아IT타임즈",
+    "kmaeil.com": "경인매일",
+    "discoverynews.kr": "디스커버리뉴스",
+    "ccdailynews.com": "충청일보",
+    "tinnews.co.kr": "틴뉴스",
+
+    # 네이버 검색 모듈(media_utils) 매핑
+    "ohmynews.com": "오마이뉴스",
+    "hankookilbo.com": "한국일보",
+    "yonhapnews.co.kr": "연합뉴스",
+    "inews24.com": "아이뉴스24",
+    "itbiz.co.kr": "IT비즈뉴스",
+    "bizhankook.com": "비즈한국",
+    "ebn.co.kr": "EBN",
+    "steelguru.com": "SteelGuru",
+    "posri.re.kr": "포스코경영연구원",
+    "steel-n.com": "스틸앤",
+    "kbi.re.kr": "한국철강협회",
+    "koreaherald.com": "Korea Herald",
+    "jtbc.co.kr": "JTBC",
+    "tvchosun.com": "TV조선",
+}
+
+# 정식 매체명 → 별칭 (언론대응 이력 검색용; 매체명 자체와 도메인 표기 포함)
+ALIASES = {
+    "조선일보": ["조선", "조선일보", "chosun"],
+    "중앙일보": ["중앙", "중앙일보", "joongang"],
+    "동아일보": ["동아", "동아일보", "donga"],
+    "한국경제": ["한경", "한국경제", "한국경제신문", "hankyung"],
+    "매일경제": ["매경", "매일경제", "매일경제신문", "mk"],
+    "서울경제": ["서울경제", "서울경제신문", "sedaily"],
+    "연합뉴스": ["연합", "연합뉴스", "yonhap"],
+    "뉴시스": ["뉴시스", "newsis"],
+    "뉴스1": ["뉴스1", "news1"],
+    "뉴스핌": ["뉴스핌", "newspim"],
+    "머니투데이": ["머니투데이", "mt", "머투"],
+    "이데일리": ["이데일리", "edaily"],
+    "파이낸셜뉴스": ["파이낸셜뉴스", "fn", "파이낸셜"],
+    "아시아경제": ["아시아경제", "아경"],
+    "헤럴드경제": ["헤럴드경제", "헤럴드"],
+    "한겨레": ["한겨레", "hani"],
+    "경향신문": ["경향", "경향신문"],
+    "국민일보": ["국민일보", "국민"],
+    # 표기가 갈렸던 매체 (이전 매핑의 다른 이름)
+    "비즈니스코리아": ["비즈니스코리아", "Business Korea"],
+    "코리아타임스": ["코리아타임스", "Korea Times"],
+    "KPE": ["KPE", "한국정치경제신문"],
+    "중소기업신문": ["중소기업신문", "SME데일리"],
+    "지디넷코리아": ["지디넷코리아", "ZDNet Korea"],
+}
+
+# 한국형 2단계 도메인 (*.co.kr 등) — 기본 도메인 추출용
+_KR_SECOND_LEVEL = frozenset({
+    "co", "or", "go", "ne", "re", "pe", "ac", "hs", "kg", "sc",
+    "seoul", "busan", "incheon", "daegu", "daejeon", "gwangju", "ulsan",
+    "gyeonggi", "gangwon", "chungbuk", "chungnam", "jeonbuk", "jeonnam",
+    "gyeongbuk", "gyeongnam", "jeju",
+})
+
+
+def _compile_trie(*tables) -> dict:
+    """도메인 표 → 라벨 역순 트라이 ({라벨: 자식}, 매체명은 "" 키). 앞 표가 우선."""
+    trie: dict = {}
+    for table in reversed(tables):
+        for domain, name in table.items():
+            node = trie
+            for label in reversed(domain.lower().split(".")):
+                node = node.setdefault(label, {})
+            node[""] = name
+    return trie
+
+
+_TRIE = _compile_trie(HOST_MEDIA, BASE_MEDIA)
+
+
+def _build_alias_index() -> dict:
+    index: dict = {}
+    for name in set(HOST_MEDIA.values()) | set(BASE_MEDIA.values()):
+        index[name.lower()] = name
+    for name, aliases in ALIASES.items():
+        for alias in aliases:
+            index[alias.lower()] = name
+    return index
+
+
+_ALIAS_INDEX = _build_alias_index()
+
+
+def host_of(url: str) -> str:
+    """URL → 소문자 호스트 (www. 제거)"""
+    try:
+        host = urllib.parse.urlparse(str(url)).netloc.lower().split("@")[-1].split(":")[0]
+    except Exception:
+        return ""
+    return host[4:] if host.startswith("www.") else host
+
+
+def base_domain(host: str) -> str:
+    """호스트 → 기본 도메인 (yna.co.kr, hankyung.com)"""
+    parts = host.split(".")
+    if len(parts) >= 3 and parts[-1] == "kr" and parts[-2] in _KR_SECOND_LEVEL:
+        return ".".join(parts[-3:])
+    return ".".join(parts[-2:])
+
+
+@lru_cache(maxsize=4096)
+def resolve_host(host: str) -> str:
+    """호스트 → 매체명 (가장 긴 접미사 매치, 모르면 "")"""
+    node, found = _TRIE, ""
+    for label in reversed(host.split(".")):
+        node = node.get(label)
+        if node is None:
+            break
+        found = node.get("", found)
+    return found
+
+
+def publisher(url, fallback_to_domain: bool = False) -> str:
+    """
+    뉴스 원문 URL → 매체명.
+
+    모르는 매체는 "" (fallback_to_domain=True면 기본 도메인 — 화면 표시용).
+    """
+    if not isinstance(url, str) or not url:
+        return ""
+    host = host_of(url)
+    if not host:
+        return ""
+    name = resolve_host(host)
+    if not name and fallback_to_domain:
+        return base_domain(host)
+    return name
+
+
+def publishers(urls: pd.Series, fallback_to_domain: bool = False) -> pd.Series:
+    """URL 컬럼 → 매체명 컬럼 (같은 URL은 1회만 해석, 행 인덱스 유지)"""
+    lookup = {u: publisher(u, fallback_to_domain) for u in urls.dropna().unique()}
+    return urls.map(lookup).fillna("")
+
+
+def canonical_name(media_name: str) -> str:
+    """매체명·별칭 → 정식 매체명 (모르는 이름은 공백만 정리해 그대로)"""
+    name = str(media_name or "").strip()
+    return _ALIAS_INDEX.get(name.lower(), name)
+
+
+def aliases(media_name: str) -> list:
+    """매체명의 모든 별칭 (정식 매체명 포함, 모르는 이름은 [이름])"""
+    name = canonical_name(media_name)
+    return list(ALIASES.get(name, [name]))
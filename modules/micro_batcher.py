@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+micro_batcher.py
+짧은 시간 창 동안 들어온 요청을 모아 한 번에 처리하는 마이크로 배처.
+
+LLM 감성 분석처럼 건당 왕복 비용이 큰 호출을 여러 수집 스레드가 동시에 낼 때,
+submit()은 즉시 Future를 돌려주고 호출자는 수집을 계속한다. 첫 요청 후 window초가 지나거나
+max_batch건이 차면 백그라운드 스레드가 batch_fn(항목 목록)을 1회 호출해 Future들을 채운다.
+"""
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+
+
+class MicroBatcher:
+    """batch_fn(list) → 같은 길이의 결과 list. 예외 시 모든 Future에 fallback 값을 넣는다."""
+
+    def __init__(self, batch_fn, max_batch: int = 20, window: float = 0.8, fallback=None):
+        self.batch_fn = batch_fn
+        self.max_batch = max_batch
+        self.window = window
+        self.fallback = fallback
+        self._lock = threading.Lock()
+        self._items: list = []
+        self._futures: list = []
+        self._timer = None
+
+    def submit(self, item) -> Future:
+        fut: Future = Future()
+        with self._lock:
+            self._items.append(item)
+            self._futures.append(fut)
+            if len(self._items) >= self.max_batch:
+                batch = self._take()
+            else:
+                batch = None
+                if self._timer is None:
+                    self._timer = threading.Timer(self.window, self._flush_timer)
+                    self._timer.daemon = True
+                    self._timer.start()
+        if batch:
+            threading.Thread(target=self._run, args=batch, daemon=True).start()
+        return fut
+
+    def flush(self):
+        """대기 중인 항목을 지금 처리 (호출 스레드에서 실행)"""
+        with self._lock:
+            batch = self._take()
+        if batch:
+            self._run(*batch)
+
+    def _take(self):
+        """(락 보유) 대기 묶음을 꺼내고 타이머 해제"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._items:
+            return None
+        batch = (self._items, self._futures)
+        self._items, self._futures = [], []
+        return batch
+
+    def _flush_timer(self):
+        with self._lock:
+            self._timer = None
+            batch = self._take()
+        if batch:
+            self._run(*batch)
+
+    def _run(self, items: list, futures: list):
+        try:
+            results = list(self.batch_fn(items))
+            if len(results) != len(items):
+                raise ValueError(f"batch result size {len(results)} != {len(items)}")
+        except Exception as e:
+            print(f"[WARNING] 배치 처리 실패({len(items)}건): {e}")
+            results = [self.fallback] * len(items)
+        for fut, result in zip(futures, results):
+            fut.set_result(result)
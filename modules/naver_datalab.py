@@ -8,6 +8,7 @@ import requests
 import streamlit as st
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
+from . import http_client
 
 load_dotenv()
 
@@ -54,7 +55,7 @@ def fetch_search_trend(
         "gender": "",
     }
 
-    resp = requests.post(url, headers=headers, data=json.dumps(body), timeout=10)
+    resp = http_client.post(url, headers=headers, data=json.dumps(body), timeout=10)
     resp.raise_for_status()
     return resp.json()
 
@@ -7,6 +7,7 @@ import requests
 import streamlit as st
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
+from . import http_client
 from .media_utils import clean_html, extract_media_name, parse_pub_datetime
 
 load_dotenv()
@@ -33,7 +34,7 @@ def fetch_naver_news(keyword: str, display: int = 100, sort: str = "date") -> li
     # API 호출 원칙: 검색 1회당 뉴스검색 1회 (최대 100건)
     try:
         params = {"query": keyword, "display": min(display, 100), "start": 1, "sort": sort}
-        resp = requests.get(url, headers=headers, params=params, timeout=10)
+        resp = http_client.get(url, headers=headers, params=params, timeout=10)
         resp.raise_for_status()
         data = resp.json()
         raw_items = data.get("items", [])
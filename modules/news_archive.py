@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""
+news_archive.py
+수집한 모든 기사를 보관하는 전체 이력 아카이브 (날짜 파티션 CSV + SQLite 조회 인덱스).
+
+news_monitor.csv는 최신 200행만 남기는 핫 뷰라 기사가 몰린 날은 일간 브리핑의 '어제 기사'가
+잘리고, 며칠 지난 기사는 조회할 수 없었다.
+
+  - 원본: data/news_archive/YYYY-MM-DD.csv (발행일 파티션, news_monitor.csv 와 같은 컬럼)
+    append-only + git merge=union — heartbeat 런이 동시에 덧붙여도 rebase 시 줄 단위 합집합.
+    같은 기사(정규화 URL)는 값이 바뀐 경우에만 새 줄로 덧붙이고, 읽을 때 나중 줄이 이긴다(upsert).
+  - 인덱스: data/news_archive.db (SQLite, git 제외 — 파티션에서 언제든 재생성 가능한 파생 캐시)
+    발행시각·키워드·감성·매체명 인덱스. 조회 직전에 파티션의 새 줄만 증분 반영한다.
+"""
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+import pandas as pd
+
+from . import news_schema
+
+ARCHIVE_DIR = os.path.join("data", "news_archive")
+INDEX_FILE = os.path.join("data", "news_archive.db")
+TAIL_CHECK_BYTES = 256   # 증분 반영 시 이미 읽은 구간 끝부분이 그대로인지 확인하는 길이
+UNDATED_PARTITION = "undated"
+REFRESH_INTERVAL = 5.0   # 조회 시 파티션 변경 확인 최소 간격(초) — 이 프로세스의 upsert는 즉시 반영
+
+# 아카이브 컬럼 ↔ 인덱스 컬럼
+_FIELDS = [("날짜", "published"), ("매체명", "publisher"), ("검색키워드", "keyword"),
+           ("기사제목", "title"), ("주요기사 요약", "summary"), ("URL", "url"), ("sentiment", "sentiment")]
+
+
+def _row_keys(df: pd.DataFrame) -> pd.Series:
+    """기사 식별자: 정규화 URL (URL 없는 기사는 제목|날짜 해시)"""
+    keys = news_schema.url_keys(df).astype(str)
+    no_url = keys.isin(["", "nan"])
+    if no_url.any():
+        combined = df.loc[no_url, "기사제목"].astype(str) + "|" + df.loc[no_url, "날짜"].astype(str)
+        keys[no_url] = ["hash:" + hashlib.md5(c.encode("utf-8")).hexdigest()[:16] for c in combined]
+    return keys
+
+
+def _partition_names(dates: pd.Series) -> pd.Series:
+    """저장 형식 날짜 문자열 → 파티션 이름 (YYYY-MM-DD)"""
+    names = dates.astype(str).str[:10]
+    return names.where(names.str.match(r"^\d{4}-\d{2}-\d{2}$"), UNDATED_PARTITION)
+
+
+def _read_partition_text(text: str, header: bool) -> pd.DataFrame:
+    """파티션 CSV 텍스트 → 프레임. merge=union으로 합쳐진 파일(양쪽이 같은 날 파티션을 새로 만들었거나
+    한쪽이 압축 재작성)은 중간에 헤더 줄이 한 번 더 끼므로, 헤더와 같은 행은 기사로 읽지 않는다."""
+    rows = pd.read_csv(io.StringIO(text), header=0 if header else None,
+                       names=None if header else news_schema.COLUMNS,
+                       dtype=str, keep_default_na=False)
+    if "날짜" in rows.columns:
+        rows = rows[rows["날짜"] != "날짜"].reset_index(drop=True)
+    return rows
+
+
+class NewsArchive:
+    """전체 기사 아카이브. upsert는 파티션 파일에만 쓰고, query는 SQLite 인덱스로 답한다."""
+
+    def __init__(self, directory: str = ARCHIVE_DIR, index_path: str = INDEX_FILE):
+        self.directory = directory
+        self.index_path = index_path
+        self._lock = threading.Lock()
+        self._conn = None
+        self._refreshed = 0.0   # 마지막 refresh 시각 (0이면 다음 조회 때 확인)
+
+    # ── 쓰기 ───────────────────────────────────────────────
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{name}.csv")
+
+    def upsert(self, df: pd.DataFrame) -> int:
+        """기사 프레임(typed 또는 저장 형식)을 파티션에 반영. 새로 쓰인 행 수 반환."""
+        if df is None or df.empty:
+            return 0
+        rows = news_schema.to_storage(df).fillna("").astype(str)
+        rows = rows.assign(_key=_row_keys(rows).values)
+        rows = rows.drop_duplicates("_key", keep="first")  # 프레임 안에서는 앞 행(우선순위 높은 태그) 유지
+        written = 0
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            for name, part in rows.groupby(_partition_names(rows["날짜"]), sort=True):
+                written += self._upsert_partition(name, part)
+            if written:
+                self._refreshed = 0.0
+        return written
+
+    def _upsert_partition(self, name: str, part: pd.DataFrame) -> int:
+        """(락 보유) 파티션 1개: 기존 최신 행과 다른 행만 덧붙이고, 중복 줄이 많으면 압축"""
+        path = self._path(name)
+        existing = pd.DataFrame(columns=news_schema.COLUMNS)
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                existing = _read_partition_text(f.read(), header=True)
+        current = existing.assign(_key=_row_keys(existing).values).drop_duplicates("_key", keep="last")
+        current = current.set_index("_key")[news_schema.COLUMNS]
+
+        incoming = part.set_index("_key")[news_schema.COLUMNS]
+        known = incoming.index.isin(current.index)
+        changed = ~known
+        if known.any():
+            same = (incoming[known] == current.loc[incoming.index[known]]).all(axis=1)
+            changed[known] = ~same.values
+        fresh = incoming[changed]
+        if fresh.empty:
+            return 0
+
+        if len(existing) + len(fresh) > 2 * (len(current) + len(fresh)):
+            # 갱신 줄이 살아있는 기사 수의 2배를 넘으면 최신 행만 남겨 다시 쓴다
+            merged = pd.concat([current.drop(fresh.index, errors="ignore"), fresh])
+            self._write_atomic(path, merged.to_csv(index=False))
+        else:
+            header = not os.path.exists(path) or os.path.getsize(path) == 0
+            with open(path, "a", encoding="utf-8", newline="") as f:
+                f.write(fresh.to_csv(index=False, header=header))
+        return len(fresh)
+
+    @staticmethod
+    def _write_atomic(path: str, text: str):
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+                f.write(text)
+            os.replace(tmp, path)
+        except Exception:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    # ── 인덱스 ─────────────────────────────────────────────
+    def _db(self) -> sqlite3.Connection:
+        """(락 보유) 지연 연결 — 최초 사용 시 테이블·인덱스 생성"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.index_path, timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(
+                "CREATE TABLE IF NOT EXISTS articles ("
+                " key TEXT PRIMARY KEY, published TEXT, publisher TEXT, keyword TEXT,"
+                " title TEXT, summary TEXT, url TEXT, sentiment TEXT);"
+                "CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published);"
+                "CREATE INDEX IF NOT EXISTS idx_articles_keyword ON articles(keyword, published);"
+                "CREATE INDEX IF NOT EXISTS idx_articles_sentiment ON articles(sentiment, published);"
+                "CREATE INDEX IF NOT EXISTS idx_articles_publisher ON articles(publisher, published);"
+                "CREATE TABLE IF NOT EXISTS partitions ("
+                " name TEXT PRIMARY KEY, offset INTEGER NOT NULL, tail TEXT NOT NULL);"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def refresh(self) -> int:
+        """파티션 파일의 새 줄을 인덱스에 반영하고 반영한 행 수 반환"""
+        with self._lock:
+            db = self._db()
+            seen = {name: (offset, tail) for name, offset, tail in
+                    db.execute("SELECT name, offset, tail FROM partitions")}
+            total = 0
+            names = sorted(e.name[:-4] for e in os.scandir(self.directory)
+                           if e.name.endswith(".csv")) if os.path.isdir(self.directory) else []
+            for name in names:
+                total += self._ingest(db, name, self._path(name), *seen.get(name, (0, "")))
+            db.commit()
+            self._refreshed = time.time()
+            return total
+
+    def _ingest(self, db: sqlite3.Connection, name: str, path: str, offset: int, tail: str) -> int:
+        """(락 보유) 파티션 1개 증분 반영. 읽은 구간이 바뀌었으면(압축·병합) 처음부터 다시 읽는다."""
+        if offset and os.path.getsize(path) == offset:
+            return 0   # 크기가 그대로면 파일을 열지 않는다 (조회마다 수백 개 파티션 확인)
+        with open(path, "rb") as f:
+            data = f.read()
+        if offset and (len(data) < offset or self._tail(data, offset) != tail):
+            offset = 0
+        if offset == len(data):
+            return 0
+        chunk = data[offset:]
+        end = chunk.rfind(b"\n") + 1   # 쓰는 중인 마지막 줄은 다음 번에
+        if end == 0:
+            return 0
+        rows = _read_partition_text(chunk[:end].decode("utf-8"), header=offset == 0)
+        if not rows.empty:
+            keys = _row_keys(rows)
+            values = list(zip(keys, *(rows[c] for c, _ in _FIELDS)))
+            db.executemany(
+                "INSERT OR REPLACE INTO articles (key, " + ", ".join(col for _, col in _FIELDS) + ")"
+                " VALUES (?" + ", ?" * len(_FIELDS) + ")", values
+            )
+        offset += end
+        db.execute("INSERT OR REPLACE INTO partitions (name, offset, tail) VALUES (?, ?, ?)",
+                   (name, offset, self._tail(data, offset)))
+        return len(rows)
+
+    @staticmethod
+    def _tail(data: bytes, offset: int) -> str:
+        return hashlib.md5(data[max(0, offset - TAIL_CHECK_BYTES):offset]).hexdigest()
+
+    # ── 조회 ───────────────────────────────────────────────
+    def query(self, start=None, end=None, keywords=None, sentiment: str = None,
+              publisher: str = None, limit: int = None) -> pd.DataFrame:
+        """
+        기간·키워드·감성·매체명 조건으로 기사 조회 (최신순, news_schema 타입 프레임)
+
+        start 이상 end 미만 (datetime 또는 "YYYY-MM-DD[ HH:MM]" 문자열).
+        """
+        if time.time() - self._refreshed > REFRESH_INTERVAL:
+            self.refresh()
+        where, params = [], []
+        if start is not None:
+            where.append("published >= ?")
+            params.append(news_schema.format_date(pd.Timestamp(start)))
+        if end is not None:
+            where.append("published < ?")
+            params.append(news_schema.format_date(pd.Timestamp(end)))
+        if keywords:
+            keywords = [keywords] if isinstance(keywords, str) else list(keywords)
+            where.append(f"keyword IN ({', '.join('?' * len(keywords))})")
+            params.extend(keywords)
+        if sentiment:
+            where.append("sentiment = ?")
+            params.append(sentiment)
+        if publisher:
+            where.append("publisher = ?")
+            params.append(publisher)
+        sql = "SELECT " + ", ".join(col for _, col in _FIELDS) + ", key FROM articles"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY published DESC"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        with self._lock:
+            rows = self._db().execute(sql, params).fetchall()
+        df = pd.DataFrame(rows, columns=[c for c, _ in _FIELDS] + [news_schema.URL_KEY])
+        df[news_schema.URL_KEY] = df[news_schema.URL_KEY].where(~df[news_schema.URL_KEY].str.startswith("hash:"), "")
+        return news_schema.typed(df[news_schema.COLUMNS + [news_schema.URL_KEY]])
+
+    def __len__(self) -> int:
+        self.refresh()
+        with self._lock:
+            return self._db().execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+
+_archive: NewsArchive | None = None
+_archive_lock = threading.Lock()
+
+
+def get_archive() -> NewsArchive:
+    """프로세스 공유 아카이브"""
+    global _archive
+    if _archive is None:
+        with _archive_lock:
+            if _archive is None:
+                _archive = NewsArchive()
+    return _archive
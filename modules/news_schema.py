@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+news_schema.py
+뉴스 프레임(news_monitor.csv 와 수집 결과)의 표준 타입 스키마.
+
+'날짜'는 CSV에 "YYYY-MM-DD HH:MM" 문자열로 저장되고, 감지·발송·화면·브리핑이 각자
+pd.to_datetime / str.startswith 로 다시 해석했다. 여기서는 읽을 때 한 번만 타입을 입힌다.
+
+  - 날짜: datetime64 (KST naive, 파싱 실패는 NaT)
+  - 매체명·검색키워드·sentiment: category (값 종류가 적은 반복 문자열)
+  - url_key: 정규화 URL (article_index.canonical_urls) — 중복·식별자 대조용
+  - 문자열 변환은 저장(to_storage)과 화면/메시지 표시(format_date)에서만
+
+category 컬럼에 새 값을 대입하려면 먼저 object로 바꾸거나(to_storage) 프레임 단위로 다시 typed()를 거친다.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+
+import pandas as pd
+
+from .article_index import canonical_urls
+
+COLUMNS = ["날짜", "매체명", "검색키워드", "기사제목", "주요기사 요약", "URL", "sentiment"]
+CATEGORY_COLUMNS = ("매체명", "검색키워드", "sentiment")
+TEXT_COLUMNS = ("기사제목", "주요기사 요약", "URL")
+DATE_FORMAT = "%Y-%m-%d %H:%M"
+URL_KEY = "url_key"
+
+
+def parse_dates(col: pd.Series) -> pd.Series:
+    """날짜 컬럼 → datetime64 (표준 형식 일괄 파싱, 형식이 다른 값만 개별 파싱)"""
+    if pd.api.types.is_datetime64_any_dtype(col):
+        return col
+    dates = pd.to_datetime(col, format=DATE_FORMAT, errors="coerce")
+    odd = dates.isna() & col.notna() & col.astype(str).str.strip().ne("")
+    if odd.any():
+        dates[odd] = [pd.to_datetime(d, errors="coerce") for d in col[odd]]
+    return dates
+
+
+def parse_date(value):
+    """날짜 값 1개 → Timestamp (실패는 NaT) — JSON에 문자열로 저장된 대기열 항목용"""
+    if isinstance(value, datetime):
+        return pd.Timestamp(value)
+    if not value or (isinstance(value, float) and pd.isna(value)):
+        return pd.NaT
+    try:
+        return pd.Timestamp(datetime.strptime(str(value).strip(), DATE_FORMAT))
+    except ValueError:
+        return pd.to_datetime(value, errors="coerce")
+
+
+def format_date(value) -> str:
+    """날짜 값 1개 → "YYYY-MM-DD HH:MM" (NaT·빈 값은 "")"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ""
+    if isinstance(value, datetime):
+        return value.strftime(DATE_FORMAT)
+    return str(value).strip()
+
+
+def date_strings(col: pd.Series) -> pd.Series:
+    """날짜 컬럼 → 저장 형식 문자열 컬럼 (NaT는 "")"""
+    return parse_dates(col).dt.strftime(DATE_FORMAT).fillna("")
+
+
+def url_keys(df: pd.DataFrame) -> pd.Series:
+    """정규화 URL 컬럼 (typed 프레임이면 미리 계산된 값 사용)"""
+    if URL_KEY in df.columns:
+        return df[URL_KEY]
+    return canonical_urls(df["URL"]) if "URL" in df.columns else pd.Series("", index=df.index)
+
+
+def empty_frame() -> pd.DataFrame:
+    return typed(pd.DataFrame(columns=COLUMNS))
+
+
+def typed(df: pd.DataFrame) -> pd.DataFrame:
+    """뉴스 프레임에 표준 타입 적용 (이미 typed여도 안전, 원본은 변경하지 않음)"""
+    df = df.copy()
+    for col in COLUMNS:
+        if col not in df.columns:
+            df[col] = "pos" if col == "sentiment" else None  # sentiment 없던 구 DB는 긍정/중립
+    df["날짜"] = parse_dates(df["날짜"])
+    for col in TEXT_COLUMNS:
+        df[col] = df[col].where(df[col].notna(), "").astype(str)
+    for col in CATEGORY_COLUMNS:
+        if not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype("category")
+    if URL_KEY not in df.columns or df[URL_KEY].isna().any():
+        df[URL_KEY] = canonical_urls(df["URL"])
+    return df
+
+
+def combine(frames) -> pd.DataFrame:
+    """typed 프레임 여러 개 이어 붙이기 (카테고리 합집합으로 다시 typed)"""
+    frames = [f for f in frames if f is not None and not f.empty]
+    if not frames:
+        return empty_frame()
+    out = pd.concat([to_objects(f) for f in frames], ignore_index=True)
+    return typed(out)
+
+
+def to_objects(df: pd.DataFrame) -> pd.DataFrame:
+    """category 컬럼을 object로 (값 대입·concat 전)"""
+    df = df.copy()
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns and isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype(object)
+    return df
+
+
+def to_storage(df: pd.DataFrame) -> pd.DataFrame:
+    """CSV 저장 형식 (표준 컬럼 순서, 날짜 문자열, url_key 제외)"""
+    out = to_objects(df)
+    for col in COLUMNS:
+        if col not in out.columns:
+            out[col] = None
+    out = out[COLUMNS]
+    out["날짜"] = date_strings(out["날짜"])
+    return out
+
+
+def read_csv(source, **kwargs) -> pd.DataFrame:
+    """news_monitor.csv (경로 또는 버퍼) → typed 프레임"""
+    return typed(pd.read_csv(source, encoding="utf-8", **kwargs))
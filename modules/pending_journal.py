@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+"""
+pending_journal.py
+발송 대기(pending) 큐 — append-only 이벤트 저널 + 주기적 스냅샷 압축.
+
+기존 pending_articles.json(indent=2, 수백 KB)은 변경 때마다 전체를 재작성했고,
+로드 때마다 모든 항목의 last_attempt ISO 문자열을 파싱해 TTL을 적용했다.
+
+  - 저널: data/pending_articles.log — 한 줄에 이벤트 JSON 1개.
+    op = enqueue(기사 등록) / attempt(발송 실패·재시도 횟수) / success(발송 완료) / drop(폐기)
+  - 스냅샷: data/pending_articles.json — 압축된 이벤트 목록 {"events": [...], "count": ...}
+  - 상태 = 스냅샷 ∪ 저널 이벤트를 (ts, op 순서, id)로 정렬해 재생(replay)한 결과.
+    이벤트는 id로 중복 제거되는 집합이라, 두 저널(로컬·원격)의 병합은 합집합 후 재생으로 끝난다.
+    늦게 도착한 과거 이벤트도 정렬 재생이라 순서가 뒤집히지 않는다 (발송 완료 뒤 재등록 방지).
+  - 저장(sync): 호출자가 받은 dict와 마지막 로드/저장 시점 상태를 비교해 바뀐 항목만 이벤트로 덧붙인다.
+    라운드당 쓰기량은 변경 건수에 비례 (큐 크기와 무관).
+  - 압축: 저널 줄 수가 살아있는 이벤트의 2배(최소 COMPACT_MIN_EVENTS)를 넘으면
+    항목당 enqueue + 마지막 attempt, TTL 안의 완료·폐기 표식만 스냅샷으로 다시 쓰고 저널을 비운다.
+  - TTL: 마지막 시도 epoch를 메모리에 들고 비교 (ISO 파싱 없음).
+"""
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from datetime import datetime
+
+from .file_lock import FileLock
+
+SNAPSHOT_FILE = os.path.join("data", "pending_articles.json")
+JOURNAL_FILE = os.path.join("data", "pending_articles.log")
+COMPACT_MIN_EVENTS = 200  # 저널이 이보다 짧으면 압축하지 않음
+
+OP_ORDER = {"enqueue": 0, "attempt": 1, "success": 2, "drop": 2}
+_ENTRY_STATE_KEYS = ("retry_count", "last_attempt")
+
+
+def _sort_key(ev: dict):
+    return (ev.get("ts", 0), OP_ORDER.get(ev.get("op"), 3), ev.get("id", ""))
+
+
+def _legacy_events(queue: dict) -> list:
+    """구 형식 {"queue": {url: entry}} → 이벤트 (id가 URL에서 결정돼 여러 곳에서 변환해도 중복되지 않음)"""
+    events = []
+    now = time.time()
+    for url, entry in queue.items():
+        if not isinstance(entry, dict):
+            continue
+        try:
+            ts = datetime.fromisoformat(entry.get("last_attempt", "")).timestamp()
+        except Exception:
+            ts = now
+        article = {k: v for k, v in entry.items() if k not in _ENTRY_STATE_KEYS}
+        events.append({"id": f"legacy:{url}", "ts": ts, "op": "enqueue", "url": url, "article": article})
+        if entry.get("retry_count", 0):
+            events.append({"id": f"legacy-attempt:{url}", "ts": ts, "op": "attempt", "url": url,
+                           "retry": entry["retry_count"]})
+    return events
+
+
+def parse_events(text: str) -> list:
+    """저널(JSONL)·스냅샷·구 형식 pending_articles.json 텍스트 → 이벤트 목록"""
+    stripped = text.strip()
+    if not stripped:
+        return []
+    try:
+        data = json.loads(stripped)
+        if isinstance(data, dict) and "op" not in data:
+            if "events" in data:
+                return [e for e in data["events"] if isinstance(e, dict) and e.get("id")]
+            return _legacy_events(data.get("queue", {}) or {})
+    except ValueError:
+        pass
+    events = []
+    for line in stripped.splitlines():
+        try:
+            ev = json.loads(line)
+        except ValueError:
+            continue  # 쓰다 만 줄·충돌 표식 등은 건너뜀
+        if isinstance(ev, dict) and ev.get("id") and ev.get("op") in OP_ORDER:
+            events.append(ev)
+    return events
+
+
+def format_events(events) -> str:
+    """이벤트 목록 → 저널 텍스트"""
+    return "".join(json.dumps(ev, ensure_ascii=False) + "\n" for ev in events)
+
+
+def _apply_event(live: dict, last: dict, tomb: dict, ev: dict):
+    op, url, ts = ev.get("op"), ev.get("url"), ev.get("ts", 0)
+    if not url:
+        return
+    if op == "enqueue":
+        if url not in live:
+            entry = dict(ev.get("article") or {})
+            entry["retry_count"] = 0
+            live[url] = entry
+            last[url] = ts
+            tomb.pop(url, None)
+    elif op == "attempt":
+        if url in live:
+            live[url]["retry_count"] = max(live[url].get("retry_count", 0), ev.get("retry", 0))
+            last[url] = ts
+    else:
+        live.pop(url, None)
+        last.pop(url, None)
+        tomb[url] = ts
+
+
+def replay(events, ttl_seconds: float = None, now: float = None) -> tuple:
+    """이벤트 재생 → (live {url: entry}, last {url: 마지막 시도 epoch}, tomb {url: 완료·폐기 epoch})"""
+    live, last, tomb = {}, {}, {}
+    for ev in sorted(events, key=_sort_key):
+        _apply_event(live, last, tomb, ev)
+    if ttl_seconds is not None:
+        cutoff = (time.time() if now is None else now) - ttl_seconds
+        for url in [u for u, ts in last.items() if ts < cutoff]:
+            del live[url], last[url]
+    return live, last, tomb
+
+
+def should_compact(journal_lines: int, live_count: int) -> bool:
+    """저널 줄 수가 살아있는 이벤트(항목 + 완료·폐기 표식)의 2배(최소 COMPACT_MIN_EVENTS)를 넘었는지"""
+    return journal_lines > max(COMPACT_MIN_EVENTS, 2 * live_count)
+
+
+def write_atomic(path: str, text: str):
+    """텍스트 원자적 쓰기 (임시 파일 + rename)"""
+    folder = os.path.dirname(path) or "."
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=folder, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+class PendingJournal:
+    """pending 큐 저장소. load()로 dict를 받고, 수정한 dict를 sync()로 돌려주면 변경분만 기록한다."""
+
+    def __init__(self, snapshot_path: str = SNAPSHOT_FILE, journal_path: str = JOURNAL_FILE,
+                 ttl_hours: float = 48):
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path
+        self.ttl_seconds = ttl_hours * 3600
+        self._lock = threading.Lock()
+        self._base: dict = {}      # 호출자가 마지막으로 본 상태 {url: retry_count}
+        self._reasons: dict = {}   # 제거 사유 메모 {url: "success"|"drop"}
+        self._reset()
+
+    def _reset(self):
+        self._events: dict = {}    # id → 이벤트 (스냅샷 + 저널)
+        self._live, self._last, self._tomb = {}, {}, {}
+        self._max_ts = 0.0
+        self._snap_ident = None
+        self._journal_ident = None
+        self._offset = 0
+        self._journal_lines = 0
+
+    # ── 읽기 ───────────────────────────────────────────────
+    @staticmethod
+    def _ident(path: str):
+        try:
+            st = os.stat(path)
+            return (st.st_ino, st.st_dev, st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            return None
+
+    def _refresh(self):
+        """(락 보유) 스냅샷이 바뀌었거나 저널이 교체·축소됐으면 전체 재로드, 아니면 저널 덧붙은 줄만 읽기"""
+        snap = self._ident(self.snapshot_path)
+        journal = self._ident(self.journal_path)
+        prev = self._journal_ident
+        if journal is None:
+            replaced = self._offset > 0
+        else:
+            replaced = prev is not None and (journal[:2] != prev[:2] or journal[3] < self._offset)
+        if snap != self._snap_ident or replaced:
+            self._reset()
+            self._snap_ident = snap
+            if snap is not None:
+                with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                    self._apply(parse_events(f.read()))
+        self._journal_ident = journal
+        if journal is None or journal[3] == self._offset:
+            return
+        with open(self.journal_path, "rb") as f:
+            f.seek(self._offset)
+            chunk = f.read()
+        end = chunk.rfind(b"\n") + 1  # 쓰는 중인 마지막 줄은 다음에
+        if end <= 0:
+            return
+        self._offset += end
+        text = chunk[:end].decode("utf-8", errors="replace")
+        self._journal_lines += text.count("\n")
+        self._apply(parse_events(text))
+
+    def _apply(self, events: list) -> list:
+        """(락 보유) 처음 보는 이벤트 반영. 모두 최신이면 이어서 적용, 과거 이벤트가 섞이면 전체 재생."""
+        fresh = [e for e in events if e["id"] not in self._events]
+        if not fresh:
+            return fresh
+        for ev in fresh:
+            self._events[ev["id"]] = ev
+        if min(e.get("ts", 0) for e in fresh) >= self._max_ts:
+            for ev in sorted(fresh, key=_sort_key):
+                _apply_event(self._live, self._last, self._tomb, ev)
+        else:
+            self._live, self._last, self._tomb = replay(self._events.values())
+        self._max_ts = max(self._max_ts, max(e.get("ts", 0) for e in fresh))
+        return fresh
+
+    def _current(self) -> dict:
+        """(락 보유) TTL 적용한 현재 큐 사본 (항목 dict 형식은 기존 pending_articles.json과 동일)"""
+        cutoff = time.time() - self.ttl_seconds
+        out = {}
+        for url, entry in self._live.items():
+            ts = self._last.get(url, 0)
+            if ts < cutoff:
+                continue
+            item = dict(entry)
+            item["last_attempt"] = datetime.fromtimestamp(ts).isoformat()
+            out[url] = item
+        return out
+
+    def load(self) -> dict:
+        with self._lock:
+            self._refresh()
+            queue = self._current()
+            self._base = {url: e.get("retry_count", 0) for url, e in queue.items()}
+            self._reasons.clear()
+            return queue
+
+    def expired_count(self) -> int:
+        with self._lock:
+            cutoff = time.time() - self.ttl_seconds
+            return sum(1 for ts in self._last.values() if ts < cutoff)
+
+    # ── 쓰기 ───────────────────────────────────────────────
+    def note_removal(self, url: str, reason: str):
+        """다음 sync 때 기록할 제거 사유 (기본은 drop)"""
+        self._reasons[url] = reason
+
+    def _append(self, events: list):
+        """(락 보유) 이벤트를 저널 끝에 쓰고 메모리에 반영"""
+        data = format_events(events).encode("utf-8")
+        os.makedirs(os.path.dirname(self.journal_path) or ".", exist_ok=True)
+        with open(self.journal_path, "ab") as f:
+            f.write(data)
+        self._journal_ident = self._ident(self.journal_path)
+        self._offset += len(data)
+        self._journal_lines += len(events)
+        self._apply(events)
+
+    def _event(self, op: str, url: str, ts: float, **fields) -> dict:
+        return {"id": uuid.uuid4().hex[:16], "ts": round(ts, 3), "op": op, "url": url, **fields}
+
+    def sync(self, queue: dict) -> int:
+        """호출자 dict의 변경분(신규·재시도·제거)만 저널에 덧붙인다. 기록한 이벤트 수 반환."""
+        with FileLock(self.journal_path + ".lock"):
+            with self._lock:
+                self._refresh()
+                now = time.time()
+                events = []
+                for url, entry in queue.items():
+                    retry = entry.get("retry_count", 0)
+                    known = self._base.get(url, self._live.get(url, {}).get("retry_count"))
+                    if known is None:
+                        article = {k: v for k, v in entry.items() if k not in _ENTRY_STATE_KEYS}
+                        events.append(self._event("enqueue", url, now, article=article))
+                        if retry:
+                            events.append(self._event("attempt", url, now, retry=retry))
+                    elif retry != known:
+                        events.append(self._event("attempt", url, now, retry=retry))
+                for url in self._base:
+                    if url not in queue:
+                        events.append(self._event(self._reasons.pop(url, "drop"), url, now))
+                if events:
+                    self._append(events)
+                self._base = {url: e.get("retry_count", 0) for url, e in queue.items()}
+                self._reasons.clear()
+                if should_compact(self._journal_lines, len(self._live) + len(self._tomb)):
+                    self._compact()
+                return len(events)
+
+    def merge_text(self, text: str) -> int:
+        """다른 발송 주체의 저널·스냅샷(원격 등)에서 처음 보는 이벤트만 로컬 저널에 덧붙인다."""
+        remote = parse_events(text)
+        with FileLock(self.journal_path + ".lock"):
+            with self._lock:
+                self._refresh()
+                fresh = [e for e in remote if e["id"] not in self._events]
+                if fresh:
+                    self._append(sorted(fresh, key=_sort_key))
+                return len(fresh)
+
+    def _compact(self):
+        """(락 보유) 현재 상태를 재현하는 최소 이벤트만 스냅샷으로 쓰고 저널을 비운다"""
+        try:
+            events = compact_events(self._events.values(), self.ttl_seconds)
+            write_atomic(self.snapshot_path, format_snapshot(events))
+            write_atomic(self.journal_path, "")  # 스냅샷이 먼저 — 중간에 죽어도 이벤트 중복뿐
+            self._reset()
+            self._snap_ident = self._ident(self.snapshot_path)
+            self._journal_ident = self._ident(self.journal_path)
+            self._apply(events)
+        except Exception as e:
+            print(f"[WARNING] Pending 저널 압축 실패: {e}")
+
+
+def compact_events(events, ttl_seconds: float) -> list:
+    """상태를 재현하는 최소 이벤트: 살아있는 항목의 enqueue + 마지막 attempt, TTL 안의 완료·폐기 표식"""
+    events = sorted(events, key=_sort_key)
+    live, last, tomb = replay(events, ttl_seconds)
+    cutoff = time.time() - ttl_seconds
+    keep = {}
+    for ev in events:
+        url, op = ev.get("url"), ev.get("op")
+        if url in live:
+            if op == "enqueue" and ("enqueue", url) not in keep:
+                keep[("enqueue", url)] = ev
+            elif op == "attempt":
+                keep[("attempt", url)] = ev
+        elif op in ("success", "drop") and tomb.get(url) == ev.get("ts") and ev.get("ts", 0) >= cutoff:
+            keep[("tomb", url)] = ev
+    return sorted(keep.values(), key=_sort_key)
+
+
+def format_snapshot(events: list) -> str:
+    """스냅샷 JSON (이벤트 한 줄씩 — git diff가 바뀐 이벤트 줄로 한정됨)"""
+    live = sum(1 for e in events if e.get("op") == "enqueue")
+    head = json.dumps({"last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "count": live},
+                      ensure_ascii=False)[:-1]
+    body = ",\n".join(json.dumps(e, ensure_ascii=False) for e in events)
+    return f'{head}, "events": [\n{body}\n]}}\n' if events else f'{head}, "events": []}}\n'
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+poll_scheduler.py
+키워드별 적응형 폴링 스케줄러.
+
+모든 키워드를 매 라운드(3분) 폴링하면 하루 한두 건 나오는 키워드(예: '우크라이나 곡물터미널')도
+'포스코'와 같은 빈도로 네이버 API를 쓴다. 이 모듈은 키워드별 기사 도착률 λ를 학습해
+폴링 간격 T를 정한다.
+
+  - 도착률 추정: 감쇠 카운트 Gamma-Poisson 추정 λ = (C + a0) / (H + b0)
+      C: 관측된 신규 기사 수(지수 감쇠), H: 관측 시간(시간 단위, 지수 감쇠)
+      부트스트랩은 monitoring_log.jsonl(증분 수집 이벤트) → 없으면 뉴스 DB 히스토리.
+  - 간격 최적화: 포아송 도착 + 주기 T 폴링의 평균 탐지 지연은 T/2.
+      min Σ w·λ·T/2  s.t. Σ c/T ≤ B(일일 예산)  →  T ∝ sqrt(c / (w·λ))
+      (w: 우선순위 가중치, c: 폴링 1회당 평균 API 호출 수)
+    라운드 주기(하한)와 우선순위별 SLO(상한)로 자른 뒤 남은 예산을 재분배(water-filling).
+  - KEYWORD_PRIORITY가 SLO를 정한다: P1은 상한이 라운드 주기라 항상 매 라운드 폴링.
+
+상태는 data/poll_schedule.json에 저장(라운드당 1회).
+"""
+from __future__ import annotations
+
+import json
+import math
+import os
+import tempfile
+import time
+from datetime import datetime
+
+STATE_FILE = os.path.join("data", "poll_schedule.json")
+LOG_FILE = os.path.join("data", "monitoring_log.jsonl")
+
+ROUND_SECONDS = 180                  # heartbeat 라운드 주기 (폴링 간격 하한)
+BUDGET_FRACTION = float(os.getenv("POLL_BUDGET_FRACTION", "0.3"))  # 일일 할당량 중 정기 폴링 몫
+
+# 우선순위별 최대 탐지 지연 SLO = 폴링 간격 상한(초)
+PRIORITY_MAX_INTERVAL = {1: ROUND_SECONDS, 2: 15 * 60, 3: 60 * 60, 4: 60 * 60}
+DEFAULT_MAX_INTERVAL = 60 * 60
+# 우선순위별 탐지 지연 가중치 (클수록 짧은 간격)
+PRIORITY_WEIGHT = {1: 8.0, 2: 3.0, 3: 1.0, 4: 1.0}
+
+DECAY_HOURS = 72.0         # 관측 감쇠 시상수 (최근 3일 위주)
+PRIOR_RATE_PER_HOUR = 0.05  # 사전 도착률 (하루 약 1건)
+PRIOR_HOURS = 6.0           # 사전 관측 시간 (작을수록 관측값을 빨리 믿음)
+
+
+class PollScheduler:
+    """키워드별 도착률을 학습해 폴링 여부를 결정한다."""
+
+    def __init__(self, priorities: dict, daily_quota: int, state_path: str = STATE_FILE):
+        self.priorities = priorities
+        self.daily_budget = max(1.0, daily_quota * BUDGET_FRACTION)
+        self.state_path = state_path
+        self.state = self._load()
+
+    # ── 상태 입출력 ──────────────────────────────────────────
+    def _load(self) -> dict:
+        try:
+            if os.path.exists(self.state_path):
+                with open(self.state_path, "r", encoding="utf-8") as f:
+                    return json.load(f).get("keywords", {})
+        except Exception as e:
+            print(f"[WARNING] 폴링 스케줄 로드 실패: {e}")
+        return {}
+
+    def save(self):
+        """상태 저장 (원자적 쓰기)"""
+        try:
+            folder = os.path.dirname(self.state_path) or "."
+            os.makedirs(folder, exist_ok=True)
+            data = {
+                "keywords": self.state,
+                "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            fd, tmp = tempfile.mkstemp(dir=folder, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False)
+                os.replace(tmp, self.state_path)
+            except Exception:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+                raise
+        except Exception as e:
+            print(f"[WARNING] 폴링 스케줄 저장 실패: {e}")
+
+    # ── 도착률 부트스트랩 ─────────────────────────────────────
+    def bootstrap(self, keywords: list, history_df=None, log_path: str = LOG_FILE):
+        """상태가 없는 키워드의 도착률 초기값을 로그 → DB 히스토리 순으로 추정"""
+        missing = [kw for kw in keywords if kw not in self.state]
+        if not missing:
+            return
+        from_log = _rates_from_log(log_path)
+        from_db = _rates_from_history(history_df)
+        for kw in missing:
+            count, hours = from_log.get(kw) or from_db.get(kw) or (0.0, 0.0)
+            self.state[kw] = {"count": count, "hours": hours, "calls": 1.0, "last_polled": 0.0}
+
+    # ── 추정 / 간격 계산 ─────────────────────────────────────
+    def rate_per_hour(self, kw: str) -> float:
+        st = self.state.get(kw, {})
+        a0 = PRIOR_RATE_PER_HOUR * PRIOR_HOURS
+        return (st.get("count", 0.0) + a0) / (st.get("hours", 0.0) + PRIOR_HOURS)
+
+    def _bounds(self, kw: str) -> tuple:
+        p = self.priorities.get(kw, 999)
+        return ROUND_SECONDS, PRIORITY_MAX_INTERVAL.get(p, DEFAULT_MAX_INTERVAL)
+
+    def intervals(self, keywords: list) -> dict:
+        """예산 제약 하 평균 탐지 지연 최소화 폴링 간격(초)"""
+        budget = self.daily_budget / 86400.0  # calls/sec
+        weight = {kw: PRIORITY_WEIGHT.get(self.priorities.get(kw, 999), 1.0) for kw in keywords}
+        lam = {kw: self.rate_per_hour(kw) / 3600.0 for kw in keywords}
+        calls = {kw: max(0.5, self.state.get(kw, {}).get("calls", 1.0)) for kw in keywords}
+
+        result, free = {}, list(keywords)
+        for _ in range(len(keywords) + 1):
+            if not free:
+                break
+            spent = sum(calls[kw] / result[kw] for kw in result)
+            remaining = budget - spent
+            norm = sum(math.sqrt(calls[kw] * weight[kw] * lam[kw]) for kw in free)
+            if remaining <= 0 or norm <= 0:
+                for kw in free:
+                    result[kw] = self._bounds(kw)[1]
+                break
+            k = norm / remaining
+            clamped = []
+            for kw in free:
+                lo, hi = self._bounds(kw)
+                t = k * math.sqrt(calls[kw] / (weight[kw] * lam[kw]))
+                if t <= lo or t >= hi:
+                    result[kw] = min(max(t, lo), hi)
+                    clamped.append(kw)
+            if not clamped:
+                for kw in free:
+                    result[kw] = k * math.sqrt(calls[kw] / (weight[kw] * lam[kw]))
+                break
+            free = [kw for kw in free if kw not in clamped]
+        return {kw: float(result.get(kw, self._bounds(kw)[1])) for kw in keywords}
+
+    def due(self, keywords: list, now: float = None) -> list:
+        """이번 라운드에 폴링할 키워드 (입력 순서 유지). 반 라운드의 지터는 허용."""
+        now = now or time.time()
+        iv = self.intervals(keywords)
+        out = []
+        for kw in keywords:
+            last = self.state.get(kw, {}).get("last_polled", 0.0)
+            if now - last >= iv[kw] - ROUND_SECONDS / 2:
+                out.append(kw)
+        return out
+
+    # ── 관측 반영 ───────────────────────────────────────────
+    def observe(self, kw: str, new_items: int, api_calls: int = 1, now: float = None):
+        """폴링 결과 반영: 직전 폴링 이후 구간에 new_items건이 도착한 것으로 본다"""
+        now = now or time.time()
+        st = self.state.setdefault(kw, {"count": 0.0, "hours": 0.0, "calls": 1.0, "last_polled": 0.0})
+        last = st.get("last_polled", 0.0)
+        gap_h = (now - last) / 3600.0 if last else ROUND_SECONDS / 3600.0
+        gap_h = min(max(gap_h, 0.0), DECAY_HOURS)
+        decay = math.exp(-gap_h / DECAY_HOURS)
+        st["count"] = st.get("count", 0.0) * decay + max(0, new_items)
+        st["hours"] = st.get("hours", 0.0) * decay + gap_h
+        st["calls"] = 0.8 * st.get("calls", 1.0) + 0.2 * max(1, api_calls)
+        st["last_polled"] = now
+
+    def summary(self, keywords: list) -> str:
+        iv = self.intervals(keywords)
+        per_day = sum(self.state.get(kw, {}).get("calls", 1.0) * 86400.0 / iv[kw] for kw in keywords)
+        return f"예상 일일 호출 {per_day:,.0f}회 / 예산 {self.daily_budget:,.0f}회"
+
+
+def _rates_from_log(log_path: str) -> dict:
+    """monitoring_log.jsonl의 증분 수집 이벤트에서 키워드별 (기사 수, 관측 시간) 추정"""
+    counts, first, last = {}, None, None
+    try:
+        if not os.path.exists(log_path):
+            return {}
+        with open(log_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                ts = entry.get("timestamp", "")
+                if ts:
+                    first = first or ts
+                    last = ts
+                data = entry.get("data", {})
+                if entry.get("event_type") == "collection" and data.get("incremental"):
+                    kw = data.get("keyword", "")
+                    counts[kw] = counts.get(kw, 0) + data.get("articles_collected", 0)
+        if not counts or not first:
+            return {}
+        hours = (datetime.fromisoformat(last) - datetime.fromisoformat(first)).total_seconds() / 3600.0
+        hours = min(max(hours, 1.0), DECAY_HOURS)
+        return {kw: (float(c), hours) for kw, c in counts.items()}
+    except Exception as e:
+        print(f"[WARNING] 수집 로그 기반 도착률 추정 실패: {e}")
+        return {}
+
+
+def _rates_from_history(df) -> dict:
+    """뉴스 DB(검색키워드·날짜)에서 키워드별 (기사 수, 관측 시간) 추정"""
+    try:
+        if df is None or df.empty or "검색키워드" not in df.columns:
+            return {}
+        from .news_schema import parse_dates
+        dates = parse_dates(df["날짜"])
+        if dates.notna().sum() < 2:
+            return {}
+        hours = (dates.max() - dates.min()).total_seconds() / 3600.0
+        hours = min(max(hours, 1.0), DECAY_HOURS)
+        counts = df["검색키워드"].astype(str).value_counts()
+        return {kw: (float(c), hours) for kw, c in counts.items()}
+    except Exception as e:
+        print(f"[WARNING] DB 기반 도착률 추정 실패: {e}")
+        return {}
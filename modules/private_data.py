@@ -11,7 +11,7 @@
 import base64
 import os
 
-import requests
+from . import http_client
 
 DATA_REPO = os.getenv("GH_DATA_REPO", "kimwoss/Risk_management_data")
 _API = "https://api.github.com/repos/{repo}/contents/{path}"
@@ -36,7 +36,7 @@ def fetch_private_file(repo_path: str, local_path: str, token: str | None = None
         print("[private_data] 토큰 없음 - 비공개 데이터 로드 생략")
         return False
     try:
-        r = requests.get(
+        r = http_client.get(
             _API.format(repo=DATA_REPO, path=repo_path),
             headers={
                 "Authorization": f"Bearer {token}",
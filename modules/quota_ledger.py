@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+quota_ledger.py
+네이버 검색 API 일일 할당량 장부 (메모리 카운터 + 라운드당 1회 flush).
+
+  - 카운트 원천: http_client 요청 훅. openapi.naver.com/v1/search 로 실제 나간 요청만 센다
+    (호출부가 '키워드당 2회'처럼 추정하지 않음 — 구글 RSS 등 다른 호스트는 제외).
+  - 라운드 중에는 메모리에서만 증가(스레드 안전). api_usage.json 은 flush() 때만 읽고 쓴다.
+  - flush(): 파일 락(fcntl) 안에서 디스크 값을 다시 읽어 미반영 증가분만 더한 뒤 원자적 쓰기.
+    Streamlit 백그라운드 스레드와 Actions 프로세스가 동시에 써도 증가분이 유실되지 않는다.
+  - 날짜 기준은 한국시간(네이버 할당량 리셋 = 00:00 KST). 날짜가 바뀌면 카운터·경고 플래그 초기화.
+
+파일 형식은 기존 api_usage.json 그대로 유지 (health_check 워크플로가 읽음).
+"""
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime, timedelta, timezone
+
+from . import http_client
+from .file_lock import FileLock
+
+LEDGER_FILE = os.path.join("data", "api_usage.json")
+DAILY_LIMIT = 25000
+NAVER_HOST = "openapi.naver.com"
+NAVER_SEARCH_PATH = "/v1/search/"   # 데이터랩(/v1/datalab)은 별도 할당량이라 제외
+
+_lock = threading.Lock()
+_state = {
+    "loaded": False,
+    "date": "",
+    "base": 0,        # 마지막 동기화 시점의 디스크 카운트
+    "pending": 0,     # 아직 flush 안 된 이 프로세스의 호출 수
+    "alerts_sent": [],
+}
+
+
+def quota_day() -> str:
+    """할당량 기준 '오늘' (한국시간)"""
+    return datetime.now(timezone(timedelta(hours=9))).strftime("%Y-%m-%d")
+
+
+def configure(path: str = None, daily_limit: int = None):
+    """장부 파일 경로·일일 한도 지정 (news_collector 가 import 시 1회 호출)"""
+    global LEDGER_FILE, DAILY_LIMIT
+    with _lock:
+        if path:
+            LEDGER_FILE = path
+        if daily_limit:
+            DAILY_LIMIT = daily_limit
+        _state["loaded"] = False
+
+
+def _read_file(today: str) -> dict:
+    try:
+        if os.path.exists(LEDGER_FILE):
+            with open(LEDGER_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("date") == today:
+                return data
+    except Exception as e:
+        print(f"[WARNING] API 사용량 로드 실패: {e}")
+    return {"date": today, "count": 0, "alerts_sent": []}
+
+
+def _ensure_current():
+    """(락 보유 상태에서 호출) 최초 접근 시 디스크 로드, 날짜 변경 시 초기화"""
+    today = quota_day()
+    if not _state["loaded"]:
+        data = _read_file(today)
+        _state.update(loaded=True, date=today, base=data.get("count", 0),
+                      alerts_sent=list(data.get("alerts_sent", [])))
+    elif _state["date"] != today:
+        _state.update(date=today, base=0, pending=0, alerts_sent=[])
+
+
+def record(calls: int = 1):
+    """API 호출 n회 기록 (메모리)"""
+    with _lock:
+        _ensure_current()
+        _state["pending"] += calls
+
+
+def usage() -> int:
+    """오늘 사용량 = 마지막 동기화 값 + 미반영 증가분"""
+    with _lock:
+        _ensure_current()
+        return _state["base"] + _state["pending"]
+
+
+def alerts_sent() -> list:
+    with _lock:
+        _ensure_current()
+        return list(_state["alerts_sent"])
+
+
+def snapshot() -> dict:
+    """api_usage.json 과 같은 모양의 현재 상태"""
+    with _lock:
+        _ensure_current()
+        return {"date": _state["date"], "count": _state["base"] + _state["pending"],
+                "alerts_sent": list(_state["alerts_sent"])}
+
+
+def mark_alert(label: str):
+    """당일 경고 발송 플래그 기록 (즉시 flush — 타 프로세스의 재발송 방지)"""
+    with _lock:
+        _ensure_current()
+        if label not in _state["alerts_sent"]:
+            _state["alerts_sent"].append(label)
+    flush(force=True)
+
+
+def flush(force: bool = False) -> int:
+    """미반영 증가분을 디스크에 합산 기록하고 디스크 기준 최신 사용량을 반환.
+
+    증가분이 없으면(force=False) 쓰지 않고 디스크 값만 다시 읽는다 (타 프로세스 사용량 반영).
+    """
+    folder = os.path.dirname(LEDGER_FILE) or "."
+    os.makedirs(folder, exist_ok=True)
+    with FileLock(LEDGER_FILE + ".lock"):
+        with _lock:
+            _ensure_current()
+            today = _state["date"]
+            delta = _state["pending"]
+            data = _read_file(today)
+            count = data.get("count", 0) + delta
+            alerts = list(data.get("alerts_sent", []))
+            for label in _state["alerts_sent"]:
+                if label not in alerts:
+                    alerts.append(label)
+            _state.update(base=count, pending=0, alerts_sent=alerts)
+
+        if delta or force:
+            try:
+                _write_file(today, count, alerts)
+            except Exception as e:
+                print(f"[WARNING] API 사용량 저장 실패: {e}")
+                with _lock:  # 다음 flush 때 다시 반영
+                    _state["base"] -= delta
+                    _state["pending"] += delta
+    return count
+
+
+def _write_file(today: str, count: int, alerts: list):
+    data = {
+        "date": today,
+        "count": count,
+        "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "quota_remaining": DAILY_LIMIT - count,
+        "quota_percentage": (count / DAILY_LIMIT) * 100,
+        "alerts_sent": alerts,  # 당일 이미 보낸 임계값 라벨(["80","95"]) — 중복 알림 방지
+    }
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(LEDGER_FILE) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, LEDGER_FILE)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _on_request(method: str, url: str, response):
+    """http_client 요청 훅: 네이버 검색 API로 실제 처리된 요청만 카운트 (429 거부는 제외)"""
+    if response is None or response.status_code == 429:
+        return
+    if http_client._host_of(url) == NAVER_HOST and NAVER_SEARCH_PATH in url:
+        record(1)
+
+
+http_client.add_request_hook(_on_request)
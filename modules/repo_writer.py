@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 """
 repo_writer.py
-GitHub Contents API로 파일을 커밋(생성/갱신)한다. (GET sha → PUT, 409 재시도)
+GitHub Git Data API로 여러 파일을 커밋 1개로 반영한다. (ref → 트리 비교 → blob → tree → commit → ref 갱신)
 
 두 저장소를 분리 지원:
   - 공개 레포(Risk_management)      : 대응이력 CSV        → 토큰 GH_PAT
@@ -9,15 +9,24 @@ GitHub Contents API로 파일을 커밋(생성/갱신)한다. (GET sha → PUT,
 
 토큰이 없으면 (False, "토큰 없음") 반환 → 호출부는 '미리보기만' 모드로 처리.
 로컬 git 트리를 건드리지 않고 API만 사용하므로 배포 체크아웃에 안전.
+
+Contents API(GET sha → PUT)는 파일마다 커밋이 1개씩 생기고, 바뀌지 않은 1MB 파일도 base64로
+다시 올렸다. commit_files는
+  - 원격 트리의 blob SHA와 로컬 내용의 git blob SHA(sha1("blob <len>\\0" + 내용))가 같으면 업로드 생략
+  - 바뀐 파일만 blob 생성 → base_tree 위에 트리 1개 → 커밋 1개 → 브랜치 ref fast-forward 갱신
+  - 그사이 다른 커밋이 들어와 ref 갱신이 거절되면(422/409) 최신 ref로 처음부터 재시도
+files에 함수를 주면 시도마다 원격 상태(RemoteTree)를 보고 내용을 다시 만든다 (union 병합용).
 """
 from __future__ import annotations
 
 import base64
+import hashlib
 import os
 
-import requests
+from . import http_client
 
-_API = "https://api.github.com/repos/{repo}/contents/{path}"
+_API = "https://api.github.com/repos/{repo}"
+MAX_ATTEMPTS = 3
 
 PUBLIC_REPO = os.getenv("GH_REPO", "kimwoss/Risk_management")
 PRIVATE_REPO = os.getenv("GH_DATA_REPO", "kimwoss/Risk_management_data")
@@ -44,55 +53,121 @@ def can_commit(kind: str) -> bool:
     return bool(_token(kind))
 
 
-def commit_file(kind: str, path: str, content: bytes, message: str,
-                branch: str = "main") -> tuple[bool, str]:
+def blob_sha(content: bytes) -> str:
+    """git이 계산하는 blob SHA (원격 트리 항목과 비교용)"""
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+
+class RemoteTree:
+    """브랜치 최신 커밋의 파일 트리 (경로 → blob SHA, 내용은 필요할 때만 받음)"""
+
+    def __init__(self, api: str, headers: dict, commit_sha: str, tree_sha: str, entries: dict):
+        self._api = api
+        self._headers = headers
+        self.commit_sha = commit_sha
+        self.tree_sha = tree_sha
+        self.entries = entries
+
+    def sha(self, path: str):
+        return self.entries.get(path)
+
+    def read(self, path: str) -> bytes | None:
+        """원격 파일 내용 (없으면 None). blob API라 1MB 넘는 파일도 그대로 받는다."""
+        sha = self.entries.get(path)
+        if sha is None:
+            return None
+        r = http_client.get(f"{self._api}/git/blobs/{sha}", headers=self._headers, timeout=20)
+        if r.status_code != 200:
+            raise RuntimeError(f"blob {path} -> {r.status_code}")
+        return base64.b64decode(r.json().get("content", ""))
+
+
+def _headers(token: str) -> dict:
+    return {
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+
+
+def _remote_tree(api: str, headers: dict, branch: str) -> RemoteTree:
+    r = http_client.get(f"{api}/git/ref/heads/{branch}", headers=headers, timeout=20)
+    if r.status_code != 200:
+        raise RuntimeError(f"ref {branch} -> {r.status_code}: {r.text[:120]}")
+    commit_sha = r.json()["object"]["sha"]
+    r = http_client.get(f"{api}/git/commits/{commit_sha}", headers=headers, timeout=20)
+    if r.status_code != 200:
+        raise RuntimeError(f"commit -> {r.status_code}")
+    tree_sha = r.json()["tree"]["sha"]
+    r = http_client.get(f"{api}/git/trees/{tree_sha}", headers=headers,
+                        params={"recursive": "1"}, timeout=30)
+    if r.status_code != 200:
+        raise RuntimeError(f"tree -> {r.status_code}")
+    entries = {e["path"]: e["sha"] for e in r.json().get("tree", []) if e.get("type") == "blob"}
+    return RemoteTree(api, headers, commit_sha, tree_sha, entries)
+
+
+def commit_files(kind: str, files, message: str, branch: str = "main") -> tuple[bool, str]:
     """
-    kind='public'|'private' 레포의 path에 content를 커밋. 성공 시 (True, commit_url).
-    실패 시 (False, 사유). 동시 커밋 충돌(409)은 최신 sha로 최대 3회 재시도.
+    kind='public'|'private' 레포에 여러 파일을 커밋 1개로 반영.
+
+    files: {경로: bytes} 또는 함수(RemoteTree) → {경로: bytes} (시도마다 호출 — 원격 내용과 병합할 때).
+    성공 시 (True, commit_url), 원격과 모두 같으면 커밋 없이 (True, "변경 없음"). 실패 시 (False, 사유).
     """
     token = _token(kind)
     if not token:
         return False, f"토큰 없음({'GH_DATA_TOKEN' if kind == 'private' else 'GH_PAT'})"
 
     repo = PRIVATE_REPO if kind == "private" else PUBLIC_REPO
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Accept": "application/vnd.github+json",
-        "X-GitHub-Api-Version": "2022-11-28",
-    }
-    url = _API.format(repo=repo, path=path)
+    api = _API.format(repo=repo)
+    headers = _headers(token)
 
-    for _ in range(3):
-        # 현재 sha 조회 (없으면 신규 생성)
-        sha = None
+    for _ in range(MAX_ATTEMPTS):
         try:
-            g = requests.get(url, headers=headers, params={"ref": branch}, timeout=20)
-            if g.status_code == 200:
-                sha = g.json().get("sha")
-            elif g.status_code not in (404,):
-                return False, f"GET {g.status_code}: {g.text[:120]}"
+            remote = _remote_tree(api, headers, branch)
+            contents = files(remote) if callable(files) else files
         except Exception as e:
-            return False, f"GET 예외: {e}"
-
-        payload = {
-            "message": message,
-            "branch": branch,
-            "content": base64.b64encode(content).decode(),
-        }
-        if sha:
-            payload["sha"] = sha
+            return False, f"원격 조회 예외: {e}"
+
+        changed = {path: data for path, data in contents.items() if remote.sha(path) != blob_sha(data)}
+        if not changed:
+            return True, "변경 없음"
+
         try:
-            p = requests.put(url, headers=headers, json=payload, timeout=25)
+            tree = []
+            for path, data in changed.items():
+                b = http_client.post(f"{api}/git/blobs", headers=headers, timeout=30,
+                                     json={"content": base64.b64encode(data).decode(), "encoding": "base64"})
+                if b.status_code != 201:
+                    return False, f"blob {path} {b.status_code}: {b.text[:120]}"
+                tree.append({"path": path, "mode": "100644", "type": "blob", "sha": b.json()["sha"]})
+            t = http_client.post(f"{api}/git/trees", headers=headers, timeout=30,
+                                 json={"base_tree": remote.tree_sha, "tree": tree})
+            if t.status_code != 201:
+                return False, f"tree {t.status_code}: {t.text[:120]}"
+            c = http_client.post(f"{api}/git/commits", headers=headers, timeout=30,
+                                 json={"message": message, "tree": t.json()["sha"], "parents": [remote.commit_sha]})
+            if c.status_code != 201:
+                return False, f"commit {c.status_code}: {c.text[:120]}"
+            commit = c.json()
+            u = http_client.patch(f"{api}/git/refs/heads/{branch}", headers=headers, timeout=20,
+                                  json={"sha": commit["sha"], "force": False})
         except Exception as e:
-            return False, f"PUT 예외: {e}"
-
-        if p.status_code in (200, 201):
-            try:
-                return True, p.json().get("commit", {}).get("html_url", repo)
-            except Exception:
-                return True, repo
-        if p.status_code == 409:
-            continue  # sha 충돌 → 재조회 후 재시도
-        return False, f"PUT {p.status_code}: {p.text[:150]}"
-
-    return False, "충돌(409) 재시도 초과"
+            return False, f"커밋 예외: {e}"
+
+        if u.status_code == 200:
+            return True, commit.get("html_url", repo)
+        if u.status_code in (409, 422):
+            continue  # 그사이 브랜치가 앞서감(fast-forward 불가) → 최신 ref로 재시도
+        return False, f"ref {u.status_code}: {u.text[:150]}"
+
+    return False, "충돌(ref 갱신 거절) 재시도 초과"
+
+
+def commit_file(kind: str, path: str, content: bytes, message: str,
+                branch: str = "main") -> tuple[bool, str]:
+    """
+    kind='public'|'private' 레포의 path에 content를 커밋 (commit_files 1파일 버전).
+    성공 시 (True, commit_url), 실패 시 (False, 사유).
+    """
+    return commit_files(kind, {path: content}, message, branch)
@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+"""
+sent_store.py
+발송 이력 저장소 — 일자별 append-only 로그 샤드 + 메모리 인덱스.
+
+기존 sent_articles_cache.json(1만 건, ISO 타임스탬프, url_timestamps + urls 중복 저장)은
+로드·저장 때마다 전체 파싱·재작성했고, 저장 시 타임스탬프 복원을 위해 파일을 다시 읽었다.
+이후 단일 로그(sent_articles.log)로 바꿨지만, 발송 직전 원격 병합은 여전히 로그 끝 수백 KB를 받았다.
+
+  - 파일: data/sent/YYYY-MM-DD.log (발송 epoch의 KST 날짜) — 한 줄에 "epoch\\tURL", 신규 발송분만 덧붙인다.
+    (git diff도 추가된 줄뿐 — .gitattributes의 merge=union으로 동시 push도 충돌 없이 합쳐짐)
+  - 매니페스트: data/sent/manifest.log — 샤드 이름(날짜) 한 줄씩. 새 샤드를 만들 때만 덧붙인다.
+    원격 병합은 매니페스트(수십 바이트)로 있는 샤드를 확인하고 오늘·어제 샤드(수 KB)만 받는다.
+  - 멤버십: 정규화 URL의 64비트 지문 집합(FingerprintSet). URL 문자열은 메모리에 두지 않는다.
+  - TTL 만료: 메모리는 epoch 오름차순 배열 앞부분을 searchsorted로 잘라내는 범위 삭제,
+    파일은 보관 기간이 지난 날짜의 샤드를 통째로 삭제 (줄 단위 필터·재작성 없음).
+  - 증분 재로드: 샤드별로 마지막 읽은 오프셋 이후만 읽는다. 샤드가 줄었거나 교체됐으면(git checkout)
+    그 샤드만 처음부터 다시 읽는다 (이미 아는 지문은 건너뜀).
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from .file_lock import FileLock
+from .fingerprint_set import FingerprintSet, fingerprint, fingerprints
+
+SENT_DIR = os.path.join("data", "sent")
+SENT_LOG_FILE = os.path.join("data", "sent_articles.log")  # 구 단일 로그 (샤드로 이전)
+MANIFEST_NAME = "manifest.log"
+SHARD_SUFFIX = ".log"
+KST = timezone(timedelta(hours=9))
+_SHARD_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def parse_lines(text: str) -> dict:
+    """로그 텍스트 → {URL: epoch} (같은 URL은 가장 이른 epoch 유지)"""
+    out = {}
+    for line in text.splitlines():
+        ts, sep, url = line.partition("\t")
+        if not sep or not url:
+            continue
+        try:
+            epoch = float(ts)
+        except ValueError:
+            continue
+        if url not in out or epoch < out[url]:
+            out[url] = epoch
+    return out
+
+
+def format_lines(entries) -> str:
+    """[(epoch, URL)] → 로그 텍스트"""
+    return "".join(f"{int(epoch)}\t{url}\n" for epoch, url in entries)
+
+
+def shard_name(epoch: float) -> str:
+    """epoch → 샤드 이름 (KST 날짜 YYYY-MM-DD)"""
+    return datetime.fromtimestamp(epoch, KST).strftime("%Y-%m-%d")
+
+
+def recent_shards(days: int = 2, now: float = None) -> list:
+    """최근 days일 샤드 이름 (오늘부터 과거 순)"""
+    now = time.time() if now is None else now
+    return [shard_name(now - i * 86400) for i in range(days)]
+
+
+def parse_manifest(text: str) -> list:
+    """매니페스트 텍스트 → 샤드 이름 목록 (중복 제거·정렬)"""
+    return sorted({line.strip() for line in text.splitlines() if _SHARD_RE.match(line.strip())})
+
+
+def _write_atomic(path: str, data: bytes):
+    folder = os.path.dirname(path) or "."
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=folder, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+class SentStore:
+    """발송 이력 (URL 지문 → 최초 발송 epoch). URL 문자열은 메모리에 두지 않는다."""
+
+    def __init__(self, directory: str = SENT_DIR, ttl_days: float = 90, max_entries: int = 100000):
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, MANIFEST_NAME)
+        self.ttl_seconds = ttl_days * 86400
+        self.max_entries = max_entries
+        self._reset()
+        self._lock = threading.Lock()
+
+    def _reset(self):
+        self._fps = FingerprintSet()
+        self._epochs = np.zeros(0, dtype=np.int64)      # epoch 오름차순 — 만료 범위 삭제용
+        self._order = np.zeros(0, dtype=np.uint64)      # _epochs와 같은 순서의 지문
+        self._files: dict = {}                          # 샤드 이름 → (inode 식별자, 읽은 오프셋)
+
+    def shard_path(self, name: str) -> str:
+        return os.path.join(self.directory, name + SHARD_SUFFIX)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._fps
+
+    def __len__(self) -> int:
+        return len(self._fps)
+
+    def snapshot(self) -> FingerprintSet:
+        """파일 변경분·TTL 반영 후 현재 발송 이력의 지문 집합 사본"""
+        with self._lock:
+            self._refresh()
+            self._expire()
+            return self._fps.copy()
+
+    def manifest(self) -> list:
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return parse_manifest(f.read())
+        except FileNotFoundError:
+            return []
+
+    # ── 읽기 ───────────────────────────────────────────────
+    def _refresh(self):
+        """(락 보유) 샤드별 변경분 반영: 덧붙은 줄만 읽거나, 교체된 샤드는 처음부터"""
+        try:
+            names = [e.name[:-len(SHARD_SUFFIX)] for e in os.scandir(self.directory)
+                     if e.name.endswith(SHARD_SUFFIX) and _SHARD_RE.match(e.name[:-len(SHARD_SUFFIX)])]
+        except FileNotFoundError:
+            return
+        for name in sorted(names):
+            try:
+                st = os.stat(self.shard_path(name))
+            except FileNotFoundError:
+                continue
+            ident = (st.st_ino, st.st_dev)
+            known = self._files.get(name)
+            offset = known[1] if known and known[0] == ident and st.st_size >= known[1] else 0
+            if st.st_size == offset:
+                self._files[name] = (ident, offset)
+                continue
+            with open(self.shard_path(name), "rb") as f:
+                f.seek(offset)
+                chunk = f.read()
+            end = chunk.rfind(b"\n") + 1  # 쓰는 중인 마지막 줄은 다음에
+            self._files[name] = (ident, offset + max(end, 0))
+            if end <= 0:
+                continue
+            entries = parse_lines(chunk[:end].decode("utf-8", errors="replace"))
+            self._merge(np.fromiter(entries.values(), dtype=np.int64, count=len(entries)),
+                        fingerprints(entries.keys()))
+
+    def _merge(self, epochs: np.ndarray, fps: np.ndarray):
+        """(락 보유) 처음 보는 지문만 반영 — 대부분 시간순 덧붙임이라 배열 끝에 이어 붙인다"""
+        if len(fps) == 0:
+            return
+        _, first = np.unique(fps, return_index=True)
+        keep = np.zeros(len(fps), dtype=bool)
+        keep[first] = True
+        keep &= ~self._fps.contains_fingerprints(fps)
+        epochs, fps = epochs[keep], fps[keep]
+        if len(fps) == 0:
+            return
+        self._fps.add_fingerprints(fps)
+        self._epochs = np.concatenate([self._epochs, epochs])
+        self._order = np.concatenate([self._order, fps])
+        if len(self._epochs) > 1 and (np.diff(self._epochs) < 0).any():
+            idx = np.argsort(self._epochs, kind="stable")
+            self._epochs, self._order = self._epochs[idx], self._order[idx]
+
+    def _expire(self):
+        """(락 보유) TTL·최대 건수 초과분을 epoch 배열 앞에서 범위 삭제"""
+        cut = int(np.searchsorted(self._epochs, int(time.time() - self.ttl_seconds)))
+        cut = max(cut, len(self._epochs) - self.max_entries)
+        if cut <= 0:
+            return 0
+        self._fps.remove_fingerprints(self._order[:cut])
+        self._epochs, self._order = self._epochs[cut:], self._order[cut:]
+        return cut
+
+    # ── 쓰기 ───────────────────────────────────────────────
+    def _append(self, entries: list):
+        """(락 보유) [(epoch, URL)] 를 날짜별 샤드 끝에 쓰고 메모리에 반영. 새 샤드는 매니페스트에 등록."""
+        os.makedirs(self.directory, exist_ok=True)
+        by_shard: dict = {}
+        for epoch, url in entries:
+            by_shard.setdefault(shard_name(epoch), []).append((epoch, url))
+        created = []
+        for name, rows in by_shard.items():
+            path = self.shard_path(name)
+            if not os.path.exists(path):
+                created.append(name)
+            with open(path, "ab") as f:
+                f.write(format_lines(rows).encode("utf-8"))
+            st = os.stat(path)
+            self._files[name] = ((st.st_ino, st.st_dev), st.st_size)
+        if created:
+            listed = set(self.manifest())
+            new = [n for n in sorted(created) if n not in listed]
+            if new:
+                with open(self.manifest_path, "a", encoding="utf-8") as f:
+                    f.write("".join(f"{n}\n" for n in new))
+        self._merge(np.array([int(e) for e, _ in entries], dtype=np.int64),
+                    fingerprints(u for _, u in entries))
+
+    def _drop_expired_shards(self):
+        """(락 보유) 보관 기간이 지난 날짜의 샤드 파일을 통째로 삭제하고 매니페스트에서 제외"""
+        oldest = shard_name(time.time() - self.ttl_seconds)
+        names = set(self.manifest()) | set(self._files)
+        expired = sorted(n for n in names if n < oldest)
+        if not expired:
+            return 0
+        for name in expired:
+            try:
+                os.remove(self.shard_path(name))
+            except FileNotFoundError:
+                pass
+            self._files.pop(name, None)
+        kept = [n for n in self.manifest() if n >= oldest]
+        _write_atomic(self.manifest_path, "".join(f"{n}\n" for n in kept).encode("utf-8"))
+        return len(expired)
+
+    def add(self, urls) -> int:
+        """처음 보는 URL만 현재 epoch로 덧붙인다 (원본·정규화 URL은 같은 지문이라 1줄). 덧붙인 건수 반환."""
+        with FileLock(self.directory + ".lock"):
+            with self._lock:
+                self._refresh()
+                now = int(time.time())
+                fresh, seen = [], set()
+                for u in dict.fromkeys(urls):
+                    if not u or u in self._fps:
+                        continue
+                    fp = fingerprint(u)
+                    if fp not in seen:
+                        seen.add(fp)
+                        fresh.append((now, u))
+                if fresh:
+                    self._append(fresh)
+                self._expire()
+                self._drop_expired_shards()
+                return len(fresh)
+
+    def merge_text(self, text: str) -> int:
+        """다른 발송 주체의 로그(원격 샤드 등)를 합쳐 이쪽에 없는 줄만 해당 날짜 샤드에 덧붙인다. 추가 건수 반환."""
+        remote = parse_lines(text)
+        with FileLock(self.directory + ".lock"):
+            with self._lock:
+                self._refresh()
+                cutoff = time.time() - self.ttl_seconds
+                fresh, seen = [], set()
+                for u, e in remote.items():
+                    if e < cutoff or u in self._fps:
+                        continue
+                    fp = fingerprint(u)
+                    if fp not in seen:
+                        seen.add(fp)
+                        fresh.append((e, u))
+                if not fresh:
+                    return 0
+                fresh.sort()
+                self._append(fresh)
+                return len(fresh)
+
+    def merge_manifest(self, text: str) -> int:
+        """원격 매니페스트의 샤드 이름을 합친다 (보관 기간 안의 이름만). 추가 건수 반환."""
+        oldest = shard_name(time.time() - self.ttl_seconds)
+        with FileLock(self.directory + ".lock"):
+            listed = set(self.manifest())
+            new = [n for n in parse_manifest(text) if n >= oldest and n not in listed]
+            if new:
+                os.makedirs(self.directory, exist_ok=True)
+                with open(self.manifest_path, "a", encoding="utf-8") as f:
+                    f.write("".join(f"{n}\n" for n in new))
+            return len(new)
+
+
+def migrate_from_json(json_path: str, log_path: str = SENT_LOG_FILE) -> int:
+    """구 sent_articles_cache.json(url_timestamps ISO 또는 urls 목록) → 단일 로그 변환 (로그가 없을 때만)"""
+    if os.path.exists(log_path) or not os.path.exists(json_path):
+        return 0
+    with open(json_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    now = time.time()
+    entries = []
+    for url, iso in data.get("url_timestamps", {}).items():
+        try:
+            entries.append((datetime.fromisoformat(iso).timestamp(), url))
+        except Exception:
+            entries.append((now, url))
+    if not entries:
+        entries = [(now, url) for url in data.get("urls", [])]
+    entries.sort()
+    _write_atomic(log_path, format_lines(entries).encode("utf-8"))
+    return len(entries)
+
+
+def migrate_from_log(log_path: str = SENT_LOG_FILE, directory: str = SENT_DIR) -> int:
+    """구 단일 로그(sent_articles.log) → 일자별 샤드 + 매니페스트 (매니페스트가 없을 때만), 이전 후 로그 삭제"""
+    manifest_path = os.path.join(directory, MANIFEST_NAME)
+    if os.path.exists(manifest_path) or not os.path.exists(log_path):
+        return 0
+    with open(log_path, "r", encoding="utf-8", errors="replace") as f:
+        entries = sorted((e, u) for u, e in parse_lines(f.read()).items())
+    by_shard: dict = {}
+    for epoch, url in entries:
+        by_shard.setdefault(shard_name(epoch), []).append((epoch, url))
+    for name, rows in by_shard.items():
+        _write_atomic(os.path.join(directory, name + SHARD_SUFFIX), format_lines(rows).encode("utf-8"))
+    _write_atomic(manifest_path, "".join(f"{n}\n" for n in sorted(by_shard)).encode("utf-8"))
+    os.remove(log_path)
+    return len(entries)
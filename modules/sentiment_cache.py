@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+sentiment_cache.py
+기사 감성 판정 캐시 (SQLite, 프로세스·실행 간 공유, 크기 상한 + LRU/TTL).
+
+news_collector._sentiment_cache(모듈 dict)는 heartbeat 라운드마다 새 프로세스라 매번 비었고
+(규칙으로 애매한 'unk' 기사는 검색 결과에서 빠질 때까지 3분마다 LLM 재호출),
+Streamlit 서버에서는 상한 없이 커졌다.
+
+  - 키: 정규화 URL + 제목|요약 해시 (같은 URL이라도 제목·요약이 바뀌면 다시 판정)
+  - 저장: data/sentiment_cache.db (WAL 모드 — Actions 프로세스와 Streamlit 스레드가 동시에 읽고 씀)
+  - TTL: 판정 시각 기준 ttl_days. LLM 실패로 기본값(pos)을 넣은 항목은 DEFAULT_TTL_SECONDS만 유지해 재시도.
+  - LRU: 적중 시 last_used 갱신(LRU_TOUCH_SECONDS에 1회), 상한 초과분은 last_used 오래된 순 삭제
+  - 프로세스 안에서는 작은 메모리 LRU가 앞단에서 SQLite 조회를 줄인다.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from .fingerprint_set import canonical_url
+
+CACHE_FILE = os.path.join("data", "sentiment_cache.db")
+DEFAULT_TTL_SECONDS = 3600      # source="default"(LLM 실패 기본값) 항목 유지 시간
+LRU_TOUCH_SECONDS = 3600        # 적중 시 last_used 갱신 최소 간격 (읽기마다 쓰지 않음)
+MEMORY_ENTRIES = 2048           # 프로세스 내 앞단 LRU 크기
+
+
+def cache_key(url: str, title: str, summary: str) -> str:
+    """정규화 URL + 제목|요약 md5 앞 16자리"""
+    digest = hashlib.md5(f"{title}|{summary}".strip().encode("utf-8")).hexdigest()[:16]
+    return f"{canonical_url(url) if url else ''}|{digest}"
+
+
+class SentimentCache:
+    """감성 판정 캐시. get/put은 스레드 안전, 파일은 여러 프로세스가 공유."""
+
+    def __init__(self, path: str = CACHE_FILE, max_entries: int = 20000, ttl_days: float = 30):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_days * 86400
+        self._lock = threading.Lock()
+        self._memory: OrderedDict = OrderedDict()   # key → (sentiment, source, created)
+        self._conn = None
+        self._puts = 0
+
+    def _db(self) -> sqlite3.Connection:
+        """(락 보유) 지연 연결 — 최초 사용 시 테이블 생성"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sentiment ("
+                " key TEXT PRIMARY KEY, sentiment TEXT NOT NULL, source TEXT NOT NULL,"
+                " created REAL NOT NULL, last_used REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_sentiment_last_used ON sentiment(last_used)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _fresh(self, source: str, created: float, now: float) -> bool:
+        ttl = DEFAULT_TTL_SECONDS if source == "default" else self.ttl_seconds
+        return now - created <= ttl
+
+    def _remember(self, key: str, value: tuple):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        if len(self._memory) > MEMORY_ENTRIES:
+            self._memory.popitem(last=False)
+
+    def get(self, url: str, title: str, summary: str):
+        """캐시된 판정("pos"/"neg") 또는 None"""
+        return self.get_key(cache_key(url, title, summary))
+
+    def get_key(self, key: str):
+        now = time.time()
+        try:
+            with self._lock:
+                hit = self._memory.get(key)
+                if hit is not None and self._fresh(hit[1], hit[2], now):
+                    self._memory.move_to_end(key)
+                    return hit[0]
+                db = self._db()
+                row = db.execute(
+                    "SELECT sentiment, source, created, last_used FROM sentiment WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None or not self._fresh(row[1], row[2], now):
+                    self._memory.pop(key, None)
+                    return None
+                if now - row[3] > LRU_TOUCH_SECONDS:
+                    db.execute("UPDATE sentiment SET last_used = ? WHERE key = ?", (now, key))
+                    db.commit()
+                self._remember(key, (row[0], row[1], row[2]))
+                return row[0]
+        except sqlite3.Error as e:
+            print(f"[WARNING] 감성 캐시 조회 실패: {e}")
+            return None
+
+    def put(self, url: str, title: str, summary: str, sentiment: str, source: str = "rule"):
+        """판정 저장. source: rule(규칙) / llm / default(LLM 실패 기본값 — 짧게 유지)"""
+        self.put_key(cache_key(url, title, summary), sentiment, source)
+
+    def put_key(self, key: str, sentiment: str, source: str = "rule"):
+        now = time.time()
+        try:
+            with self._lock:
+                db = self._db()
+                db.execute(
+                    "INSERT OR REPLACE INTO sentiment (key, sentiment, source, created, last_used)"
+                    " VALUES (?, ?, ?, ?, ?)", (key, sentiment, source, now, now)
+                )
+                self._puts += 1
+                if self._puts % 100 == 1:
+                    self._evict(db, now)
+                db.commit()
+                self._remember(key, (sentiment, source, now))
+        except sqlite3.Error as e:
+            print(f"[WARNING] 감성 캐시 저장 실패: {e}")
+
+    def _evict(self, db: sqlite3.Connection, now: float):
+        """(락 보유) TTL 지난 항목 삭제 + 상한 초과분은 last_used 오래된 순 삭제"""
+        db.execute("DELETE FROM sentiment WHERE created < ?", (now - self.ttl_seconds,))
+        db.execute("DELETE FROM sentiment WHERE source = 'default' AND created < ?",
+                   (now - DEFAULT_TTL_SECONDS,))
+        count = db.execute("SELECT COUNT(*) FROM sentiment").fetchone()[0]
+        if count > self.max_entries:
+            db.execute(
+                "DELETE FROM sentiment WHERE key IN ("
+                " SELECT key FROM sentiment ORDER BY last_used LIMIT ?)", (count - self.max_entries,)
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db().execute("SELECT COUNT(*) FROM sentiment").fetchone()[0]
+
+
+_cache: SentimentCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> SentimentCache:
+    """프로세스 공유 캐시"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = SentimentCache()
+    return _cache
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+story_clusters.py
+보도자료 전재 기사(같은 내용, 매체마다 조금씩 다른 제목)를 하나의 '스토리'로 묶는 근사 중복 인덱스.
+
+detect_new_articles는 URL·제목|날짜 해시로만 중복을 걸러, 보도자료 하나가 수십 개 매체에
+실리면 매체마다 텔레그램 메시지가 1건씩 나가 MAX_MESSAGES_PER_RUN을 다 써버렸다.
+
+  - 지문: 제목+요약을 casefold·공백/기호 제거한 뒤 글자 3-gram(shingle) 집합의 MinHash (NUM_PERM개)
+  - LSH: 서명을 BANDS개 밴드로 나눠 밴드값 → 기사 키 버킷(dict). 한 밴드라도 같은 기사만 후보로 보고
+    서명 일치율(≈ Jaccard 유사도)이 SIMILARITY 이상이면 가장 비슷한 기사의 클러스터에 넣는다.
+    기사 1건 추가 = 밴드 조회 BANDS번 + 후보 비교 → 전체 기사 수와 무관
+  - 증분: add()는 이미 본 키를 다시 계산하지 않는다. prune()으로 WINDOW_HOURS 밖 기사를 버킷에서 뺀다.
+  - 클러스터 id는 처음 들어온 기사의 키. 나중 기사가 두 클러스터에 걸쳐도 합치지 않는다(가장 비슷한 쪽).
+"""
+from __future__ import annotations
+
+import re
+import threading
+import zlib
+
+import numpy as np
+
+SHINGLE_SIZE = 3
+NUM_PERM = 32
+BANDS = 8            # 8밴드 × 4행 → Jaccard 약 0.6에서 후보가 될 확률 50%, 0.8이면 96%
+SIMILARITY = 0.5     # 서명 일치율 하한 (후보 검증)
+WINDOW_HOURS = 24    # 이 시간보다 오래된 기사는 묶음 대상에서 제외
+
+_ROWS = NUM_PERM // BANDS
+_PRIME = (1 << 31) - 1
+_rng = np.random.RandomState(0x5EED)
+_A = _rng.randint(1, _PRIME, NUM_PERM).astype(np.int64)
+_B = _rng.randint(0, _PRIME, NUM_PERM).astype(np.int64)
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+
+def shingles(text) -> set:
+    """정규화 텍스트의 글자 SHINGLE_SIZE-gram 집합"""
+    norm = _NON_WORD_RE.sub("", str(text or "").casefold())
+    if len(norm) <= SHINGLE_SIZE:
+        return {norm} if norm else set()
+    return {norm[i:i + SHINGLE_SIZE] for i in range(len(norm) - SHINGLE_SIZE + 1)}
+
+
+def signature(text):
+    """MinHash 서명 (int64 배열, 길이 NUM_PERM). 텍스트가 비면 None"""
+    grams = shingles(text)
+    if not grams:
+        return None
+    h = np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.int64, count=len(grams)) % _PRIME
+    return ((h[:, None] * _A + _B) % _PRIME).min(axis=0)
+
+
+def similarity(sig_a, sig_b) -> float:
+    """서명 일치율 (Jaccard 유사도 추정치)"""
+    return float(np.count_nonzero(sig_a == sig_b)) / NUM_PERM
+
+
+def _bands(sig) -> list:
+    return [sig[b * _ROWS:(b + 1) * _ROWS].tobytes() for b in range(BANDS)]
+
+
+class StoryIndex:
+    """기사 키 → 스토리 클러스터 id. add/prune는 스레드 안전."""
+
+    def __init__(self, similarity_threshold: float = SIMILARITY):
+        self.similarity_threshold = similarity_threshold
+        self._lock = threading.Lock()
+        self._sigs: dict = {}       # key → 서명 (텍스트가 빈 기사는 없음)
+        self._times: dict = {}      # key → 발행 시각 (prune용, 모르면 None)
+        self._cluster: dict = {}    # key → 클러스터 id
+        self._buckets = [dict() for _ in range(BANDS)]   # 밴드값 → [key, ...]
+
+    def add(self, key: str, text, published=None) -> str:
+        """기사를 넣고 클러스터 id 반환 (이미 넣은 키면 기존 값)"""
+        with self._lock:
+            cid = self._cluster.get(key)
+            if cid is not None:
+                return cid
+            sig = signature(text)
+            cid = key
+            if sig is not None:
+                bands = _bands(sig)
+                best, best_sim, seen = None, self.similarity_threshold, set()
+                for bucket, band in zip(self._buckets, bands):
+                    for other in bucket.get(band, ()):
+                        if other in seen:
+                            continue
+                        seen.add(other)
+                        sim = similarity(self._sigs[other], sig)
+                        if sim >= best_sim:
+                            best, best_sim = other, sim
+                if best is not None:
+                    cid = self._cluster[best]
+                self._sigs[key] = sig
+                for bucket, band in zip(self._buckets, bands):
+                    bucket.setdefault(band, []).append(key)
+            self._cluster[key] = cid
+            self._times[key] = published
+            return cid
+
+    def cluster_of(self, key: str):
+        return self._cluster.get(key)
+
+    def prune(self, cutoff) -> int:
+        """발행 시각이 cutoff 이전인 기사를 제거 (버킷 재구성). 제거 건수 반환"""
+        with self._lock:
+            old = [k for k, t in self._times.items() if t is not None and t < cutoff]
+            if not old:
+                return 0
+            for key in old:
+                self._times.pop(key, None)
+                self._cluster.pop(key, None)
+                self._sigs.pop(key, None)
+            self._buckets = [dict() for _ in range(BANDS)]
+            for key, sig in self._sigs.items():
+                for bucket, band in zip(self._buckets, _bands(sig)):
+                    bucket.setdefault(band, []).append(key)
+            return len(old)
+
+    def __contains__(self, key) -> bool:
+        return key in self._cluster
+
+    def __len__(self) -> int:
+        return len(self._cluster)
+
+
+_index: StoryIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_index() -> StoryIndex:
+    """프로세스 공유 인덱스 (Streamlit 서버에서는 라운드 사이에 유지)"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = StoryIndex()
+    return _index
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""
+telegram_sender.py
+텔레그램 발송 엔진 — 토큰 버킷으로 텔레그램이 허용하는 속도까지 바로 보낸다.
+
+기존 발송 루프는 1건씩 보내고 성공 후 2초·실패 후 0.5초를 고정으로 쉬었으며, 1회 10건 상한 때문에
+보도자료 30건 몰림은 heartbeat 3라운드(약 9분)에 걸쳐 나갔다. 429 retry_after는 라운드 전체를 재웠다.
+
+  - 채팅별 버킷: 초당 CHAT_RATE건(버스트 CHAT_BURST). 그룹·채널(chat_id가 '-'로 시작)은 분당
+    GROUP_PER_MINUTE건 버킷을 하나 더 통과해야 한다. 봇 전체는 초당 GLOBAL_RATE건.
+  - 토큰을 받은 메시지는 스레드 풀에서 바로 전송. 병렬은 채팅 간에만 — 같은 채팅은 앞 메시지 응답을
+    받은 뒤에 다음 메시지를 보내(채팅당 전송 중 1건) 도착 순서가 대기열 순서(우선순위·부정 먼저)와 같다.
+  - 429: 그 채팅 버킷만 retry_after초 막고 메시지를 대기열 맨 앞에 다시 넣는다(다른 채팅은 계속).
+  - 메시지별 마감: 대기열에 들어온 뒤 message_deadline초 안에 보내지 못하면 이번 라운드는
+    'deferred'(시도 안 함)로 돌려준다 → 다음 라운드에 재시도. budget은 deliver() 전체 마감.
+
+결과 상태: sent / rate_limited(마감 전 재시도 불가) / failed(HTTP 오류) / timeout / error(네트워크) / deferred
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import requests
+
+from . import http_client
+
+API_URL = "https://api.telegram.org/bot{token}/sendMessage"
+CHAT_RATE = 1.0          # 채팅당 초당 메시지 (텔레그램 권장 한도)
+CHAT_BURST = 1           # 채팅당 순간 버스트 (초당 1건 한도 그대로)
+GROUP_PER_MINUTE = 20    # 그룹·채널 분당 메시지 한도
+GLOBAL_RATE = 30.0       # 봇 전체 초당 메시지 한도
+MAX_WORKERS = 4          # 동시 전송 수 (http_client의 api.telegram.org 동시성 상한과 같음)
+MESSAGE_DEADLINE = 60.0  # 메시지별 마감 (초)
+DEFAULT_RETRY_AFTER = 5  # 429에 retry_after가 없을 때 대기 (초)
+
+Outcome = namedtuple("Outcome", "status code detail")
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷 (rate: 초당 충전량, capacity: 최대 버스트). block()으로 일시 정지."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._stamp = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+
+    def wait_time(self, now: float = None) -> float:
+        """토큰 1개를 쓸 수 있을 때까지 남은 초 (0이면 즉시)"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._refill(now)
+            blocked = max(0.0, self._blocked_until - now)
+            short = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+            return max(blocked, short)
+
+    def take(self):
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+
+    def block(self, seconds: float):
+        """seconds 동안 토큰 지급 중지 (429 retry_after), 재개 시 버스트 없이 시작"""
+        with self._lock:
+            now = time.monotonic()
+            self._blocked_until = max(self._blocked_until, now + seconds)
+            self._tokens = 0.0
+            self._stamp = self._blocked_until
+
+
+class _Job:
+    __slots__ = ("key", "chat_id", "payload", "deadline")
+
+    def __init__(self, key, chat_id, payload, deadline):
+        self.key = key
+        self.chat_id = chat_id
+        self.payload = payload
+        self.deadline = deadline
+
+
+class DeliveryEngine:
+    """봇 토큰 1개에 대한 발송기. 버킷은 인스턴스 수명 동안 유지(Streamlit 서버에서는 라운드 간 공유)."""
+
+    def __init__(self, bot_token: str, max_workers: int = MAX_WORKERS,
+                 message_deadline: float = MESSAGE_DEADLINE, post=None):
+        self.api_url = API_URL.format(token=bot_token)
+        self.max_workers = max_workers
+        self.message_deadline = message_deadline
+        self._post = post or http_client.post
+        self._global = TokenBucket(GLOBAL_RATE, GLOBAL_RATE)
+        self._chats: dict = {}   # chat_id → [TokenBucket, ...] (채팅 버킷이 맨 앞)
+        self._lock = threading.Lock()
+
+    def _buckets(self, chat_id) -> list:
+        with self._lock:
+            buckets = self._chats.get(chat_id)
+            if buckets is None:
+                buckets = [TokenBucket(CHAT_RATE, CHAT_BURST)]
+                if str(chat_id).startswith("-"):
+                    buckets.append(TokenBucket(GROUP_PER_MINUTE / 60.0, GROUP_PER_MINUTE))
+                self._chats[chat_id] = buckets
+            return buckets
+
+    def _send(self, job: _Job) -> Outcome:
+        response = None
+        read_timeout = max(1.0, min(10.0, job.deadline - time.monotonic()))
+        try:
+            response = self._post(self.api_url, json=job.payload, timeout=(3, read_timeout))
+            if response.status_code == 200:
+                return Outcome("sent", 200, None)
+            if response.status_code == 429:
+                retry_after = None
+                try:
+                    retry_after = response.json().get("parameters", {}).get("retry_after")
+                except Exception:
+                    pass
+                return Outcome("rate_limited", 429, float(retry_after or DEFAULT_RETRY_AFTER))
+            return Outcome("failed", response.status_code, response.text[:200])
+        except requests.exceptions.Timeout:
+            return Outcome("timeout", None, None)
+        except requests.exceptions.RequestException as e:
+            return Outcome("error", None, str(e))
+        except Exception as e:
+            return Outcome("error", None, f"{type(e).__name__}: {e}")
+        finally:
+            if response is not None:
+                response.close()
+
+    def deliver(self, messages, budget: float = None):
+        """
+        messages: [(key, chat_id, payload), ...] (보낼 순서대로)
+        완료되는 순서대로 (key, Outcome)를 호출 스레드에 yield — 상태 갱신은 호출자 스레드에서.
+        """
+        start = time.monotonic()
+        run_end = start + budget if budget else float("inf")
+        queue = deque(_Job(key, chat_id, payload, min(start + self.message_deadline, run_end))
+                      for key, chat_id, payload in messages)
+        inflight: dict = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while queue or inflight:
+                now = time.monotonic()
+                # 전송 중인 채팅은 응답이 올 때까지 보류 (같은 채팅 메시지가 겹쳐 날아가면 도착 순서가 뒤바뀜)
+                pause, held, keep = None, {j.chat_id for j in inflight.values()}, deque()
+                while queue:
+                    job = queue.popleft()
+                    if now >= job.deadline:
+                        yield job.key, Outcome("deferred", None, "deadline")
+                        continue
+                    if job.chat_id in held or len(inflight) >= self.max_workers:
+                        keep.append(job)
+                        continue
+                    buckets = [self._global] + self._buckets(job.chat_id)
+                    delay = max(b.wait_time(now) for b in buckets)
+                    if delay > 0:
+                        held.add(job.chat_id)   # 같은 채팅의 뒤 메시지는 앞지르지 않음
+                        keep.append(job)
+                        pause = delay if pause is None else min(pause, delay)
+                        continue
+                    for b in buckets:
+                        b.take()
+                    inflight[pool.submit(self._send, job)] = job
+                    held.add(job.chat_id)
+                queue = keep
+                if queue:
+                    nearest = min(j.deadline for j in queue) - now
+                    pause = nearest if pause is None else min(pause, nearest)
+                if not inflight:
+                    if pause is not None and pause > 0:
+                        time.sleep(pause)
+                    continue
+                done, _ = wait(inflight, timeout=max(pause, 0.0) if pause is not None else None,
+                               return_when=FIRST_COMPLETED)
+                for fut in done:
+                    job = inflight.pop(fut)
+                    outcome = fut.result()
+                    if outcome.status == "rate_limited":
+                        self._buckets(job.chat_id)[0].block(outcome.detail)
+                        if time.monotonic() + outcome.detail < job.deadline:
+                            queue.appendleft(job)   # 풀리면 이 메시지부터 다시
+                            continue
+                    yield job.key, outcome
+
+
+_engines: dict = {}
+_engines_lock = threading.Lock()
+
+
+def get_engine(bot_token: str) -> DeliveryEngine:
+    """봇 토큰별 공유 엔진 (버킷 상태를 호출 간 유지)"""
+    with _engines_lock:
+        engine = _engines.get(bot_token)
+        if engine is None:
+            engine = _engines[bot_token] = DeliveryEngine(bot_token)
+        return engine
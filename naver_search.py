@@ -9,6 +9,8 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
+from modules import http_client
+
 class NaverSearchAPI:
     """네이버 검색 API 클래스"""
     
@@ -48,7 +50,7 @@ class NaverSearchAPI:
         
         response = None
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = http_client.get(url, headers=self.headers, params=params)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -79,7 +81,7 @@ class NaverSearchAPI:
         
         response = None
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = http_client.get(url, headers=self.headers, params=params)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -7,6 +7,7 @@ import re
 import time
 import urllib.parse
 import json
+from concurrent.futures import Future
 from datetime import datetime, timezone, timedelta
 from html import unescape
 import pandas as pd
@@ -14,6 +15,11 @@ import requests
 import xml.etree.ElementTree as ET
 from bs4 import BeautifulSoup
 
+from modules import (http_client, quota_ledger, article_index, sent_store, pending_journal, lexicon,
+                     sentiment_cache, micro_batcher, media_registry, news_schema, news_archive, story_clusters,
+                     telegram_sender, alert_queue)
+from modules.fingerprint_set import FingerprintSet, canonical_url, fingerprints
+
 # 환경변수 로드
 try:
     from dotenv import load_dotenv
@@ -53,15 +59,31 @@ print = safe_print
 
 DATA_FOLDER = os.path.abspath("data")
 NEWS_DB_FILE = os.path.join(DATA_FOLDER, "news_monitor.csv")
-SENT_CACHE_FILE = os.path.join(DATA_FOLDER, "sent_articles_cache.json")
-PENDING_QUEUE_FILE = os.path.join(DATA_FOLDER, "pending_articles.json")  # Pending 큐 파일
+SENT_CACHE_FILE = os.path.join(DATA_FOLDER, "sent_articles_cache.json")  # 구 형식 (sent_articles.log로 이전)
+SENT_LOG_FILE = os.path.join(DATA_FOLDER, "sent_articles.log")  # 구 단일 로그 (data/sent/ 샤드로 이전)
+SENT_DIR = os.path.join(DATA_FOLDER, "sent")  # 발송 이력 일자별 샤드 (YYYY-MM-DD.log, epoch\tURL) + manifest.log
+PENDING_QUEUE_FILE = os.path.join(DATA_FOLDER, "pending_articles.json")  # Pending 큐 스냅샷
+PENDING_LOG_FILE = os.path.join(DATA_FOLDER, "pending_articles.log")  # Pending 큐 이벤트 저널
 API_USAGE_FILE = os.path.join(DATA_FOLDER, "api_usage.json")
 STATE_FILE = os.path.join(DATA_FOLDER, "monitor_state.json")
-MAX_SENT_CACHE = 10000  # 캐시 크기 제한 (약 4-5일분 커버, 기존 500개에서 확대)
+WATERMARK_FILE = os.path.join(DATA_FOLDER, "keyword_watermarks.json")  # 키워드별 증분 수집 기준점
+MAX_SENT_CACHE = 100000  # 발송 이력 최대 건수 (append-only 로그라 크기가 커도 로드·저장 비용 일정)
+SENT_CACHE_TTL_DAYS = 90  # 발송 이력 보관 기간 (기존 7일 → 약 3개월)
+REMOTE_SENT_SHARDS = 2  # 원격 발송 이력 병합 시 받을 최근 샤드 수 (오늘·어제)
 MAX_API_CALLS_PER_DAY = 25000  # 네이버 API 일일 할당량
 API_QUOTA_WARNING_THRESHOLD = 20000  # 80% 도달 시 경고 (25000의 80%)
 MAX_PENDING_RETRY = 5  # Pending 큐 최대 재시도 횟수
 PENDING_TTL_HOURS = 48  # Pending 큐 TTL (48시간)
+MAX_MESSAGES_PER_RUN = 60  # 1회 실행당 최대 발송 건수 (속도는 telegram_sender 토큰 버킷이 조절, 이상 상황 안전판)
+SEND_BUDGET_SECONDS = 90  # 1회 발송 전체 마감 (heartbeat 라운드 timeout 240초 안)
+DIGEST_THRESHOLD = int(os.getenv("TELEGRAM_DIGEST_THRESHOLD", "8"))  # 발송 대상이 이 건수 이상이면 묶음 메시지
+DIGEST_MAX_CHARS = 4096  # 텔레그램 메시지 최대 길이
+OUTLETS_SHOWN = 5  # 묶인 스토리 알림에 이름을 보여줄 다른 매체 수
+WATERMARK_MAX_URLS = 300  # 키워드별 워터마크에 보관할 최근 URL 수
+WATERMARK_MAX_PAGES = 5  # 증분 수집 시 키워드당 최대 페이지 수 (50건/페이지, 버스트 시에만 2페이지 이상)
+RSS_CACHE_FILE = os.path.join(DATA_FOLDER, "rss_cache.json")  # Google RSS 피드별 ETag/Last-Modified + 본 기사
+RSS_SEEN_MAX = 200  # 피드별 보관할 최근 기사 URL 수
+RSS_SEEN_STOP_RUN = 5  # 이미 본 기사가 연속 N건이면 파싱 중단 (검색 피드는 엄격한 시간순이 아님)
 
 # 모니터링 키워드 설정 (단일 진실 공급원)
 KEYWORDS = [
@@ -110,6 +132,54 @@ EXCLUDE_KEYWORDS = [
     "포스코인터",
 ]
 
+# 규칙 기반 감성 분석 사전
+# 부정 키워드 (카톡 보고에서 '즉보/위기'로 다뤄진 패턴 보강)
+NEGATIVE_KEYWORDS = [
+    "의혹", "논란", "수사", "고발", "제재", "사고", "폭발", "중단", "실패",
+    "적자", "급락", "불법", "배임", "횡령", "담합", "위반", "처벌", "파산",
+    "해고", "감축", "적발", "기소", "벌금", "손실", "하락", "취소", "철회",
+    "문제", "우려", "비판", "반발", "갈등", "충돌", "부실", "지연",
+    # ── 안전·재해 (최고 위기) ──
+    "사망", "중대재해", "붕괴", "추락", "화재", "부상", "재해",
+    # ── 수사·규제·제재 ──
+    "압수수색", "영업정지", "과징금", "구속", "현장조사", "행정처분", "리콜",
+    # ── 노사 ──
+    "파업", "쟁의", "점거", "직고용", "노사갈등",
+    # ── 재무·신용 ──
+    "디폴트", "부도", "회생", "워크아웃", "강등", "기한이익상실", "EOD",
+    # ── 평판·기타 ──
+    "소송", "결함", "리스크", "늑장", "불성실공시", "오염"
+]
+
+# 긍정 키워드 (최소 세트)
+POSITIVE_KEYWORDS = [
+    "협력", "확대", "투자", "수주", "계약", "진출", "성과", "개선", "상승",
+    "혁신", "출시", "수상", "선정", "채택", "증가", "성장", "달성", "수익",
+    "개발", "획득", "체결", "증설", "확보", "기여", "창출", "도입", "강화"
+]
+
+# 부동산 기사 제외어 (키워드 필터) — '포스코' 범용 버킷은 인테리어 기사도 제외
+REAL_ESTATE_WORDS = ["분양", "청약", "입주", "재건축", "정비구역"]
+POSCO_EXTRA_EXCLUDE_WORDS = ["인테리어"]
+
+# 키워드 필터에서 대소문자를 구분하는 그룹 (기존 필터는 제외어·부동산어·키워드 토큰을 그대로 비교,
+# 'posco' 포함 여부만 소문자 비교) — 감성(neg/pos)은 대소문자 무시
+FILTER_CASE_SENSITIVE_GROUPS = ["exclude", "realestate", "interior"] + \
+    [f"kw:{tok}" for kw in KEYWORDS for tok in kw.split()]
+
+# 감성 사전·키워드 필터 규칙을 한 매처로 컴파일 (import 시 1회)
+# 그룹: neg/pos(감성), exclude(EXCLUDE_KEYWORDS), realestate·interior(부동산 제외어),
+#       brand('포스코' 버킷 포함어), kw:<토큰>(키워드별 포함 규칙)
+LEXICON = lexicon.Lexicon({
+    "neg": NEGATIVE_KEYWORDS,
+    "pos": POSITIVE_KEYWORDS,
+    "exclude": EXCLUDE_KEYWORDS,
+    "realestate": REAL_ESTATE_WORDS,
+    "interior": POSCO_EXTRA_EXCLUDE_WORDS,
+    "brand": ["포스코", "posco"],
+    **{f"kw:{tok}": [tok] for kw in KEYWORDS for tok in kw.split()},
+}, case_sensitive=FILTER_CASE_SENSITIVE_GROUPS)
+
 # 수집 설정
 MAX_ITEMS_PER_RUN = 450  # 키워드 확장(약 33개)에 맞춰 상향 — 키워드당 약 13건
 
@@ -142,134 +212,57 @@ def _naver_headers():
     return {"X-Naver-Client-Id": cid, "X-Naver-Client-Secret": csec}
 
 
+_BOLD_TAG_RE = re.compile(r"</?b>")
+_WHITESPACE_RE = re.compile(r"\s+")
+NAVER_PUBDATE_FORMAT = "%a, %d %b %Y %H:%M:%S %z"  # RFC-822 (예: Mon, 06 Jan 2025 09:30:00 +0900)
+
+
 def _clean_text(s: str) -> str:
     """HTML 태그 및 공백 정리"""
     if not s:
         return ""
     s = unescape(s)
-    s = re.sub(r"</?b>", "", s)
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _BOLD_TAG_RE.sub("", s)
+    s = _WHITESPACE_RE.sub(" ", s).strip()
     return s
 
 
+def _clean_text_column(col: pd.Series) -> pd.Series:
+    """_clean_text 의 컬럼 단위 버전 (정규식 치환을 컬럼 전체에 1회씩)"""
+    col = col.fillna("").astype(str).map(unescape)
+    col = col.str.replace(_BOLD_TAG_RE, "", regex=True)
+    return col.str.replace(_WHITESPACE_RE, " ", regex=True).str.strip()
+
+
+def _parse_pubdate_column(col: pd.Series) -> pd.Series:
+    """RFC-822 pubDate 컬럼 → KST naive datetime 컬럼 (형식 지정 1회 파싱, 실패는 NaT)"""
+    dt = pd.to_datetime(col, format=NAVER_PUBDATE_FORMAT, utc=True, errors="coerce")
+    return dt.dt.tz_convert("Asia/Seoul").dt.tz_localize(None)
+
+
 def _normalize_url(url: str) -> str:
     """
     URL 정규화 - 중복 체크를 위해 URL을 표준 형식으로 변환
+    - 규칙은 fingerprint_set.canonical_url 한 곳에 있다 (발송 이력·기사 인덱스와 같은 키)
     - 쿼리 파라미터 보존 (중요! 많은 뉴스 사이트가 쿼리로 기사 구분)
     - 프로토콜 통일 (http → https)
     - 끝 슬래시 제거
     """
-    try:
-        if not url:
-            return ""
-        parsed = urllib.parse.urlparse(url)
-
-        # 1. 프로토콜 통일 (http → https)
-        scheme = "https" if parsed.scheme in ["http", "https"] else parsed.scheme
-
-        # 2. 쿼리 파라미터 보존 (기사 ID 구분을 위해 필수)
-        query = f"?{parsed.query}" if parsed.query else ""
-
-        # 3. 끝 슬래시 제거
-        path = parsed.path.rstrip("/")
-
-        # 4. 정규화된 URL 생성
-        normalized = f"{scheme}://{parsed.netloc}{path}{query}"
-        return normalized
-    except Exception as e:
-        print(f"[WARNING] URL 정규화 실패: {url} - {e}")
-        return url
+    if not url:
+        return ""
+    return canonical_url(url)
 
 
 def _publisher_from_link(u: str) -> str:
-    """뉴스 원문 URL에서 매체명을 통일해서 반환"""
-    try:
-        host = urllib.parse.urlparse(u).netloc.lower().replace("www.", "")
-        if not host:
-            return ""
-
-        # 서브도메인 정확 매핑
-        host_map = {
-            "en.yna.co.kr": "연합뉴스",
-            "news.kbs.co.kr": "KBS",
-            "news.mtn.co.kr": "MTN",
-            "starin.edaily.co.kr": "이데일리",
-            "sports.donga.com": "동아일보",
-            "biz.heraldcorp.com": "헤럴드경제",
-            "daily.hankooki.com": "데일리한국",
-            "news.dealsitetv.com": "딜사이트TV",
-        }
-        if host in host_map:
-            return host_map[host]
-
-        # 기본 도메인(eTLD+1) 추출
-        parts = host.split(".")
-        if len(parts) >= 3 and parts[-1] == "kr" and parts[-2] in {
-            "co","or","go","ne","re","pe","ac","hs","kg","sc",
-            "seoul","busan","incheon","daegu","daejeon","gwangju","ulsan",
-            "gyeonggi","gangwon","chungbuk","chungnam","jeonbuk","jeonnam",
-            "gyeongbuk","gyeongnam","jeju"
-        }:
-            base = ".".join(parts[-3:])
-        else:
-            base = ".".join(parts[-2:])
-
-        # 기본 도메인 → 매체명 매핑
-        base_map = {
-            "yna.co.kr": "연합뉴스", "kbs.co.kr": "KBS", "joins.com": "중앙일보",
-            "donga.com": "동아일보", "heraldcorp.com": "헤럴드경제", "edaily.co.kr": "이데일리",
-            "ajunews.com": "아주경제", "newspim.com": "뉴스핌", "news1.kr": "뉴스1",
-            "etoday.co.kr": "이투데이", "asiae.co.kr": "아시아경제", "nocutnews.co.kr": "노컷뉴스",
-            "munhwa.com": "문화일보", "segye.com": "세계일보", "hankooki.com": "한국일보",
-            "dt.co.kr": "디지털타임스", "ekn.kr": "에너지경제", "businesskorea.co.kr": "비즈니스코리아",
-            "ferrotimes.com": "철강금속신문", "thepublic.kr": "더퍼블릭", "tf.co.kr": "더팩트",
-            "straightnews.co.kr": "스트레이트뉴스", "smartfn.co.kr": "스마트경제", "sisacast.kr": "시사캐스트",
-            "sateconomy.co.kr": "시사경제", "safetynews.co.kr": "안전신문", "rpm9.com": "RPM9",
-            "pointdaily.co.kr": "포인트데일리", "newsworker.co.kr": "뉴스워커", "newsdream.kr": "뉴스드림",
-            "nbntv.co.kr": "NBN뉴스", "megaeconomy.co.kr": "메가경제", "mediapen.com": "미디어펜",
-            "job-post.co.kr": "잡포스트", "irobotnews.com": "로봇신문사", "ifm.kr": "경인방송",
-            "gpkorea.com": "글로벌오토뉴스", "energydaily.co.kr": "에너지데일리",
-            "cstimes.com": "컨슈머타임스", "bizwatch.co.kr": "비즈워치", "autodaily.co.kr": "오토데일리",
-
-            # 추가 언론사 (2025-11-20)
-            "newslock.co.kr": "뉴스락", "mbn.co.kr": "MBN", "kpenews.com": "KPE",
-            "koreatimes.co.kr": "코리아타임스", "korea.kr": "대한민국 정책브리핑",
-            "investchosun.com": "인베스트조선", "goodnews1.com": "GOODTV", "aitimes.kr": "AI타임스",
-            # 추가 언론사 (2025-12-02)
-            "worklaw.co.kr": "워크로", "vop.co.kr": "민중의소리", "thefairnews.co.kr": "더페어뉴스",
-            "newsway.co.kr": "뉴스웨이", "newsfreezone.co.kr": "뉴스프리존", "mtn.co.kr": "머니투데이방송",
-            "kyongbuk.co.kr": "경북일보", "klnews.co.kr": "물류신문", "geconomy.co.kr": "G경제",
-            "enetnews.co.kr": "이넷뉴스", "dkilbo.com": "대경일보", "dailysportshankook.co.kr": "데일리스포츠한국",
-            "dailysecu.com": "데일리시큐", "ceoscoredaily.com": "CEO스코어데일리", "apparelnews.co.kr": "어패럴뉴스",
-            # 추가 언론사 (2025-12-17)
-            "theviewers.co.kr": "더뷰어스", "suwonilbo.kr": "수원일보", "smedaily.co.kr": "중소기업신문",
-            "smarttoday.co.kr": "스마트투데이", "newswhoplus.com": "뉴스후플러스",
-            "mdtoday.co.kr": "메디컬투데이", "jeonmin.co.kr": "전민일보",
-            "globalepic.co.kr": "글로벌이코노믹", "financialpost.co.kr": "파이낸셜포스트",
-            "economytalk.kr": "이코노미톡뉴스", "delighti.co.kr": "딜라이트이슈",
-            "ddaily.co.kr": "디지털데일리", "businessplus.kr": "비즈니스플러스", "bizwnews.com": "비즈월드뉴스",
-
-            # 추가 언론사 (2025-12-22)
-            "wemakenews.co.kr": "위메이크뉴스", "tournews21.com": "투어코리아", "siminilbo.co.kr": "시민일보",
-            "public25.com": "퍼블릭타임스", "ngetnews.com": "뉴스저널리즘", "livesnews.com": "라이브뉴스",
-            "lawleader.co.kr": "로리더", "koreaittimes.com": "코리아IT타임즈", "kmaeil.com": "경인매일",
-            "incheonilbo.com": "인천일보", "ggilbo.com": "금강일보", "dnews.co.kr": "대한경제",
-            "discoverynews.kr": "디스커버리뉴스", "ccdailynews.com": "충청일보", "bzeronews.com": "불교공뉴스",
-            # 추가 언론사 (2026-02-05)
-            "tinnews.co.kr": "틴뉴스",
-        }
-        if base in base_map:
-            return base_map[base]
-
-        return ""
-    except Exception:
-        return ""
+    """뉴스 원문 URL에서 매체명을 통일해서 반환 (modules.media_registry, 모르는 매체는 "")"""
+    return media_registry.publisher(u)
 
 
 # ======================== 감성 분석 함수 ========================
 
-# 감성 분석 캐시 (URL 기반)
-_sentiment_cache = {}
+# 감성 분석 캐시 (정규화 URL + 제목|요약 해시 → 판정, data/sentiment_cache.db — 라운드·프로세스 간 공유)
+_sentiment_cache = sentiment_cache.get_cache()
+
 
 def analyze_sentiment_rule_based(title: str, summary: str) -> str:
     """
@@ -282,36 +275,10 @@ def analyze_sentiment_rule_based(title: str, summary: str) -> str:
     Returns:
         "pos" (긍정/중립), "neg" (부정), "unk" (애매함)
     """
-    text = f"{title}\n{summary}".lower()
-
-    # 부정 키워드 (카톡 보고에서 '즉보/위기'로 다뤄진 패턴 보강)
-    negative_keywords = [
-        "의혹", "논란", "수사", "고발", "제재", "사고", "폭발", "중단", "실패",
-        "적자", "급락", "불법", "배임", "횡령", "담합", "위반", "처벌", "파산",
-        "해고", "감축", "적발", "기소", "벌금", "손실", "하락", "취소", "철회",
-        "문제", "우려", "비판", "반발", "갈등", "충돌", "부실", "지연",
-        # ── 안전·재해 (최고 위기) ──
-        "사망", "중대재해", "붕괴", "추락", "화재", "부상", "재해",
-        # ── 수사·규제·제재 ──
-        "압수수색", "영업정지", "과징금", "구속", "현장조사", "행정처분", "리콜",
-        # ── 노사 ──
-        "파업", "쟁의", "점거", "직고용", "노사갈등",
-        # ── 재무·신용 ──
-        "디폴트", "부도", "회생", "워크아웃", "강등", "기한이익상실", "EOD",
-        # ── 평판·기타 ──
-        "소송", "결함", "리스크", "늑장", "불성실공시", "오염"
-    ]
-
-    # 긍정 키워드 (최소 세트)
-    positive_keywords = [
-        "협력", "확대", "투자", "수주", "계약", "진출", "성과", "개선", "상승",
-        "혁신", "출시", "수상", "선정", "채택", "증가", "성장", "달성", "수익",
-        "개발", "획득", "체결", "증설", "확보", "기여", "창출", "도입", "강화"
-    ]
-
-    # 키워드 카운트
-    neg_count = sum(1 for kw in negative_keywords if kw in text)
-    pos_count = sum(1 for kw in positive_keywords if kw in text)
+    # 키워드 카운트 (부정·긍정 사전을 한 번에 훑음 — 서로 다른 적중 용어 수)
+    hits = LEXICON.hits(f"{title}\n{summary}")
+    neg_count = len(hits.get("neg", ()))
+    pos_count = len(hits.get("pos", ()))
 
     # 판정 로직
     if neg_count >= 2:
@@ -328,105 +295,176 @@ def analyze_sentiment_rule_based(title: str, summary: str) -> str:
         return "unk"
 
 
-def analyze_sentiment_llm(title: str, summary: str) -> str:
+SENTIMENT_SYSTEM_PROMPT = """당신은 포스코인터내셔널의 홍보/IR 담당자입니다.
+주어진 뉴스 기사 각각이 포스코인터내셔널 또는 포스코그룹의 기업 이미지, 평판, 주가에
+긍정적인지 부정적인지 판단해주세요.
+
+판단 기준:
+- 긍정: 실적 호조, 수주/계약, 신사업 진출, 수상/인정, 협력 체결, 성장 소식
+- 부정: 사고/재해, 수사/고발/제재, 실적 악화, 환경/노동 이슈, 소송, 논란/의혹
+- 중립적인 인사이동, 단순 행사 보도 등은 긍정으로 분류
+
+반드시 JSON으로만 답하세요: {"labels": [{"id": 기사번호, "label": "긍정" 또는 "부정"}, ...]}"""
+
+LLM_BATCH_MAX = 20        # 한 요청에 묶는 최대 기사 수
+LLM_BATCH_WINDOW = 0.8    # 첫 애매 기사 이후 같은 요청으로 모으는 대기 시간(초)
+
+
+def analyze_sentiment_llm_batch(articles: list) -> list:
     """
-    LLM 기반 감성 분석 (2차 보정 - unk만)
+    LLM 기반 감성 분석 (2차 보정 - unk만) — 여러 기사를 요청 1회로 판정
 
     Args:
-        title: 기사 제목
-        summary: 기사 요약
+        articles: [(제목, 요약), ...]
 
     Returns:
-        "pos" (긍정/중립) or "neg" (부정)
+        list: 기사 순서대로 "pos" / "neg" / "unk"(판정 실패)
     """
+    labels = ["unk"] * len(articles)
+    if not articles:
+        return labels
     try:
         # OpenAI API 키 확인
         api_key = os.getenv("OPENAI_API_KEY", "")
         if not api_key:
-            return "unk"
+            return labels
 
-        # 포스코인터내셔널 관점의 감성 분석 프롬프트
-        prompt = f"""당신은 포스코인터내셔널의 홍보/IR 담당자입니다.
-아래 뉴스 기사가 포스코인터내셔널 또는 포스코그룹의 기업 이미지, 평판, 주가에
-긍정적인지 부정적인지 판단해주세요.
-
-판단 기준:
-- 긍정: 실적 호조, 수주/계약, 신사업 진출, 수상/인정, 협력 체결, 성장 소식
-- 부정: 사고/재해, 수사/고발/제재, 실적 악화, 환경/노동 이슈, 소송, 논란/의혹
-- 중립적인 인사이동, 단순 행사 보도 등은 긍정으로 분류
-
-제목: {title}
-요약: {summary}
-
-답변은 반드시 "긍정" 또는 "부정" 중 하나만 출력하세요."""
-
-        import requests
+        body = "\n\n".join(
+            f"[{i}]\n제목: {title}\n요약: {summary}" for i, (title, summary) in enumerate(articles, 1)
+        )
         headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         }
         payload = {
             "model": "gpt-4o-mini",
-            "messages": [{"role": "user", "content": prompt}],
+            "messages": [
+                {"role": "system", "content": SENTIMENT_SYSTEM_PROMPT},
+                {"role": "user", "content": body},
+            ],
             "temperature": 0.2,
-            "max_tokens": 10
+            "max_tokens": 20 + 16 * len(articles),
+            "response_format": {"type": "json_object"},
         }
 
-        response = requests.post(
+        response = http_client.post(
             "https://api.openai.com/v1/chat/completions",
             headers=headers,
             json=payload,
-            timeout=10
+            timeout=10 + len(articles)
         )
 
         if response.status_code == 200:
             result = response.json()
-            answer = result["choices"][0]["message"]["content"].strip().lower()
-
-            if "부정" in answer or "negative" in answer:
-                return "neg"
-            elif "긍정" in answer or "positive" in answer:
-                return "pos"
-
-        return "unk"
+            answer = json.loads(result["choices"][0]["message"]["content"])
+            for entry in answer.get("labels", []):
+                try:
+                    idx = int(entry.get("id")) - 1
+                except (TypeError, ValueError):
+                    continue
+                label = str(entry.get("label", "")).strip().lower()
+                if 0 <= idx < len(labels):
+                    if "부정" in label or "negative" in label or label == "neg":
+                        labels[idx] = "neg"
+                    elif "긍정" in label or "positive" in label or label == "pos":
+                        labels[idx] = "pos"
+        else:
+            print(f"[DEBUG] LLM 감성 분석 응답 오류: {response.status_code}")
+        return labels
 
     except Exception as e:
         print(f"[DEBUG] LLM 감성 분석 오류: {e}")
-        return "unk"
+        return labels
 
 
-def get_article_sentiment(title: str, summary: str, url: str = "") -> str:
+def analyze_sentiment_llm(title: str, summary: str) -> str:
     """
-    기사 감성 분석 (캐싱 + 2단계 분석)
-
-    Args:
-        title: 기사 제목
-        summary: 기사 요약
-        url: 기사 URL (캐싱 키)
+    LLM 기반 감성 분석 (기사 1건) — 배치 함수의 단건 호출
 
     Returns:
-        "pos" (긍정/중립) or "neg" (부정)
+        "pos" (긍정/중립), "neg" (부정), "unk" (판정 실패)
+    """
+    return analyze_sentiment_llm_batch([(title, summary)])[0]
+
+
+def _finish_llm_sentiment(key: str, label: str) -> str:
+    """LLM 판정 결과 확정 + 캐시 (실패 시 기본값 pos — 캐시는 짧게 유지 → LLM 복구 후 재판정)"""
+    if label in ("pos", "neg"):
+        _sentiment_cache.put_key(key, label, "llm")
+        return label
+    _sentiment_cache.put_key(key, "pos", "default")
+    return "pos"
+
+
+def _llm_batch_for_keys(items: list) -> list:
+    """배처 처리 함수: [(캐시키, 제목, 요약)] → 확정 판정 목록"""
+    labels = analyze_sentiment_llm_batch([(title, summary) for _, title, summary in items])
+    if len(items) > 1:
+        print(f"[DEBUG] LLM 감성 분석 배치: {len(items)}건 → 요청 1회")
+    return [_finish_llm_sentiment(key, label) for (key, _, _), label in zip(items, labels)]
+
+
+# 라운드 내 여러 수집 스레드의 애매(unk) 기사를 모아 요청 1회로 판정
+_llm_batcher = micro_batcher.MicroBatcher(_llm_batch_for_keys, max_batch=LLM_BATCH_MAX,
+                                          window=LLM_BATCH_WINDOW, fallback="pos")
+
+
+def submit_article_sentiment(title: str, summary: str, url: str = "") -> Future:
+    """
+    기사 감성 분석 요청 (캐싱 + 2단계 분석, 비차단)
+
+    캐시·규칙으로 판정되면 완료된 Future를, 애매(unk)하면 LLM 배치에 넣은 Future를 돌려준다.
+    호출자는 수집을 계속하고 마지막에 resolve_sentiments()로 한꺼번에 받는다.
     """
     # 캐시 확인
-    cache_key = url if url else f"{title}|{summary}"
-    if cache_key in _sentiment_cache:
-        return _sentiment_cache[cache_key]
+    key = sentiment_cache.cache_key(url, title, summary)
+    cached = _sentiment_cache.get_key(key)
+    if cached:
+        fut = Future()
+        fut.set_result(cached)
+        return fut
 
     # 1차: 규칙 기반 (명확한 경우 즉시 반환)
     sentiment = analyze_sentiment_rule_based(title, summary)
+    if sentiment != "unk":
+        _sentiment_cache.put_key(key, sentiment, "rule")
+        fut = Future()
+        fut.set_result(sentiment)
+        return fut
 
-    # 2차: 애매한 경우(unk) → OpenAI LLM 호출
-    if sentiment == "unk":
-        sentiment = analyze_sentiment_llm(title, summary)
+    # 2차: 애매한 경우(unk) → OpenAI LLM 배치
+    return _llm_batcher.submit((key, title, summary))
 
-    # LLM도 판단 못하면 기본값 pos
-    if sentiment == "unk":
-        sentiment = "pos"
 
-    # 캐시 저장
-    _sentiment_cache[cache_key] = sentiment
+def resolve_sentiments(items: list, field: str = "sentiment", timeout: float = 30) -> list:
+    """items 각 dict의 감성 Future를 결과 문자열로 바꾼다 (시간 초과 시 pos)"""
+    for item in items:
+        value = item.get(field)
+        if isinstance(value, Future):
+            try:
+                item[field] = value.result(timeout=timeout)
+            except Exception:
+                item[field] = "pos"
+    return items
 
-    return sentiment
+
+def get_article_sentiment(title: str, summary: str, url: str = "") -> str:
+    """
+    기사 감성 분석 (캐싱 + 2단계 분석) — 결과를 기다리는 동기 버전
+
+    Args:
+        title: 기사 제목
+        summary: 기사 요약
+        url: 기사 URL (캐싱 키 — 정규화 URL + 제목|요약 해시)
+
+    Returns:
+        "pos" (긍정/중립) or "neg" (부정)
+    """
+    fut = submit_article_sentiment(title, summary, url)
+    try:
+        return fut.result(timeout=30)
+    except Exception:
+        return "pos"
 
 
 # ======================== 네이버 API 함수 ========================
@@ -442,7 +480,8 @@ def fetch_naver_news(query: str, start: int = 1, display: int = 50, sort: str =
         if not headers.get("X-Naver-Client-Id") or not headers.get("X-Naver-Client-Secret"):
             return {"items": [], "error": "missing_keys"}
 
-        r = requests.get(url, headers=headers, params=params, timeout=10)
+        # 공유 커넥션 풀 (호스트 동시 연결 상한 + 초당 호출 상한은 http_client가 적용)
+        r = http_client.get(url, headers=headers, params=params, timeout=10)
 
         # API 할당량 초과 처리
         if r.status_code == 429:
@@ -471,53 +510,84 @@ def fetch_naver_news(query: str, start: int = 1, display: int = 50, sort: str =
             r.close()
 
 
-def crawl_naver_news(query: str, max_items: int = 200, sort: str = "date") -> pd.DataFrame:
-    """Naver 뉴스 수집"""
+def crawl_naver_news(query: str, max_items: int = 200, sort: str = "date",
+                     watermark: dict = None, known_urls: set = None, enrich: bool = True) -> pd.DataFrame:
+    """Naver 뉴스 수집
+
+    Args:
+        query: 검색 키워드
+        max_items: 최대 수집 건수. 증분 모드에서는 첫 페이지 크기(최대 50) — 버스트로 더 깊이
+            페이징할 때는 알려진 기사에 빨리 닿도록 페이지당 50건
+        sort: 정렬 방식
+        watermark: 키워드 워터마크 {last_pub, urls}. 주어지면 증분 수집 모드로 동작한다.
+            - 이미 본 URL은 파싱·감성분석 없이 건너뛰고, 알려진 기사가 나온 페이지에서 페이징 중단
+            - 한 페이지가 전부 신규(버스트)면 알려진 기사가 나올 때까지 더 깊이 페이징
+              (WATERMARK_MAX_PAGES 한도) → 고빈도 키워드가 몰릴 때 누락 방지
+        known_urls: 키워드와 무관하게 이미 처리된 URL 집합 (예: 발송 캐시). 워터마크와 같이 취급.
+        enrich: False면 매체명·감성 컬럼을 비워 둔다 (중복 제거 뒤 enrich_articles로 신규만 계산)
+
+    Returns:
+        DataFrame. 증분 모드에서는 신규 기사만 담고, attrs에
+        'watermark'(갱신된 워터마크)·'api_calls'(실제 호출 수)를 기록한다.
+    """
+    incremental = watermark is not None
     items, start, total = [], 1, 0
     display = min(50, max_items)
-    max_attempts = 2
+    max_attempts = WATERMARK_MAX_PAGES if incremental else 2
     attempt_count = 0
     quota_exceeded = False
-
-    while total < max_items and start <= 100 and attempt_count < max_attempts:
+    error = None  # 수집이 끝까지 되지 않은 원인 (timeout/request_failed/...) — 스케줄러 관측 제외용
+
+    wm_urls = list((watermark or {}).get("urls", []))
+    known = set(wm_urls)
+    can_burst = bool(known)  # 기준점이 없는 첫 관측은 1페이지만 (초기 폭주 방지)
+
+    def _is_known(link: str) -> bool:
+        if not link:
+            return False
+        if link in known or (known_urls and link in known_urls):
+            return True
+        norm = _normalize_url(link)
+        return norm in known or bool(known_urls and norm in known_urls)
+
+    while start <= (1000 if incremental else 100) and attempt_count < max_attempts:
+        if not incremental and total >= max_items:
+            break
         attempt_count += 1
 
         try:
-            data = fetch_naver_news(query, start=start, display=min(display, max_items - total), sort=sort)
+            if incremental:
+                page_size = display if attempt_count == 1 else 50
+            else:
+                page_size = min(display, max_items - total)
+            data = fetch_naver_news(query, start=start, display=page_size, sort=sort)
 
             # API 할당량 초과 체크
             if data.get("error") == "quota_exceeded":
                 print(f"[ERROR] API 할당량 초과 감지 - 뉴스 수집 중단")
                 quota_exceeded = True
                 break
+            if data.get("error"):
+                error = data["error"]
+                break
 
             arr = data.get("items", [])
             if not arr:
                 break
 
+            known_hits = 0
             for it in arr:
-                title = _clean_text(it.get("title"))
-                desc = _clean_text(it.get("description"))
                 link = it.get("originallink") or it.get("link") or ""
-                pub = it.get("pubDate", "")
-                try:
-                    # GMT → KST 변환 후 tz 제거
-                    dt = pd.to_datetime(pub, utc=True).tz_convert("Asia/Seoul").tz_localize(None)
-                    date_str = dt.strftime("%Y-%m-%d %H:%M")
-                except Exception:
-                    date_str = ""
-
-                # 감성 분석 추가
-                sentiment = get_article_sentiment(title, desc, link)
+                if incremental and _is_known(link):
+                    known_hits += 1
+                    continue
 
+                # 정제·날짜 파싱·감성 분석은 수집이 끝난 뒤 컬럼 단위로 일괄 처리
                 items.append({
-                    "날짜": date_str,
-                    "매체명": _publisher_from_link(link),
-                    "검색키워드": query,
-                    "기사제목": title,
-                    "주요기사 요약": desc,
                     "URL": link,
-                    "sentiment": sentiment
+                    "title": it.get("title"),
+                    "description": it.get("description"),
+                    "pubDate": it.get("pubDate", ""),
                 })
 
             got = len(arr)
@@ -526,41 +596,160 @@ def crawl_naver_news(query: str, max_items: int = 200, sort: str = "date") -> pd
                 break
             start += got
 
+            if incremental:
+                # 알려진 기사에 도달했거나 마지막 페이지면 중단, 페이지 전체가 신규면(버스트) 계속
+                if known_hits or got < page_size or not can_burst:
+                    break
+                print(f"[DEBUG] '{query}' 버스트 감지 - 다음 페이지 수집 (start={start})")
+
         except Exception as e:
             print(f"[WARNING] Error in crawl_naver_news attempt {attempt_count}: {e}")
+            error = type(e).__name__
             break
 
-    df = pd.DataFrame(items, columns=["날짜", "매체명", "검색키워드", "기사제목", "주요기사 요약", "URL", "sentiment"])
+    df = _normalize_naver_items(items, query, enrich)
 
     # API 할당량 초과 정보 저장
     if quota_exceeded:
         df.attrs['quota_exceeded'] = True
+    if error:
+        df.attrs['error'] = error
 
-    if not df.empty:
-        # 최신순 정렬
-        df["날짜_datetime"] = pd.to_datetime(df["날짜"], errors="coerce")
-        df = df.sort_values("날짜_datetime", ascending=False, na_position="last").reset_index(drop=True)
-        df = df.drop("날짜_datetime", axis=1)
-
-        # 중복 제거
-        key = df["URL"].where(df["URL"].astype(bool), df["기사제목"] + "|" + df["날짜"])
-        df = df.loc[~key.duplicated()].reset_index(drop=True)
+    if incremental:
+        df.attrs['api_calls'] = attempt_count
+        df.attrs['watermark'] = advance_watermark(watermark, df)
     return df
 
 
-def crawl_google_news_rss(query: str = "POSCO International", max_items: int = 50) -> pd.DataFrame:
+def _normalize_naver_items(items: list, query: str, enrich: bool = True) -> pd.DataFrame:
+    """
+    네이버 원시 항목 목록 → 기사 DataFrame (컬럼 단위 일괄 정규화)
+
+    제목·요약 정제와 pubDate 파싱(GMT → KST)을 컬럼 전체에 한 번씩 적용하고,
+    파싱된 datetime 컬럼으로 최신순 정렬·중복 제거한 뒤 남은 행만 매체명·감성을 채운다.
     """
-    Google News RSS 기반 뉴스 수집 (미국 + 한국 지역)
+    if not items:
+        return news_schema.empty_frame()
+    raw = pd.DataFrame(items)
+    df = pd.DataFrame({
+        "날짜": _parse_pubdate_column(raw["pubDate"]),
+        "매체명": "",
+        "검색키워드": query,
+        "기사제목": _clean_text_column(raw["title"]),
+        "주요기사 요약": _clean_text_column(raw["description"]),
+        "URL": raw["URL"].fillna("").astype(str),
+        "sentiment": None,
+    })
+
+    # 최신순 정렬 후 중복 제거 (URL 없으면 제목|발행시각)
+    df = df.sort_values("날짜", ascending=False, na_position="last", kind="stable")
+    key = df["URL"].where(df["URL"].astype(bool), df["기사제목"] + "|" + news_schema.date_strings(df["날짜"]))
+    df = df.loc[~key.duplicated()].reset_index(drop=True)
+
+    if enrich:
+        df["매체명"] = media_registry.publishers(df["URL"])
+        # 애매한 기사는 LLM 배치로 — 모두 제출한 뒤 한 번에 수거
+        pending = [{"sentiment": submit_article_sentiment(t, d, u)}
+                   for t, d, u in zip(df["기사제목"], df["주요기사 요약"], df["URL"])]
+        resolve_sentiments(pending)
+        df["sentiment"] = [p["sentiment"] for p in pending]
+    return news_schema.typed(df)
+
+
+def _fetch_google_rss_region(query: str, region: tuple, max_items: int, entry: dict = None) -> tuple:
+    """Google News RSS 지역 피드 1개 조건부·스트리밍 수집.
+
+    entry(피드 캐시)가 주어지면 증분 모드: If-None-Match/If-Modified-Since 로 요청해
+    변경 없으면 304로 끝내고, 이미 본 기사는 처리 전에 건너뛰며 연속 RSS_SEEN_STOP_RUN건이면 중단.
+
+    Returns:
+        tuple: (원시 기사 dict 리스트, 갱신된 피드 캐시 또는 None, 카운터 dict)
+    """
+    hl, gl, ceid = region
+    encoded_query = urllib.parse.quote(f'"{query}"')
+    rss_url = f"https://news.google.com/rss/search?q={encoded_query}&hl={hl}&gl={gl}&ceid={ceid}"
+    stats = {"items": 0, "seen": 0, "not_modified": 0}
+    incremental = entry is not None
+
+    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+    if incremental:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    response = http_client.get(rss_url, timeout=10, headers=headers, stream=True)
+    try:
+        if response.status_code == 304:
+            stats["not_modified"] = 1
+            return [], None, stats
+        response.raise_for_status()
+
+        seen = set(entry.get("seen", [])) if incremental else set()
+        raw_items, fresh, seen_run = [], [], 0
+        response.raw.decode_content = True  # gzip 응답도 스트림에서 바로 파싱
+
+        # RSS 2.0 channel/item 을 증분 파싱 (문서 전체를 트리로 만들지 않음)
+        for _, elem in ET.iterparse(response.raw, events=("end",)):
+            if elem.tag != "item":
+                continue
+            stats["items"] += 1
+            link = elem.findtext("link") or ""
+            norm = _normalize_url(link)
+            if norm and norm in seen:
+                stats["seen"] += 1
+                seen_run += 1
+                elem.clear()
+                if seen_run >= RSS_SEEN_STOP_RUN:
+                    break
+                continue
+            seen_run = 0
+            if norm:
+                fresh.append(norm)
+            raw_items.append({
+                "title": elem.findtext("title") or "",
+                "link": link,
+                "pub_date": elem.findtext("pubDate") or "",
+                "description": elem.findtext("description") or "",
+            })
+            elem.clear()
+            if stats["items"] >= max_items:
+                break
+
+        new_entry = None
+        if incremental:
+            new_entry = {
+                "etag": response.headers.get("ETag", ""),
+                "last_modified": response.headers.get("Last-Modified", ""),
+                "seen": (fresh + [u for u in entry.get("seen", []) if u not in set(fresh)])[:RSS_SEEN_MAX],
+            }
+        return raw_items, new_entry, stats
+    finally:
+        response.close()
+
+
+def crawl_google_news_rss(query: str = "POSCO International", max_items: int = 50,
+                          rss_cache: dict = None, enrich: bool = True) -> pd.DataFrame:
+    """
+    Google News RSS 기반 뉴스 수집 (미국 + 한국 지역, 동시 요청)
 
     Args:
         query: 검색 쿼리 (기본값: "POSCO International" 정확 검색)
         max_items: 최대 수집 개수 (지역별)
+        rss_cache: 피드별 캐시(load_rss_cache). 주어지면 증분 모드 — 변경 없는 피드는 304,
+                   이미 본 기사는 건너뜀. 갱신된 항목은 df.attrs['rss_cache']로 반환(호출부가 저장).
+        enrich: False면 매체명·감성 컬럼을 비워 둔다 (중복 제거 뒤 enrich_articles로 신규만 계산)
 
     Returns:
         DataFrame with columns: 날짜, 매체명, 검색키워드, 기사제목, 주요기사 요약, URL, sentiment
     """
+    from concurrent.futures import ThreadPoolExecutor
+    from email.utils import parsedate_to_datetime
+
     items = []
     seen_urls = set()  # URL 중복 방지
+    updated_cache = {}
+    counts = {"items": 0, "seen": 0, "not_modified": 0, "dup": 0, "filtered": 0, "bad_date": 0, "error": 0}
 
     # 다중 지역 설정: 미국(글로벌) + 한국(로컬 언론사 커버)
     regions = [
@@ -568,121 +757,156 @@ def crawl_google_news_rss(query: str = "POSCO International", max_items: int = 5
         ("ko", "KR", "KR:ko"),       # 한국
     ]
 
-    try:
-        encoded_query = urllib.parse.quote(f'"{query}"')
-
-        for hl, gl, ceid in regions:
-            rss_url = f"https://news.google.com/rss/search?q={encoded_query}&hl={hl}&gl={gl}&ceid={ceid}"
-            print(f"[DEBUG] Fetching Google News RSS ({gl}): {rss_url}")
+    def _cache_key(region):
+        return f"{query}|{region[2]}"
 
+    try:
+        # 지역 피드 동시 요청 (news.google.com 동시 연결 상한은 http_client가 적용)
+        with ThreadPoolExecutor(max_workers=len(regions)) as executor:
+            futures = [
+                (region, executor.submit(
+                    _fetch_google_rss_region, query, region, max_items,
+                    (rss_cache.get(_cache_key(region), {}) if rss_cache is not None else None)))
+                for region in regions
+            ]
+            fetched = []
+            for region, future in futures:
+                try:
+                    raw_items, new_entry, stats = future.result()
+                except Exception as region_err:
+                    print(f"[WARNING] Error fetching RSS for region {region[1]}: {region_err}")
+                    continue
+                for k, v in stats.items():
+                    counts[k] += v
+                if new_entry is not None:
+                    updated_cache[_cache_key(region)] = new_entry
+                fetched.extend(raw_items)
+
+        target_phrase = "posco international"
+        for raw in fetched:
             try:
-                # RSS 피드 가져오기
-                response = requests.get(rss_url, timeout=10, headers={
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                })
-                response.raise_for_status()
-
-                # XML 파싱
-                root = ET.fromstring(response.content)
+                title = _clean_text(raw["title"])
+                link = raw["link"]
+                pub_date = raw["pub_date"]
+                description = _clean_text(raw["description"])
+                if not title or not link:
+                    continue
 
-                # RSS 2.0 형식: channel/item
-                channel = root.find('channel')
-                if channel is None:
-                    print(f"[WARNING] No channel found in RSS feed ({gl})")
+                # URL 중복 체크 (지역 간 중복 방지)
+                normalized_link = _normalize_url(link)
+                if normalized_link in seen_urls:
+                    counts["dup"] += 1
                     continue
+                seen_urls.add(normalized_link)
 
-                rss_items = channel.findall('item')[:max_items]
-                print(f"[DEBUG] Found {len(rss_items)} items in RSS feed ({gl})")
+                # 1차 필터: 제목 또는 요약에 "POSCO International" 포함 확인 (대소문자 무시)
+                # (본문 크롤링 제거 - 성능 병목)
+                if target_phrase not in title.lower() and target_phrase not in description.lower():
+                    counts["filtered"] += 1
+                    continue
 
-                for item in rss_items:
+                # 날짜 파싱 (RFC 822 형식) → KST
+                date_str = ""
+                if pub_date:
                     try:
-                        title_elem = item.find('title')
-                        link_elem = item.find('link')
-                        pub_date_elem = item.find('pubDate')
-                        desc_elem = item.find('description')
-
-                        if title_elem is None or link_elem is None:
-                            continue
-
-                        title = _clean_text(title_elem.text or "")
-                        link = link_elem.text or ""
-                        pub_date = pub_date_elem.text or "" if pub_date_elem is not None else ""
-                        description = _clean_text(desc_elem.text or "") if desc_elem is not None else ""
-
-                        # URL 중복 체크 (지역 간 중복 방지)
-                        normalized_link = _normalize_url(link)
-                        if normalized_link in seen_urls:
-                            continue
-                        seen_urls.add(normalized_link)
-
-                        # 1차 필터: 제목 또는 요약에 "POSCO International" 포함 확인 (대소문자 무시)
-                        title_lower = title.lower()
-                        desc_lower = description.lower()
-                        target_phrase = "posco international"
-
-                        if target_phrase not in title_lower and target_phrase not in desc_lower:
-                            # 제목/요약에 없으면 skip (본문 크롤링 제거 - 성능 병목)
-                            print(f"[DEBUG] Filtered out (no match in title/desc): {title[:50]}")
-                            continue
-
-                        # 날짜 파싱 (RFC 822 형식)
-                        date_str = ""
-                        if pub_date:
-                            try:
-                                from email.utils import parsedate_to_datetime
-                                dt = parsedate_to_datetime(pub_date)
-                                # KST로 변환
-                                dt_kst = dt.astimezone(timezone(timedelta(hours=9)))
-                                date_str = dt_kst.strftime("%Y-%m-%d %H:%M")
-                            except Exception as date_err:
-                                print(f"[DEBUG] Date parsing failed: {pub_date} ({date_err})")
-                                date_str = ""
-
-                        # 매체명 추출
-                        publisher = _publisher_from_link(link)
-
-                        # 감성 분석
-                        sentiment = get_article_sentiment(title, description, link)
-
-                        items.append({
-                            "날짜": date_str,
-                            "매체명": publisher,
-                            "검색키워드": query,
-                            "기사제목": title,
-                            "주요기사 요약": description,
-                            "URL": link,
-                            "sentiment": sentiment
-                        })
-
-                    except Exception as item_err:
-                        print(f"[WARNING] Error processing RSS item: {item_err}")
-                        continue
+                        dt = parsedate_to_datetime(pub_date)
+                        date_str = dt.astimezone(timezone(timedelta(hours=9))).strftime("%Y-%m-%d %H:%M")
+                    except Exception:
+                        counts["bad_date"] += 1
+
+                items.append({
+                    "날짜": date_str,
+                    "매체명": _publisher_from_link(link) if enrich else "",
+                    "검색키워드": query,
+                    "기사제목": title,
+                    "주요기사 요약": description,
+                    "URL": link,
+                    "sentiment": submit_article_sentiment(title, description, link) if enrich else None,
+                })
 
-            except Exception as region_err:
-                print(f"[WARNING] Error fetching RSS for region {gl}: {region_err}")
+            except Exception:
+                counts["error"] += 1
                 continue
 
-        print(f"[DEBUG] Google News RSS collected {len(items)} items after filtering (US+KR)")
+        print(f"[DEBUG] Google News RSS (US+KR): {len(items)}건 수집 "
+              f"(피드 항목 {counts['items']}, 이미 본 기사 {counts['seen']}, 304 {counts['not_modified']}, "
+              f"지역 중복 {counts['dup']}, 필터 제외 {counts['filtered']}, 날짜 오류 {counts['bad_date']}, "
+              f"처리 오류 {counts['error']})")
 
     except Exception as e:
         print(f"[WARNING] Error in crawl_google_news_rss: {e}")
-        return pd.DataFrame(columns=["날짜", "매체명", "검색키워드", "기사제목", "주요기사 요약", "URL", "sentiment"])
+        return news_schema.empty_frame()
 
     # DataFrame 생성
-    df = pd.DataFrame(items, columns=["날짜", "매체명", "검색키워드", "기사제목", "주요기사 요약", "URL", "sentiment"])
+    resolve_sentiments(items)  # 수집 동안 진행된 LLM 배치 결과 수거
+    df = news_schema.typed(pd.DataFrame(items, columns=news_schema.COLUMNS))
 
     if not df.empty:
         # 최신순 정렬
-        df["날짜_datetime"] = pd.to_datetime(df["날짜"], errors="coerce")
-        df = df.sort_values("날짜_datetime", ascending=False, na_position="last").reset_index(drop=True)
-        df = df.drop("날짜_datetime", axis=1)
+        df = df.sort_values("날짜", ascending=False, na_position="last").reset_index(drop=True)
 
         # URL 중복 제거
         df = df.drop_duplicates(subset=["URL"], keep="first").reset_index(drop=True)
 
+    if rss_cache is not None:
+        df.attrs['rss_cache'] = updated_cache
     return df
 
 
+ENRICH_COLUMNS = ("매체명", "sentiment")
+
+
+def _blank(col: pd.Series) -> pd.Series:
+    """비어 있는(NaN·None·빈 문자열) 셀 마스크"""
+    return col.isna() | col.astype(str).str.strip().isin(["", "nan", "None"])
+
+
+def enrich_articles(df: pd.DataFrame, known: pd.DataFrame = None) -> pd.DataFrame:
+    """
+    수집 결과에 매체명·감성 컬럼 채우기 (수집 → 정규화 → 중복 제거 뒤 마지막 단계)
+
+    이미 값이 있는 행은 그대로 두고, 기존 DB(known)에 같은 정규화 URL이 있으면 그 값을 옮겨
+    쓴다. 남은 신규 행만 매체명을 계산하고 감성을 판정한다 (애매한 기사는 LLM 배치 1회).
+    이후 단계(detect_new_articles·save_news_db)는 이 컬럼을 그대로 쓴다.
+    """
+    if df is None or df.empty:
+        return df
+    df = news_schema.to_objects(df)
+    for col in ENRICH_COLUMNS:
+        if col not in df.columns:
+            df[col] = None
+    canon = news_schema.url_keys(df)
+
+    reused = 0
+    if known is not None and not known.empty and "URL" in known.columns:
+        known_canon = news_schema.url_keys(known)
+        known = news_schema.to_objects(known)
+        for col in ENRICH_COLUMNS:
+            if col not in known.columns:
+                continue
+            lookup = pd.Series(known[col].values, index=known_canon.values)
+            lookup = lookup[~lookup.index.duplicated() & ~_blank(lookup).values]
+            missing = _blank(df[col])
+            filled = canon[missing].map(lookup)
+            df.loc[missing, col] = filled
+            reused = max(reused, int(filled.notna().sum()))
+
+    missing = _blank(df["매체명"])
+    if missing.any():
+        df.loc[missing, "매체명"] = media_registry.publishers(df.loc[missing, "URL"])
+
+    missing = _blank(df["sentiment"])
+    if missing.any():
+        sub = df.loc[missing]
+        items = [{"sentiment": submit_article_sentiment(str(t), str(d), str(u))}
+                 for t, d, u in zip(sub["기사제목"], sub["주요기사 요약"], sub["URL"])]
+        resolve_sentiments(items)
+        df.loc[missing, "sentiment"] = [it["sentiment"] for it in items]
+
+    print(f"[DEBUG] 기사 보강: 감성 판정 {int(missing.sum())}건, 기존 DB 값 재사용 {reused}건 (총 {len(df)}건)")
+    return news_schema.typed(df)
+
+
 def merge_news_sources(naver_df: pd.DataFrame, google_df: pd.DataFrame) -> pd.DataFrame:
     """
     Naver와 Google News RSS 결과를 병합하고 중복 제거
@@ -696,7 +920,7 @@ def merge_news_sources(naver_df: pd.DataFrame, google_df: pd.DataFrame) -> pd.Da
     """
     # 둘 다 비어있으면 빈 DataFrame 반환
     if naver_df.empty and google_df.empty:
-        return pd.DataFrame(columns=["날짜", "매체명", "검색키워드", "기사제목", "주요기사 요약", "URL", "sentiment"])
+        return news_schema.empty_frame()
 
     # 하나만 있으면 그것을 반환
     if naver_df.empty:
@@ -705,34 +929,134 @@ def merge_news_sources(naver_df: pd.DataFrame, google_df: pd.DataFrame) -> pd.Da
         return naver_df.copy()
 
     # 둘 다 있으면 병합
-    merged = pd.concat([naver_df, google_df], ignore_index=True)
+    merged = news_schema.combine([naver_df, google_df])
 
     # URL 기준 중복 제거 (먼저 나온 것 유지)
     merged = merged.drop_duplicates(subset=["URL"], keep="first").reset_index(drop=True)
 
     # 최신순 정렬
     if not merged.empty:
-        merged["날짜_datetime"] = pd.to_datetime(merged["날짜"], errors="coerce")
-        merged = merged.sort_values("날짜_datetime", ascending=False, na_position="last").reset_index(drop=True)
-        merged = merged.drop("날짜_datetime", axis=1)
+        merged = merged.sort_values("날짜", ascending=False, na_position="last").reset_index(drop=True)
 
     return merged
 
 
+# ======================== 키워드 워터마크 (증분 수집) ========================
+
+def load_keyword_watermarks() -> dict:
+    """키워드별 워터마크 로드: {keyword: {last_pub, urls(최신순), updated}}"""
+    if os.path.exists(WATERMARK_FILE):
+        try:
+            with open(WATERMARK_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f).get("keywords", {})
+        except Exception as e:
+            print(f"[WARNING] 워터마크 로드 실패: {e}")
+    return {}
+
+
+def save_keyword_watermarks(watermarks: dict):
+    """키워드별 워터마크 저장 (원자적 쓰기)"""
+    try:
+        import tempfile
+        os.makedirs(DATA_FOLDER, exist_ok=True)
+        data = {
+            "keywords": watermarks,
+            "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        temp_fd, temp_path = tempfile.mkstemp(dir=DATA_FOLDER, suffix='.tmp')
+        try:
+            with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, WATERMARK_FILE)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+    except Exception as e:
+        print(f"[WARNING] 워터마크 저장 실패: {e}")
+
+
+def load_rss_cache() -> dict:
+    """Google RSS 피드별 캐시 로드 {"<query>|<ceid>": {etag, last_modified, seen}}"""
+    try:
+        if os.path.exists(RSS_CACHE_FILE):
+            with open(RSS_CACHE_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f).get("feeds", {})
+    except Exception as e:
+        print(f"[WARNING] RSS 캐시 로드 실패: {e}")
+    return {}
+
+
+def save_rss_cache(cache: dict):
+    """Google RSS 피드별 캐시 저장 (원자적 쓰기)"""
+    try:
+        import tempfile
+        os.makedirs(DATA_FOLDER, exist_ok=True)
+        data = {
+            "feeds": cache,
+            "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        temp_fd, temp_path = tempfile.mkstemp(dir=DATA_FOLDER, suffix='.tmp')
+        try:
+            with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, RSS_CACHE_FILE)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+    except Exception as e:
+        print(f"[WARNING] RSS 캐시 저장 실패: {e}")
+
+
+def seed_watermark(db_df: pd.DataFrame, keyword: str) -> dict:
+    """워터마크가 없는 키워드의 기준점을 기존 DB(해당 키워드 행)에서 만든다."""
+    wm = {"last_pub": "", "urls": []}
+    if db_df is None or db_df.empty or "검색키워드" not in db_df.columns:
+        return wm
+    rows = db_df[db_df["검색키워드"].astype(str) == keyword]
+    if rows.empty:
+        return wm
+    urls = [u for u in rows["URL"].astype(str).tolist() if u and u != "nan"]
+    wm["urls"] = urls[:WATERMARK_MAX_URLS]
+    wm["last_pub"] = str(news_schema.date_strings(rows["날짜"]).max())
+    return wm
+
+
+def advance_watermark(watermark: dict, new_df: pd.DataFrame) -> dict:
+    """수집된 신규 기사로 워터마크 전진 (신규 URL을 앞에 붙이고 최근 WATERMARK_MAX_URLS개 유지)"""
+    old_urls = list((watermark or {}).get("urls", []))
+    last_pub = (watermark or {}).get("last_pub", "")
+    new_urls = []
+    if new_df is not None and not new_df.empty:
+        new_urls = [u for u in new_df["URL"].astype(str).tolist() if u and u != "nan"]
+        dates = [d for d in news_schema.date_strings(new_df["날짜"]).tolist() if d]
+        if dates:
+            last_pub = max([last_pub] + dates)
+    seen = set()
+    merged = []
+    for u in new_urls + old_urls:
+        if u not in seen:
+            seen.add(u)
+            merged.append(u)
+    return {
+        "last_pub": last_pub,
+        "urls": merged[:WATERMARK_MAX_URLS],
+        "updated": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
 # ======================== DB 함수 ========================
 
 def load_news_db() -> pd.DataFrame:
-    """뉴스 DB 로드"""
+    """뉴스 DB 로드 (news_schema 타입 프레임: 날짜 datetime64, 반복 문자열 category, url_key)"""
     if os.path.exists(NEWS_DB_FILE):
         try:
-            df = pd.read_csv(NEWS_DB_FILE, encoding="utf-8")
-            # 기존 데이터에 sentiment 컬럼이 없으면 추가
-            if "sentiment" not in df.columns:
-                df["sentiment"] = "pos"  # 기본값: 긍정/중립
-            return df
+            # sentiment 컬럼이 없던 기존 데이터는 긍정/중립으로 채워진다
+            return news_schema.read_csv(NEWS_DB_FILE)
         except Exception as e:
             print(f"[WARNING] DB 로드 실패: {e}")
-    return pd.DataFrame(columns=["날짜","매체명","검색키워드","기사제목","주요기사 요약","URL","sentiment"])
+    return news_schema.empty_frame()
 
 
 def save_news_db(df: pd.DataFrame):
@@ -741,14 +1065,24 @@ def save_news_db(df: pd.DataFrame):
         print("[DEBUG] save_news_db skipped: empty dataframe")
         return
 
-    # 매체명 정리 (URL 기반)
-    if "매체명" in df.columns and "URL" in df.columns:
-        for idx, row in df.iterrows():
-            if pd.notna(row["URL"]):
-                df.at[idx, "매체명"] = _publisher_from_link(row["URL"])
+    # 저장 형식 (날짜는 여기서만 문자열로)
+    rows = news_schema.to_storage(df)
+
+    # 매체명 정리 (URL 기반) — enrich_articles가 채운 값은 그대로, 비어 있는 행만 계산
+    missing = _blank(rows["매체명"]) & rows["URL"].notna()
+    if missing.any():
+        rows.loc[missing, "매체명"] = media_registry.publishers(rows.loc[missing, "URL"])
+
+    # 전체 이력 아카이브에는 모든 행을 upsert (news_monitor.csv는 최신 200행 핫 뷰)
+    try:
+        archived = news_archive.get_archive().upsert(rows)
+        if archived:
+            print(f"[DEBUG] 기사 아카이브 반영: {archived}건")
+    except Exception as e:
+        print(f"[WARNING] 기사 아카이브 저장 실패: {e}")
 
     # 상위 200개만 저장
-    out = df.head(200).copy()
+    out = rows.head(200)
 
     # data 폴더 생성
     os.makedirs(DATA_FOLDER, exist_ok=True)
@@ -756,149 +1090,87 @@ def save_news_db(df: pd.DataFrame):
     out.to_csv(NEWS_DB_FILE, index=False, encoding="utf-8")
     print(f"[DEBUG] news saved: {len(out)} rows -> {NEWS_DB_FILE}")
 
+    # 식별자 인덱스 증분 갱신 (신규 기사 감지용) — 핫 뷰 200행이 아니라 이번에 저장한 모든 행
+    added = article_index.get_index().add_frame(rows)
+    if added:
+        print(f"[DEBUG] 기사 인덱스 갱신: +{added}건")
+
 
 # ======================== 캐시 함수 ========================
 
-def load_sent_cache() -> set:
-    """전송된 기사 캐시를 파일에서 로드 (TTL 적용)"""
-    if os.path.exists(SENT_CACHE_FILE):
-        try:
-            with open(SENT_CACHE_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-                # TTL 지원 여부 확인
-                if "url_timestamps" in data:
-                    # TTL 기반 캐시 (타임스탬프 포함)
-                    from datetime import timedelta
-                    url_timestamps = data.get("url_timestamps", {})
-                    ttl_days = data.get("ttl_days", 7)
-                    now = datetime.now()
-                    cutoff_time = now - timedelta(days=ttl_days)
-
-                    # 유효한 URL만 로드
-                    valid_urls = set()
-                    expired_count = 0
-                    for url, timestamp_str in url_timestamps.items():
-                        try:
-                            timestamp = datetime.fromisoformat(timestamp_str)
-                            if timestamp > cutoff_time:
-                                valid_urls.add(url)
-                            else:
-                                expired_count += 1
-                        except Exception:
-                            # 타임스탬프 파싱 실패 시 포함 (안전 장치)
-                            valid_urls.add(url)
-
-                    if expired_count > 0:
-                        print(f"[DEBUG] TTL 만료 URL 제거: {expired_count}건")
-
-                    print(f"[DEBUG] 전송 캐시 로드 완료: {len(valid_urls)}건 (TTL: {ttl_days}일)")
-                    return valid_urls
-                else:
-                    # 레거시 캐시 (타임스탬프 없음)
-                    cache = set(data.get("urls", []))
-                    print(f"[DEBUG] 전송 캐시 로드 완료 (레거시): {len(cache)}건")
-                    return cache
+_sent_store = None
+
 
+def _get_sent_store() -> "sent_store.SentStore":
+    """프로세스 공유 발송 이력 저장소 (최초 접근 시 구 JSON 캐시·단일 로그를 일자별 샤드로 이전)"""
+    global _sent_store
+    if _sent_store is None:
+        try:
+            migrated = sent_store.migrate_from_json(SENT_CACHE_FILE, SENT_LOG_FILE)
+            if migrated:
+                print(f"[DEBUG] 발송 이력 이전: sent_articles_cache.json → sent_articles.log ({migrated}건)")
+            migrated = sent_store.migrate_from_log(SENT_LOG_FILE, SENT_DIR)
+            if migrated:
+                print(f"[DEBUG] 발송 이력 이전: sent_articles.log → data/sent/ 일자별 샤드 ({migrated}건)")
         except Exception as e:
-            print(f"[WARNING] 전송 캐시 로드 실패: {e}")
-            return set()
-    else:
-        print(f"[DEBUG] 전송 캐시 파일 없음 - 새로 생성")
-        return set()
+            print(f"[WARNING] 발송 이력 이전 실패: {e}")
+        _sent_store = sent_store.SentStore(SENT_DIR, ttl_days=SENT_CACHE_TTL_DAYS,
+                                           max_entries=MAX_SENT_CACHE)
+    return _sent_store
 
 
-def save_sent_cache(cache: set, ttl_days: int = 7):
-    """
-    전송된 기사 캐시를 파일에 저장 (TTL 기반, 원자적 쓰기)
+def load_sent_cache() -> FingerprintSet:
+    """발송 이력 로드 (TTL 적용). 다른 프로세스가 덧붙인 줄만 증분으로 읽는다.
 
-    Args:
-        cache: 저장할 URL 캐시
-        ttl_days: TTL (Time To Live) 일수 (기본: 7일)
+    URL 문자열 set 대신 64비트 지문 집합을 돌려준다 (in / add / len / | 는 set과 같게 동작).
     """
     try:
-        from datetime import timedelta
-        import tempfile
-        os.makedirs(DATA_FOLDER, exist_ok=True)
-
-        # 기존 캐시 로드 (타임스탬프 유지)
-        existing_timestamps = {}
-        if os.path.exists(SENT_CACHE_FILE):
-            try:
-                with open(SENT_CACHE_FILE, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
-                    existing_timestamps = existing_data.get("url_timestamps", {})
-            except Exception:
-                pass
-
-        # 현재 시간
-        now = datetime.now()
-        cutoff_time = now - timedelta(days=ttl_days)
+        cache = _get_sent_store().snapshot()
+        print(f"[DEBUG] 전송 캐시 로드 완료: {len(cache)}건 (TTL: {SENT_CACHE_TTL_DAYS}일)")
+        return cache
+    except Exception as e:
+        print(f"[WARNING] 전송 캐시 로드 실패: {e}")
+        return FingerprintSet()
 
-        # URL 타임스탬프 업데이트
-        url_timestamps = {}
-        for url in cache:
-            if url in existing_timestamps:
-                # 기존 타임스탬프 유지
-                try:
-                    timestamp = datetime.fromisoformat(existing_timestamps[url])
-                    if timestamp > cutoff_time:
-                        url_timestamps[url] = existing_timestamps[url]
-                    else:
-                        # 만료된 경우 현재 시간으로 갱신
-                        url_timestamps[url] = now.isoformat()
-                except Exception:
-                    url_timestamps[url] = now.isoformat()
-            else:
-                # 신규 URL은 현재 시간
-                url_timestamps[url] = now.isoformat()
 
-        # 최신 MAX_SENT_CACHE개만 유지 (타임스탬프 기준)
-        if len(url_timestamps) > MAX_SENT_CACHE:
-            sorted_urls = sorted(url_timestamps.items(), key=lambda x: x[1], reverse=True)
-            url_timestamps = dict(sorted_urls[:MAX_SENT_CACHE])
+def merge_sent_log(text: str) -> int:
+    """다른 발송 주체의 발송 이력 로그 텍스트(원격 샤드 등)를 로컬 샤드에 합친다. 추가 건수 반환."""
+    try:
+        return _get_sent_store().merge_text(text)
+    except Exception as e:
+        print(f"[WARNING] 발송 이력 병합 실패: {e}")
+        return 0
 
-        data = {
-            "url_timestamps": url_timestamps,
-            "urls": list(url_timestamps.keys()),  # 하위 호환성
-            "last_updated": now.strftime("%Y-%m-%d %H:%M:%S"),
-            "count": len(url_timestamps),
-            "ttl_days": ttl_days
-        }
 
-        # 원자적 쓰기 (임시 파일 + rename)
-        # 동시 쓰기 시에도 파일 손상 방지
-        temp_fd, temp_path = tempfile.mkstemp(dir=DATA_FOLDER, suffix='.tmp')
-        try:
-            # os.fdopen이 temp_fd를 인수받으므로, 이후 temp_fd는 자동으로 관리됨
-            with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+def merge_sent_manifest(text: str) -> int:
+    """원격 발송 이력 매니페스트(샤드 이름 목록)를 로컬 매니페스트에 합친다. 추가 건수 반환."""
+    try:
+        return _get_sent_store().merge_manifest(text)
+    except Exception as e:
+        print(f"[WARNING] 발송 이력 매니페스트 병합 실패: {e}")
+        return 0
 
-            # Windows에서는 기존 파일 삭제 필요
-            if os.path.exists(SENT_CACHE_FILE):
-                try:
-                    os.remove(SENT_CACHE_FILE)
-                except Exception:
-                    pass
 
-            # 임시 파일을 최종 파일로 이동 (원자적 연산)
-            os.replace(temp_path, SENT_CACHE_FILE)
+def save_sent_cache(cache, ttl_days: int = None):
+    """
+    발송 이력 저장 — 이력에 없는 URL만 현재 시각으로 오늘 샤드에 덧붙인다 (전체 재작성 없음)
 
-            print(f"[DEBUG] 전송 캐시 저장 완료: {len(url_timestamps)}건 (TTL: {ttl_days}일) -> {SENT_CACHE_FILE}")
-        except Exception as e:
-            # 임시 파일 정리 - 파일이 이미 닫혔을 수 있으므로 조심스럽게 처리
-            try:
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
-            except Exception:
-                pass
-            raise e
+    Args:
+        cache: load_sent_cache()로 받아 add()한 FingerprintSet(추가분만 기록) 또는 URL 집합
+               (집합에서 빠진 URL은 로그에서 지우지 않음 — 만료는 TTL로)
+        ttl_days: 하위 호환용 (보관 기간은 SENT_CACHE_TTL_DAYS)
+    """
+    try:
+        urls = cache.added_urls() if isinstance(cache, FingerprintSet) else cache
+        added = _get_sent_store().add(urls)
+        if isinstance(cache, FingerprintSet):
+            cache.take_added(len(urls))  # 기록 끝난 추가분은 비움 (장수 캐시가 매 저장마다 전체 이력을 다시 넘기지 않도록)
+        if added:
+            print(f"[DEBUG] 전송 캐시 저장 완료: +{added}건 -> {SENT_DIR}")
     except Exception as e:
         print(f"[WARNING] 전송 캐시 저장 실패: {e}")
 
 
-# ======================== Pending 큐 관리 ========================
-
 def _generate_article_hash(title: str, date: str) -> str:
     """
     기사 해시 ID 생성 (URL 외 보조 식별자)
@@ -913,92 +1185,58 @@ def _generate_article_hash(title: str, date: str) -> str:
         return ""
 
 
+_pending_journal = None
+
+
+def _get_pending_journal() -> "pending_journal.PendingJournal":
+    """프로세스 공유 pending 저널 (구 pending_articles.json은 첫 로드 때 이벤트로 읽혀 다음 압축에서 변환됨)"""
+    global _pending_journal
+    if _pending_journal is None:
+        _pending_journal = pending_journal.PendingJournal(
+            PENDING_QUEUE_FILE, PENDING_LOG_FILE, ttl_hours=PENDING_TTL_HOURS)
+    return _pending_journal
+
+
 def load_pending_queue() -> dict:
     """
-    Pending 큐 로드 (TTL 적용)
+    Pending 큐 로드 (스냅샷 + 저널 재생, TTL 적용). 다른 프로세스가 덧붙인 이벤트만 증분으로 읽는다.
 
     Returns:
         dict: {url: {title, link, date, press, keyword, sentiment, retry_count, last_attempt, hash_id}}
     """
-    if os.path.exists(PENDING_QUEUE_FILE):
-        try:
-            with open(PENDING_QUEUE_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-                pending_queue = data.get("queue", {})
-                now = datetime.now()
-
-                # TTL 적용: 오래된 기사 제거
-                valid_queue = {}
-                expired_count = 0
-                for url, article in pending_queue.items():
-                    try:
-                        last_attempt = datetime.fromisoformat(article.get("last_attempt", ""))
-                        hours_diff = (now - last_attempt).total_seconds() / 3600
-
-                        if hours_diff <= PENDING_TTL_HOURS:
-                            valid_queue[url] = article
-                        else:
-                            expired_count += 1
-                    except Exception:
-                        # 파싱 실패 시 포함 (안전 장치)
-                        valid_queue[url] = article
-
-                if expired_count > 0:
-                    print(f"[DEBUG] Pending 큐 TTL 만료: {expired_count}건 제거")
+    try:
+        journal = _get_pending_journal()
+        queue = journal.load()
+        expired = journal.expired_count()
+        if expired > 0:
+            print(f"[DEBUG] Pending 큐 TTL 만료: {expired}건 제외")
+        print(f"[DEBUG] Pending 큐 로드: {len(queue)}건 (TTL: {PENDING_TTL_HOURS}시간)")
+        return queue
+    except Exception as e:
+        print(f"[WARNING] Pending 큐 로드 실패: {e}")
+        return {}
 
-                print(f"[DEBUG] Pending 큐 로드: {len(valid_queue)}건 (TTL: {PENDING_TTL_HOURS}시간)")
-                return valid_queue
 
-        except Exception as e:
-            print(f"[WARNING] Pending 큐 로드 실패: {e}")
-            return {}
-    else:
-        print(f"[DEBUG] Pending 큐 파일 없음 - 새로 생성")
-        return {}
+def merge_pending_journal(text: str) -> int:
+    """다른 발송 주체의 pending 저널·스냅샷 텍스트(원격 repo 등)를 로컬 저널에 합친다. 추가 이벤트 수 반환."""
+    try:
+        return _get_pending_journal().merge_text(text)
+    except Exception as e:
+        print(f"[WARNING] Pending 저널 병합 실패: {e}")
+        return 0
 
 
 def save_pending_queue(queue: dict):
     """
-    Pending 큐 저장 (원자적 쓰기)
+    Pending 큐 저장 — 마지막 로드/저장 이후 바뀐 항목만 저널에 이벤트로 덧붙인다 (전체 재작성 없음)
 
     Args:
         queue: {url: {title, link, date, press, keyword, sentiment, retry_count, last_attempt, hash_id}}
     """
     try:
-        import tempfile
-        os.makedirs(DATA_FOLDER, exist_ok=True)
-
-        data = {
-            "queue": queue,
-            "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "count": len(queue)
-        }
-
-        # 원자적 쓰기 (임시 파일 + rename)
-        temp_fd, temp_path = tempfile.mkstemp(dir=DATA_FOLDER, suffix='.tmp')
-        try:
-            # os.fdopen이 temp_fd를 인수받으므로, 이후 temp_fd는 자동으로 관리됨
-            with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-
-            # Windows에서는 기존 파일 삭제 필요
-            if os.path.exists(PENDING_QUEUE_FILE):
-                try:
-                    os.remove(PENDING_QUEUE_FILE)
-                except Exception:
-                    pass
-
-            os.replace(temp_path, PENDING_QUEUE_FILE)
-            print(f"[DEBUG] Pending 큐 저장 완료: {len(queue)}건 -> {PENDING_QUEUE_FILE}")
-        except Exception as e:
-            # 임시 파일 정리 - 파일이 이미 닫혔을 수 있으므로 조심스럽게 처리
-            try:
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
-            except Exception:
-                pass
-            raise e
+        written = _get_pending_journal().sync(queue)
+        if written:
+            print(f"[DEBUG] Pending 큐 저장 완료: {len(queue)}건 (이벤트 +{written}) -> {PENDING_LOG_FILE}")
     except Exception as e:
         print(f"[WARNING] Pending 큐 저장 실패: {e}")
 
@@ -1008,7 +1246,7 @@ def add_to_pending(article: dict, pending_queue: dict) -> dict:
     Pending 큐에 기사 추가
 
     Args:
-        article: {title, link, date, press, keyword, sentiment}
+        article: {title, link, date, press, keyword, sentiment, outlets}
         pending_queue: 현재 pending 큐
 
     Returns:
@@ -1033,6 +1271,8 @@ def add_to_pending(article: dict, pending_queue: dict) -> dict:
             "press": article.get("press", ""),
             "keyword": article.get("keyword", ""),
             "sentiment": article.get("sentiment", "pos"),
+            "outlets": article.get("outlets", []),
+            "queued_at": time.time(),  # 대기 지연(alert_queue) 측정 기준
             "retry_count": 0,
             "last_attempt": datetime.now().isoformat(),
             "hash_id": hash_id
@@ -1046,13 +1286,14 @@ def add_to_pending(article: dict, pending_queue: dict) -> dict:
         return pending_queue
 
 
-def remove_from_pending(url: str, pending_queue: dict) -> dict:
+def remove_from_pending(url: str, pending_queue: dict, reason: str = "drop") -> dict:
     """
     Pending 큐에서 기사 제거
 
     Args:
         url: 제거할 기사 URL
         pending_queue: 현재 pending 큐
+        reason: 저널에 남길 사유 ("success" 발송 완료 / "drop" 폐기)
 
     Returns:
         dict: 업데이트된 pending 큐
@@ -1061,6 +1302,7 @@ def remove_from_pending(url: str, pending_queue: dict) -> dict:
         if url in pending_queue:
             title = pending_queue[url].get("title", "")
             del pending_queue[url]
+            _get_pending_journal().note_removal(url, reason)
             print(f"[DEBUG] Pending 큐 제거: {title[:50]}...")
         return pending_queue
     except Exception as e:
@@ -1077,62 +1319,34 @@ def _quota_day() -> str:
     UTC 자정(=한국 오전 9시)에 리셋됐다. 네이버 API 실제 할당량은 한국 자정(00:00 KST)에
     리셋되므로, 이를 일치시켜 리셋 시점 혼선과 잔여량 오차를 없앤다.
     """
-    return datetime.now(timezone(timedelta(hours=9))).strftime("%Y-%m-%d")
+    return quota_ledger.quota_day()
 
 
-def _load_api_usage_data() -> dict:
-    """api_usage.json 전체 로드 (오늘 날짜만 유효, 아니면 초기화)."""
-    today = _quota_day()
-    if os.path.exists(API_USAGE_FILE):
-        try:
-            with open(API_USAGE_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            if data.get("date") == today:
-                return data
-        except Exception as e:
-            print(f"[WARNING] API 사용량 로드 실패: {e}")
-    return {"date": today, "count": 0, "alerts_sent": []}
+# 사용량은 quota_ledger가 http_client 계층에서 실제 네이버 검색 호출을 세어 메모리에 누적하고,
+# flush_api_usage()(라운드당 1회)에만 api_usage.json에 합산 기록한다.
+quota_ledger.configure(API_USAGE_FILE, MAX_API_CALLS_PER_DAY)
 
 
-def load_api_usage() -> int:
-    """오늘 API 사용량(호출 수) 로드"""
-    return _load_api_usage_data().get("count", 0)
+def _load_api_usage_data() -> dict:
+    """오늘 사용량 상태 {date, count, alerts_sent} (메모리 장부 기준)."""
+    return quota_ledger.snapshot()
 
 
-def _write_api_usage(count: int, alerts_sent: list):
-    """api_usage.json 기록 (count + 당일 경고 발송 플래그 alerts_sent 보존)."""
-    os.makedirs(DATA_FOLDER, exist_ok=True)
-    today = _quota_day()
-    data = {
-        "date": today,
-        "count": count,
-        "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "quota_remaining": MAX_API_CALLS_PER_DAY - count,
-        "quota_percentage": (count / MAX_API_CALLS_PER_DAY) * 100,
-        "alerts_sent": alerts_sent,  # 당일 이미 보낸 임계값 라벨(["80","95"]) — 중복 알림 방지
-    }
-    with open(API_USAGE_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+def load_api_usage() -> int:
+    """오늘 API 사용량(호출 수) — 마지막 동기화 값 + 이 프로세스의 미반영 호출 수"""
+    return quota_ledger.usage()
 
 
-def save_api_usage(count: int):
-    """오늘 API 사용량 저장 (당일 경고 발송 플래그는 보존)"""
+def flush_api_usage() -> int:
+    """메모리 장부를 api_usage.json에 합산 기록 (파일 락 + 원자적 쓰기) 후 최신 사용량 반환"""
     try:
-        existing = _load_api_usage_data()
-        alerts_sent = existing.get("alerts_sent", [])
-        _write_api_usage(count, alerts_sent)
+        count = quota_ledger.flush()
         pct = (count / MAX_API_CALLS_PER_DAY) * 100
-        print(f"[DEBUG] API 사용량 저장: {count}/{MAX_API_CALLS_PER_DAY} ({pct:.1f}%)")
+        print(f"[DEBUG] API 사용량 동기화: {count}/{MAX_API_CALLS_PER_DAY} ({pct:.1f}%)")
+        return count
     except Exception as e:
-        print(f"[WARNING] API 사용량 저장 실패: {e}")
-
-
-def increment_api_usage(calls: int = 1) -> int:
-    """API 사용량 증가 및 현재 사용량 반환"""
-    current = load_api_usage()
-    new_count = current + calls
-    save_api_usage(new_count)
-    return new_count
+        print(f"[WARNING] API 사용량 동기화 실패: {e}")
+        return quota_ledger.usage()
 
 
 def check_api_quota(required_calls: int = 1) -> bool:
@@ -1192,11 +1406,14 @@ def mark_initialized():
 
 # ======================== 신규 기사 감지 ========================
 
-def detect_new_articles(old_df: pd.DataFrame, new_df: pd.DataFrame, sent_cache: set, pending_queue: dict = None) -> list:
+def detect_new_articles(old_df: pd.DataFrame, new_df: pd.DataFrame, sent_cache: set, pending_queue: dict = None,
+                        story_seed: dict = None) -> list:
     """
     기존 DB와 새로운 데이터를 비교하여 신규 기사 감지
     - URL을 우선 식별자로 사용
     - 캐시와 DB 중복 체크
+    - story_seed: build_story_seed() 결과. 키워드마다 호출하는 라운드에서는 1회 만들어 넘긴다
+      (없으면 이 호출에서 만든다)
     """
     try:
         # 첫 실행 체크 (상태 파일 기준)
@@ -1217,87 +1434,77 @@ def detect_new_articles(old_df: pd.DataFrame, new_df: pd.DataFrame, sent_cache:
         KST = timezone(timedelta(hours=9))
         now = datetime.now(KST).replace(tzinfo=None)  # KST 시간을 naive datetime으로
 
-        # 기존 DB의 URL + 해시 ID 세트 생성 (강화된 중복 체크)
-        old_urls = set()
-        old_urls_normalized = set()
-        old_hash_ids = set()  # 해시 ID 기반 중복 체크
-
-        for _, row in old_df.iterrows():
-            url = str(row.get("URL", "")).strip()
-            if url and url != "nan" and url != "":
-                old_urls.add(url)
-                old_urls_normalized.add(_normalize_url(url))
-
-                # 해시 ID 생성 및 수집
-                title = str(row.get("기사제목", "")).strip()
-                date = str(row.get("날짜", "")).strip()
-                hash_id = _generate_article_hash(title, date)
-                if hash_id:
-                    old_hash_ids.add(hash_id)
-
-        print(f"[DEBUG] 기존 DB URL 수: {len(old_urls)} (정규화: {len(old_urls_normalized)})")
-        print(f"[DEBUG] 기존 DB 해시 ID 수: {len(old_hash_ids)}건")
+        # 식별자 인덱스(저장 시 증분 갱신) + 이번에 넘어온 기존 DB(최대 200행)를 함께 대조.
+        # DB는 다른 발송 주체가 쓴 행을 포함할 수 있어 인덱스에 없는 행만 해시를 계산해 보탠다.
+        index = article_index.get_index()
+        old_urls = old_df["URL"].fillna("").astype(str).str.strip() if "URL" in old_df.columns else pd.Series(dtype=object)
+        old_has_url = old_urls.ne("") & old_urls.ne("nan")
+        old_canon = news_schema.url_keys(old_df).reindex(old_urls.index)[old_has_url]
+        old_extra = old_canon[~old_canon.map(index.urls.__contains__)]
+        old_extra_hashes = set(article_index.content_hashes(
+            old_df.loc[old_extra.index, "기사제목"].astype(str).str.strip(),
+            news_schema.date_strings(old_df.loc[old_extra.index, "날짜"]),
+        )) if not old_extra.empty else set()
+        old_url_set = set(old_urls[old_has_url]) | set(old_extra)
+
+        print(f"[DEBUG] 기사 인덱스: {len(index)}건 (+ 인덱스 밖 기존 DB {len(old_extra)}건)")
         print(f"[DEBUG] 캐시 크기: {len(sent_cache)}건")
         print(f"[DEBUG] 수집된 신규 데이터 수: {len(new_df)}")
 
-        # 신규 기사 감지 (시간 필터링 추가)
-        new_articles = []
-        MAX_ARTICLE_AGE_HOURS = 2  # 발행 2시간 초과 기사 스킵 (캐시 유실 시 반복 발송 방지)
-
-        for _, row in new_df.iterrows():
-            url = str(row.get("URL", "")).strip()
-            title = str(row.get("기사제목", "")).strip()
-            article_date_str = row.get("날짜", "")
-
-            # URL이 없거나 비어있으면 스킵
-            if not url or url == "nan" or url == "":
-                continue
-
-            # URL 정규화
-            url_normalized = _normalize_url(url)
-
-            # 해시 ID 생성 (보조 식별자)
-            hash_id = _generate_article_hash(title, article_date_str)
-
-            # 5단계 중복 체크: URL + 정규화 URL + 캐시 + 해시 ID + pending 큐
-            is_in_db_url = url in old_urls or url_normalized in old_urls_normalized
-            is_in_cache = url in sent_cache or url_normalized in sent_cache
-            is_in_db_hash = hash_id in old_hash_ids if hash_id else False
-            is_in_pending = bool(pending_queue) and (url in pending_queue or url_normalized in pending_queue)
+        # 컬럼 단위 식별자 계산
+        urls = new_df["URL"].fillna("").astype(str).str.strip()
+        has_url = urls.ne("") & urls.ne("nan")
+        urls, cand = urls[has_url], new_df.loc[has_url]
+        canon = news_schema.url_keys(cand)
+        hashes = article_index.content_hashes(cand["기사제목"].astype(str).str.strip(),
+                                              news_schema.date_strings(cand["날짜"]))
+
+        # 5단계 중복 체크: URL + 정규화 URL + 캐시 + 해시 ID + pending 큐 (집합 멤버십, 행 수에만 비례)
+        in_db_url = (urls.map(old_url_set.__contains__) | canon.map(old_url_set.__contains__)
+                     | canon.map(index.urls.__contains__))
+        in_db_hash = hashes.map(index.hashes.__contains__) | hashes.map(old_extra_hashes.__contains__)
+        if isinstance(sent_cache, FingerprintSet):  # 지문이 정규화 URL 기준이라 1회 조회로 충분
+            in_cache = pd.Series(sent_cache.contains_many(urls), index=urls.index)
+        else:
+            in_cache = urls.map(sent_cache.__contains__) | canon.map(sent_cache.__contains__)
+        if pending_queue:
+            in_pending = urls.map(pending_queue.__contains__) | canon.map(pending_queue.__contains__)
+        else:
+            in_pending = pd.Series(False, index=urls.index)
+        duplicate = in_db_url | in_db_hash | in_cache | in_pending
 
-            if is_in_db_url or is_in_cache or is_in_db_hash or is_in_pending:
-                if is_in_db_hash and not is_in_db_url:
-                    print(f"[DEBUG] 🔍 해시 ID 중복 감지 (다른 URL): {title[:50]}...")
-                if is_in_pending:
-                    print(f"[DEBUG] ⏭️ Pending 큐 중복 스킵: {title[:50]}...")
-                continue
+        n_hash_only = int((in_db_hash & ~in_db_url).sum())
+        if n_hash_only:
+            print(f"[DEBUG] 🔍 해시 ID 중복 감지 (다른 URL): {n_hash_only}건")
+        if in_pending.any():
+            print(f"[DEBUG] ⏭️ Pending 큐 중복 스킵: {int(in_pending.sum())}건")
 
-            # 신규 기사 - 날짜 필터링 (개선됨)
-            article_date_str = row.get("날짜", "")
-            should_notify = True  # 기본값: 신규 기사면 알림
-            hours_diff = None
+        # 신규 기사 - 날짜 필터링
+        MAX_ARTICLE_AGE_HOURS = 2  # 발행 2시간 초과 기사 스킵 (캐시 유실 시 반복 발송 방지)
+        fresh = cand.loc[~duplicate]
+        dates = news_schema.parse_dates(fresh["날짜"])
+        hours_diff = (now - dates).dt.total_seconds() / 3600
 
-            try:
-                article_date = pd.to_datetime(article_date_str, errors="coerce")
-                if pd.notna(article_date):
-                    time_diff = now - article_date
-                    hours_diff = time_diff.total_seconds() / 3600
-
-                    # 시간 기반 필터링: 최근 7일 이내만 알림
-                    if hours_diff <= MAX_ARTICLE_AGE_HOURS:
-                        print(f"[DEBUG] ✅ 신규 기사 감지: {title[:50]}... ({hours_diff:.1f}시간 전)")
-                    else:
-                        print(f"[DEBUG] ⏭️ 오래된 기사 스킵 ({hours_diff:.1f}시간 경과): {title[:50]}...")
-                        continue  # 발행 2시간 초과 기사는 발송 스킵
+        new_articles, stories = [], []
+        for idx, row in fresh.iterrows():
+            url = urls[idx]
+            title = str(row.get("기사제목", "")).strip()
+            article_date_str = news_schema.format_date(row.get("날짜"))  # 대기열(JSON)에는 문자열로
+            hd = hours_diff[idx]
+            if pd.notna(hd):
+                if hd <= MAX_ARTICLE_AGE_HOURS:
+                    print(f"[DEBUG] ✅ 신규 기사 감지: {title[:50]}... ({hd:.1f}시간 전)")
                 else:
-                    # 날짜 파싱 실패 시에도 신규 기사로 처리 (개선!)
-                    print(f"[DEBUG] ⚠️ 날짜 파싱 실패, 하지만 신규 기사로 알림: {title[:50]}... (날짜: {article_date_str})")
-            except Exception as e:
-                # 예외 발생 시에도 신규 기사로 처리 (개선!)
-                print(f"[DEBUG] ⚠️ 날짜 처리 오류, 하지만 신규 기사로 알림: {title[:50]}... - {str(e)}")
-
-            # 매체명과 키워드 추출
-            press = _publisher_from_link(url)
+                    print(f"[DEBUG] ⏭️ 오래된 기사 스킵 ({hd:.1f}시간 경과): {title[:50]}...")
+                    continue  # 발행 2시간 초과 기사는 발송 스킵
+            else:
+                # 날짜 파싱 실패 시에도 신규 기사로 처리
+                print(f"[DEBUG] ⚠️ 날짜 파싱 실패, 하지만 신규 기사로 알림: {title[:50]}... (날짜: {article_date_str})")
+
+            # 매체명과 키워드 추출 (수집 단계에서 채운 컬럼 사용)
+            press = row.get("매체명")
+            if not isinstance(press, str) or not press:
+                press = _publisher_from_link(url)
             keyword = str(row.get("검색키워드", "")).strip()
             sentiment = str(row.get("sentiment", "pos")).strip()
 
@@ -1309,7 +1516,11 @@ def detect_new_articles(old_df: pd.DataFrame, new_df: pd.DataFrame, sent_cache:
                 "keyword": keyword,
                 "sentiment": sentiment
             })
+            stories.append((canon[idx] or url, f"{title} {row.get('주요기사 요약', '')}", dates[idx]))
 
+        if new_articles and story_seed is None:
+            story_seed = build_story_seed(old_df, sent_cache, now)
+        new_articles = _collapse_story_duplicates(new_articles, stories, story_seed, pending_queue, now)
         print(f"[DEBUG] 총 {len(new_articles)}건의 신규 기사 감지 (DB+캐시 중복 제거)")
         return new_articles
 
@@ -1320,6 +1531,112 @@ def detect_new_articles(old_df: pd.DataFrame, new_df: pd.DataFrame, sent_cache:
         return []
 
 
+def build_story_seed(old_df: pd.DataFrame, sent_cache: set, now: datetime = None) -> dict:
+    """
+    스토리 묶음의 라운드 시작 상태 — 라운드당 1회 만들어 detect_new_articles에 넘긴다
+
+    - 최근 WINDOW_HOURS 아카이브 + 기존 DB 기사를 프로세스 공유 스토리 인덱스에 넣는다(이미 본 키는 건너뜀)
+    - 그중 발송 이력에 있는 기사의 스토리는 'alerted'(이미 알린 스토리)
+    - 'leaders'는 이번 라운드에 대표로 뽑혀 대기열에 들어간 기사 {클러스터 id: URL}
+
+    Returns:
+        dict: {index, alerted, leaders}
+    """
+    if now is None:
+        now = datetime.now(timezone(timedelta(hours=9))).replace(tzinfo=None)
+    index = story_clusters.get_index()
+    seed = {"index": index, "alerted": set(), "leaders": {}}
+    try:
+        cutoff = now - timedelta(hours=story_clusters.WINDOW_HOURS)
+        index.prune(cutoff)
+        try:
+            recent = news_archive.get_archive().query(start=cutoff)
+        except Exception as e:
+            print(f"[WARNING] 스토리 묶음용 아카이브 조회 실패(기존 DB만 사용): {e}")
+            recent = news_schema.empty_frame()
+
+        for frame in (recent, old_df):
+            if frame is None or frame.empty:
+                continue
+            urls = frame["URL"].fillna("").astype(str).str.strip()
+            keys = news_schema.url_keys(frame).where(lambda k: k.ne(""), urls)
+            texts = frame["기사제목"].astype(str) + " " + frame["주요기사 요약"].astype(str)
+            dates = news_schema.parse_dates(frame["날짜"])
+            if isinstance(sent_cache, FingerprintSet):
+                notified = pd.Series(sent_cache.contains_many(urls), index=urls.index)
+            else:
+                notified = urls.map(sent_cache.__contains__) | keys.map(sent_cache.__contains__)
+            for key, text, date, hit in zip(keys, texts, dates, notified):
+                if not key:
+                    continue
+                cid = index.add(key, text, None if pd.isna(date) else date)
+                if hit:
+                    seed["alerted"].add(cid)
+        print(f"[DEBUG] 스토리 인덱스: {len(index)}건 (이미 알린 스토리 {len(seed['alerted'])}개)")
+    except Exception as e:
+        print(f"[WARNING] 스토리 인덱스 준비 실패(이번 라운드 기사끼리만 묶음): {e}")
+    return seed
+
+
+def _collapse_story_duplicates(new_articles: list, stories: list, seed: dict,
+                               pending_queue: dict, now: datetime) -> list:
+    """
+    같은 보도자료를 옮긴 여러 매체 기사(근사 중복)를 스토리 단위로 묶어 1건만 알림
+
+    - 발송 이력에 있는 스토리(seed["alerted"])의 새 매체 기사는 스킵
+    - 대표가 아직 대기열에 있는 스토리면 새 매체를 그 대기 항목의 "outlets"에 덧붙이고 스킵
+      (대기 항목은 발송 전이라 '외 N개 매체'에 포함됨)
+    - 처음 나온 스토리는 첫 기사(태그 우선순위·최신순)가 대표, 나머지 매체는 대표의 "outlets"로
+      합쳐 메시지에 '외 N개 매체'로 표시. 하나라도 부정이면 대표도 부정.
+    """
+    if not new_articles:
+        return new_articles
+    try:
+        index, alerted, leaders = seed["index"], seed["alerted"], seed["leaders"]
+        pending_queue = pending_queue or {}
+        for url, entry in pending_queue.items():  # 이전 라운드에서 넘어온 대기 항목도 대표로 등록
+            key = canonical_url(url) or url
+            if key not in index:
+                published = news_schema.parse_date(entry.get("date"))
+                index.add(key, entry.get("title", ""), now if pd.isna(published) else published)
+            leaders.setdefault(index.cluster_of(key), url)
+
+        out, current, n_known, n_pending = [], {}, 0, 0
+        for article, (key, text, date) in zip(new_articles, stories):
+            cid = index.add(key, text, None if pd.isna(date) else date)
+            leader = current.get(cid)
+            if leader is None and cid not in alerted:
+                if cid not in leaders:
+                    article["outlets"] = []
+                    leaders[cid] = article["link"]
+                    current[cid] = article
+                    out.append(article)
+                    continue
+                leader = pending_queue.get(leaders[cid])
+                if leader is None:  # 대표가 이미 발송됨(대기열에서 빠짐) → 이미 알린 스토리
+                    alerted.add(cid)
+                else:
+                    n_pending += 1
+            if leader is None:
+                n_known += 1
+                print(f"[DEBUG] ⏭️ 이미 알린 스토리의 다른 매체 기사 스킵: [{article['press']}] {article['title'][:40]}...")
+                continue
+            outlets = leader.setdefault("outlets", [])
+            if article["press"] and article["press"] != leader.get("press") and article["press"] not in outlets:
+                outlets.append(article["press"])
+            if article["sentiment"] == "neg":
+                leader["sentiment"] = "neg"
+
+        n_merged = len(new_articles) - len(out) - n_known - n_pending
+        if n_merged or n_known or n_pending:
+            print(f"[DEBUG] 📰 스토리 묶음: {len(new_articles)}건 → {len(out)}건 "
+                  f"(같은 스토리 합침 {n_merged}건, 대기 중 대표에 합침 {n_pending}건, 이미 알린 스토리 {n_known}건)")
+        return out
+    except Exception as e:
+        print(f"[WARNING] 스토리 묶음 실패(개별 기사로 알림): {e}")
+        return new_articles
+
+
 # ======================== 텔레그램 알림 ========================
 
 def merge_remote_sent_cache(sent_cache: set) -> set:
@@ -1329,17 +1646,33 @@ def merge_remote_sent_cache(sent_cache: set) -> set:
     news_monitor 백업 워크플로) 동시 가동되므로, 각자 프로세스 시작 시점 캐시만 믿으면
     다른 주체가 방금 보낸 기사를 '미발송'으로 판단해 중복 발송이 발생한다.
     발송 루프 직전에 원격 캐시를 병합해 이 창을 프로세스 수명(최대 50분) → 수 초로 줄인다.
-    실패해도 기존 캐시로 진행 (기능 저하 없음, 중복 방지만 약화)."""
+    실패해도 기존 캐시로 진행 (기능 저하 없음, 중복 방지만 약화).
+
+    발송 이력은 일자별 샤드라 매니페스트(수십 바이트)로 원격에 있는 샤드를 확인하고
+    최근 REMOTE_SENT_SHARDS일(오늘·어제) 샤드만 받는다 (수 KB)."""
     try:
         repo = os.getenv("GH_REPO", "kimwoss/Risk_management")
-        url = f"https://raw.githubusercontent.com/{repo}/main/data/sent_articles_cache.json?t={int(time.time())}"
-        r = requests.get(url, timeout=8)
+        base = f"https://raw.githubusercontent.com/{repo}/main/data/sent"
+        stamp = int(time.time())
+        wanted = sent_store.recent_shards(REMOTE_SENT_SHARDS)
+        r = http_client.get(f"{base}/{sent_store.MANIFEST_NAME}?t={stamp}", timeout=8)
         if r.status_code == 200:
-            data = r.json()
-            remote_urls = data.get("url_timestamps", {}).keys() if "url_timestamps" in data else data.get("urls", [])
+            listed = set(sent_store.parse_manifest(r.content.decode("utf-8", errors="replace")))
+            wanted = [name for name in wanted if name in listed]
+        parts = []
+        for name in wanted:
+            r = http_client.get(f"{base}/{name}{sent_store.SHARD_SUFFIX}?t={stamp}", timeout=8)
+            if r.status_code == 200:
+                parts.append(r.content.decode("utf-8", errors="replace"))
+        text = "\n".join(parts)
+        if text:
+            merge_sent_log(text)
+            remote_urls = sent_store.parse_lines(text).keys()
             before = len(sent_cache)
-            for u in remote_urls:
-                sent_cache.add(u)
+            if isinstance(sent_cache, FingerprintSet):  # 이미 로그에 합쳤으니 추가분(added_urls)으로 남기지 않음
+                sent_cache.add_fingerprints(fingerprints(remote_urls))
+            else:
+                sent_cache.update(remote_urls)
             added = len(sent_cache) - before
             if added:
                 print(f"[DEBUG] 원격 sent_cache 병합: +{added}건 (다른 발송 주체의 최근 발송분)")
@@ -1348,25 +1681,142 @@ def merge_remote_sent_cache(sent_cache: set) -> set:
     return sent_cache
 
 
-def process_pending_queue_and_send(pending_queue: dict, sent_cache: set) -> tuple:
+def _alert_message(article: dict) -> str:
+    """기사 1건 알림 메시지 (sentiment에 따라 이모지 변경)"""
+    title = article.get("title", "제목 없음")
+    date = article.get("date", "")
+    press = article.get("press", "")
+    keyword = article.get("keyword", "")
+    outlets = article.get("outlets") or []
+    link = article.get("link", "")
+
+    emoji = "🔴" if article.get("sentiment", "pos") == "neg" else "🟢"
+    message = f"{emoji} *새 뉴스*\n\n"
+    if keyword:
+        hashtag = keyword.replace(" ", "")
+        message += f"#{hashtag}\n"
+    if press:
+        message += f"*[{press}]* {title}\n"
+    else:
+        message += f"*{title}*\n"
+    if outlets:
+        message += f"📰 외 {len(outlets)}개 매체: {', '.join(outlets[:OUTLETS_SHOWN])}"
+        message += " 등\n" if len(outlets) > OUTLETS_SHOWN else "\n"
+    if date:
+        message += f"🕐 {date}\n"
+    if link:
+        message += f"🔗 {link}"
+    return message
+
+
+_DIGEST_PLAIN = str.maketrans({"[": "(", "]": ")", "*": "", "_": " ", "`": "'"})
+
+
+def _digest_line(article: dict) -> str:
+    """묶음 메시지의 기사 1줄: • 제목(링크) — 매체 HH:MM (+N개 매체)"""
+    title = str(article.get("title", "제목 없음")).translate(_DIGEST_PLAIN)
+    link = article.get("link", "")
+    line = f"• [{title}]({link})" if link else f"• {title}"
+    press = str(article.get("press", "")).translate(_DIGEST_PLAIN)
+    hhmm = str(article.get("date", ""))[11:16]
+    tail = " ".join(x for x in (press, hhmm) if x)
+    if tail:
+        line += f" — {tail}"
+    outlets = article.get("outlets") or []
+    if outlets:
+        line += f" (+{len(outlets)}개 매체)"
+    return line + "\n"
+
+
+def _digest_messages(items: list) -> list:
+    """
+    기사 여러 건 → 묶음 메시지 목록 [(url 튜플, 텍스트), ...]
+
+    키워드 태그·감성별로 묶고, 메시지 하나가 DIGEST_MAX_CHARS를 넘으면 다음 메시지로 나눈다
+    (이어지는 묶음은 태그 머리글을 다시 붙임).
+    """
+    groups: dict = {}
+    for url, article in items:
+        groups.setdefault((article.get("keyword", ""), article.get("sentiment", "pos")), []).append((url, article))
+
+    limit = DIGEST_MAX_CHARS - 100  # 머리글·파트 번호 여유
+    chunks, text, urls = [], "", []
+    for (keyword, sentiment), members in groups.items():
+        emoji = "🔴" if sentiment == "neg" else "🟢"
+        head = f"\n{emoji} #{keyword.replace(' ', '') or '기타'} · {len(members)}건\n"
+        headed = False
+        for url, article in members:
+            line = _digest_line(article)
+            piece = line if headed else head + line
+            if text and len(text) + len(piece) > limit:
+                chunks.append((tuple(urls), text))
+                text, urls = "", []
+                piece = head + line
+            text += piece
+            urls.append(url)
+            headed = True
+    if text:
+        chunks.append((tuple(urls), text))
+
+    total = len(items)
+    out = []
+    for i, (urls, body) in enumerate(chunks, 1):
+        part = f" ({i}/{len(chunks)})" if len(chunks) > 1 else ""
+        out.append((urls, f"📦 *새 뉴스 {total}건 묶음*{part}\n{body}"))
+    return out
+
+
+def _build_outbox(ready: list, chat_id: str) -> list:
+    """
+    발송 대상 [(url, article), ...] → 엔진 입력 [(url 튜플, chat_id, payload), ...]
+
+    대상이 DIGEST_THRESHOLD건 이상이면 묶음 모드: 부정 기사는 먼저 1건씩, 나머지는 묶음 메시지로.
+    """
+    def payload(text: str) -> dict:
+        return {
+            "chat_id": chat_id,
+            "text": text,
+            "parse_mode": "Markdown",
+            "disable_web_page_preview": True
+        }
+
+    if len(ready) < DIGEST_THRESHOLD:
+        return [((url,), chat_id, payload(_alert_message(article))) for url, article in ready]
+
+    negatives = [(url, a) for url, a in ready if a.get("sentiment") == "neg"]
+    others = [(url, a) for url, a in ready if a.get("sentiment") != "neg"]
+    outbox = [((url,), chat_id, payload(_alert_message(article))) for url, article in negatives]
+    if len(others) < 2:
+        outbox += [((url,), chat_id, payload(_alert_message(article))) for url, article in others]
+    else:
+        outbox += [(urls, chat_id, payload(text)) for urls, text in _digest_messages(others)]
+    return outbox
+
+
+def process_pending_queue_and_send(pending_queue: dict, sent_cache: set, urls: list = None,
+                                   budget: float = None, merge_remote: bool = True) -> tuple:
     """
     Pending 큐의 기사들을 텔레그램으로 전송 (개선된 버전)
 
     핵심 개선사항:
     - Pending 큐 기반 전송 (누락 방지)
-    - 텔레그램 429 응답의 retry_after 헤더 처리
+    - telegram_sender 토큰 버킷으로 허용 속도까지 병렬 전송 (고정 sleep 없음)
+    - 429 retry_after는 해당 채팅만 정지, 메시지별 마감 초과분은 시도 없이 다음 사이클로
     - 재시도 횟수 추적 (최대 5회)
     - 전송 성공 시 pending에서 제거 + sent_cache 추가
     - 전송 실패 시 retry_count 증가, 최대 초과 시 제거
+    - 발송 순서는 alert_queue 우선순위(부정 → 태그 등급 → 오래된 순), 등급별 대기 지연 집계
 
     Args:
-        pending_queue: {url: {title, link, date, press, keyword, sentiment, retry_count, last_attempt, hash_id}}
+        pending_queue: {url: {title, link, date, press, keyword, sentiment, outlets, queued_at, retry_count, last_attempt, hash_id}}
         sent_cache: 전송 완료된 기사 URL 캐시
+        urls: 이 pending 항목만 발송 (즉시 발송 경로). None이면 큐 전체
+        budget: 이번 발송 마감(초). None이면 SEND_BUDGET_SECONDS, 0 이하면 발송하지 않음(다음 사이클로)
+        merge_remote: 발송 직전 원격 발송 이력 병합 여부 (라운드당 1회만 하려면 두 번째 호출부터 False)
 
     Returns:
         tuple: (업데이트된 pending_queue, 업데이트된 sent_cache, 전송 성공 수)
     """
-    import time
     import traceback
 
     try:
@@ -1384,44 +1834,41 @@ def process_pending_queue_and_send(pending_queue: dict, sent_cache: set) -> tupl
             print("[DEBUG] Pending 큐 비어있음 - 전송할 기사 없음")
             return pending_queue, sent_cache, 0
 
-        # [중복 발송 방지] 발송 직전 원격 캐시 병합 - 다른 발송 주체의 최근 발송분 반영
-        sent_cache = merge_remote_sent_cache(sent_cache)
+        if budget is not None and budget <= 0:
+            print("[DEBUG] ⏱️ 발송 시간 소진 - 남은 기사는 다음 사이클에 발송")
+            return pending_queue, sent_cache, 0
 
-        # 텔레그램 API URL
-        api_url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+        # [중복 발송 방지] 발송 직전 원격 캐시 병합 - 다른 발송 주체의 최근 발송분 반영
+        if merge_remote:
+            sent_cache = merge_remote_sent_cache(sent_cache)
 
         success_count = 0
         failed_count = 0
+        deferred_count = 0
         max_retry_exceeded_count = 0
-        MAX_MESSAGES_PER_RUN = 10  # 1회 실행당 최대 발송 건수 (보도자료 배포 시 다수 기사 대응)
+        ready = []  # (url, article) — 발송 대상, 보낼 순서대로
 
-        # Pending 큐를 날짜 순으로 정렬 (과거 → 최신 순서로 전송)
         urls_to_remove = []
 
-        # 날짜 기준으로 정렬 (오래된 기사부터 전송)
-        sorted_items = sorted(
-            pending_queue.items(),
-            key=lambda x: x[1].get("date", ""),  # 날짜 문자열로 정렬 (YYYY-MM-DD HH:MM 형식)
-            reverse=False  # False = 오름차순 (과거 → 최신)
-        )
+        # 우선순위 힙: 부정 → 태그 등급(tag_priority) → 오래된 기사 순
+        targets = pending_queue if urls is None else {u: pending_queue[u] for u in urls if u in pending_queue}
+        queue = alert_queue.AlertQueue.from_pending(targets, tag_priority)
 
-        for url, article in sorted_items:
+        for url in queue:
+            article = pending_queue[url]
             # 1회 실행 최대 발송 건수 초과 시 중단 (캐시 리셋 등 이상 상황 대비)
-            if success_count >= MAX_MESSAGES_PER_RUN:
+            if len(ready) >= MAX_MESSAGES_PER_RUN:
                 print(f"[DEBUG] ⚠️ 1회 실행 최대 발송 건수({MAX_MESSAGES_PER_RUN}건) 도달 - 나머지는 다음 실행에 전송")
                 break
             title = article.get("title", "제목 없음")
             link = article.get("link", url)
             date = article.get("date", "")
-            press = article.get("press", "")
-            keyword = article.get("keyword", "")
-            sentiment = article.get("sentiment", "pos")
             retry_count = article.get("retry_count", 0)
 
             # 최대 재시도 초과 체크
             if retry_count >= MAX_PENDING_RETRY:
                 print(f"[DEBUG] ❌ 최대 재시도 초과 ({retry_count}회) - 제거: {title[:50]}...")
-                urls_to_remove.append(url)
+                urls_to_remove.append((url, "drop"))
                 max_retry_exceeded_count += 1
                 continue
 
@@ -1429,7 +1876,7 @@ def process_pending_queue_and_send(pending_queue: dict, sent_cache: set) -> tupl
             url_normalized = _normalize_url(link)
             if link in sent_cache or url_normalized in sent_cache:
                 print(f"[DEBUG] ⏭️ 이미 전송된 기사 - 스킵: {title[:50]}...")
-                urls_to_remove.append(url)
+                urls_to_remove.append((url, "success"))
                 continue
 
             # 오래된 pending 기사 폐기 (기본 1시간 초과 시 조용히 제거)
@@ -1440,127 +1887,66 @@ def process_pending_queue_and_send(pending_queue: dict, sent_cache: set) -> tupl
             # pending은 발송하지 않고 폐기한다. 값은 PENDING_MAX_AGE_HOURS 환경변수로 조정 가능.
             MAX_PENDING_ARTICLE_AGE_HOURS = int(os.getenv("PENDING_MAX_AGE_HOURS", "6"))
             try:
-                article_dt = pd.to_datetime(date, errors="coerce")
+                article_dt = news_schema.parse_date(date)
                 if pd.notna(article_dt):
                     _KST = timezone(timedelta(hours=9))
                     now_kst = datetime.now(_KST).replace(tzinfo=None)
                     age_hours = (now_kst - article_dt).total_seconds() / 3600
                     if age_hours > MAX_PENDING_ARTICLE_AGE_HOURS:
                         print(f"[DEBUG] ⏭️ 오래된 pending 기사 폐기 ({age_hours:.1f}시간): {title[:40]}...")
-                        urls_to_remove.append(url)
+                        urls_to_remove.append((url, "drop"))
                         continue
             except Exception:
                 pass
 
-            # 메시지 구성 (sentiment에 따라 이모지 변경)
-            emoji = "🔴" if sentiment == "neg" else "🟢"
-            message = f"{emoji} *새 뉴스*\n\n"
-            if keyword:
-                hashtag = keyword.replace(" ", "")
-                message += f"#{hashtag}\n"
-            if press:
-                message += f"*[{press}]* {title}\n"
-            else:
-                message += f"*{title}*\n"
-            if date:
-                message += f"🕐 {date}\n"
-            if link:
-                message += f"🔗 {link}"
-
-            payload = {
-                "chat_id": chat_id,
-                "text": message,
-                "parse_mode": "Markdown",
-                "disable_web_page_preview": True
-            }
-
-            response = None
-            send_success = False
-
-            try:
-                # 텔레그램 API 호출 (timeout 강화: connect 3초, read 10초)
-                response = requests.post(api_url, json=payload, timeout=(3, 10))
-
-                if response.status_code == 200:
-                    # 전송 성공
-                    success_count += 1
-                    send_success = True
-                    print(f"[DEBUG] ✅ 메시지 전송 성공: {title[:50]}...")
-
-                    # sent_cache에 추가
-                    sent_cache.add(link)
-                    sent_cache.add(_normalize_url(link))
-
-                    # pending에서 제거 예약
-                    urls_to_remove.append(url)
-
-                elif response.status_code == 429:
-                    # Rate Limit - retry_after 헤더 체크
-                    retry_after = None
-                    try:
-                        error_data = response.json()
-                        retry_after = error_data.get("parameters", {}).get("retry_after")
-                    except Exception:
-                        pass
-
-                    if retry_after:
-                        print(f"[DEBUG] ⚠️ Rate Limit (429) - {retry_after}초 후 재시도 권장")
-                        time.sleep(retry_after)
-                    else:
-                        print(f"[DEBUG] ⚠️ Rate Limit (429) - retry_after 없음, 5초 대기")
-                        time.sleep(5)
-
-                    # retry_count 증가
-                    pending_queue[url]["retry_count"] = retry_count + 1
-                    pending_queue[url]["last_attempt"] = datetime.now().isoformat()
-                    failed_count += 1
-
-                else:
-                    # 기타 에러
-                    print(f"[DEBUG] ❌ 전송 실패 ({response.status_code}): {title[:50]}...")
-                    pending_queue[url]["retry_count"] = retry_count + 1
-                    pending_queue[url]["last_attempt"] = datetime.now().isoformat()
-                    failed_count += 1
-
-            except requests.exceptions.Timeout:
-                print(f"[DEBUG] ⏱️ 타임아웃: {title[:50]}...")
-                pending_queue[url]["retry_count"] = retry_count + 1
-                pending_queue[url]["last_attempt"] = datetime.now().isoformat()
-                failed_count += 1
-
-            except requests.exceptions.RequestException as e:
-                print(f"[DEBUG] ❌ 네트워크 오류: {title[:50]}... - {str(e)}")
-                pending_queue[url]["retry_count"] = retry_count + 1
-                pending_queue[url]["last_attempt"] = datetime.now().isoformat()
-                failed_count += 1
-
-            except Exception as e:
-                print(f"[DEBUG] ❌ 예상치 못한 오류: {title[:50]}... - {str(e)}")
-                print(f"[DEBUG] 상세:\n{traceback.format_exc()}")
-                pending_queue[url]["retry_count"] = retry_count + 1
-                pending_queue[url]["last_attempt"] = datetime.now().isoformat()
-                failed_count += 1
-
-            finally:
-                # 연결 누수 방지
-                if response is not None:
-                    response.close()
-
-            # 메시지 간 딜레이: 성공 시 2초 대기 (5분 간격 분산 효과)
-            # 실패 시 짧게 대기 (재시도 목적)
-            if not send_success:
-                time.sleep(0.5)  # 실패 시 500ms 대기
+            ready.append((url, article))
+
+        outbox = _build_outbox(ready, chat_id)
+        if len(outbox) < len(ready):
+            print(f"[DEBUG] 📦 묶음 발송 모드: 기사 {len(ready)}건 → 메시지 {len(outbox)}건")
+
+        # 발송 (토큰 버킷이 허용하는 속도로 병렬 전송, 결과는 완료 순서대로 이 스레드에서 반영)
+        engine = telegram_sender.get_engine(bot_token)
+        for urls, outcome in engine.deliver(outbox, budget=SEND_BUDGET_SECONDS if budget is None else budget):
+            first = pending_queue[urls[0]].get("title", "제목 없음")
+            label = f"묶음 {len(urls)}건" if len(urls) > 1 else first[:50]
+            if outcome.status == "sent":
+                success_count += len(urls)
+                print(f"[DEBUG] ✅ 메시지 전송 성공: {label}...")
+                for url in urls:
+                    queue.record(url)
+                    # sent_cache에 추가 (지문은 정규화 URL 기준 — 원본/정규화 형태 모두 매칭)
+                    sent_cache.add(pending_queue[url].get("link", url))
+                    urls_to_remove.append((url, "success"))
+                continue
+            if outcome.status == "deferred":
+                deferred_count += len(urls)  # 시도하지 않음 → retry_count 유지
+                continue
+            if outcome.status == "rate_limited":
+                print(f"[DEBUG] ⚠️ Rate Limit (429) - {outcome.detail:.0f}초 후 재시도 권장: {label}...")
+            elif outcome.status == "timeout":
+                print(f"[DEBUG] ⏱️ 타임아웃: {label}...")
+            elif outcome.status == "failed":
+                print(f"[DEBUG] ❌ 전송 실패 ({outcome.code}): {label}...")
             else:
-                time.sleep(2.0)  # 성공 시 2초 대기 (자연스러운 간격)
+                print(f"[DEBUG] ❌ 네트워크 오류: {label}... - {outcome.detail}")
+            for url in urls:
+                article = pending_queue[url]
+                article["retry_count"] = article.get("retry_count", 0) + 1
+                article["last_attempt"] = datetime.now().isoformat()
+            failed_count += len(urls)
 
         # Pending 큐에서 제거
-        for url in urls_to_remove:
-            pending_queue = remove_from_pending(url, pending_queue)
+        for url, reason in urls_to_remove:
+            pending_queue = remove_from_pending(url, pending_queue, reason)
 
         # 전송 결과 통계
+        queue.log_report(waiting=list(pending_queue))
         print(f"[DEBUG] ✅ 전송 성공: {success_count}건")
         if failed_count > 0:
             print(f"[DEBUG] ⚠️ 전송 실패: {failed_count}건 (다음 사이클에 재시도)")
+        if deferred_count > 0:
+            print(f"[DEBUG] ⏳ 발송 마감 초과: {deferred_count}건 (시도 없이 다음 사이클로)")
         if max_retry_exceeded_count > 0:
             print(f"[DEBUG] ❌ 최대 재시도 초과: {max_retry_exceeded_count}건 (영구 제거)")
 
@@ -1602,7 +1988,8 @@ RUN_STATUS_FILE = os.path.join(DATA_FOLDER, "run_status.json")
 
 
 def update_run_status(success: bool, articles_collected: int, new_articles: int,
-                      telegram_sent: int, error_message: str = None):
+                      telegram_sent: int, error_message: str = None,
+                      quota_exceeded: bool = False):
     """
     실행 상태 업데이트 및 연속 실패 추적
 
@@ -1612,6 +1999,8 @@ def update_run_status(success: bool, articles_collected: int, new_articles: int,
         new_articles: 신규 기사 수
         telegram_sent: 텔레그램 발송 수
         error_message: 에러 메시지 (실패 시)
+        quota_exceeded: API 할당량 초과로 수집을 중단한 라운드 여부.
+            실행 횟수에는 포함하되 성공/실패 카운터는 건드리지 않음
     """
     try:
         os.makedirs(DATA_FOLDER, exist_ok=True)
@@ -1647,7 +2036,17 @@ def update_run_status(success: bool, articles_collected: int, new_articles: int,
         else:
             status_data["today_runs"] = status_data.get("today_runs", 0) + 1
 
-        if success:
+        status_data["quota_exceeded"] = quota_exceeded
+        if quota_exceeded:
+            # 할당량 소진은 시스템 장애가 아님 — 연속 실패 경고 없이 플래그만 기록
+            status_data["last_quota_exceeded_time"] = now.isoformat()
+            status_data["last_error"] = error_message
+            status_data["last_quota_stats"] = {
+                "articles_collected": articles_collected,
+                "new_articles": new_articles,
+                "telegram_sent": telegram_sent
+            }
+        elif success:
             status_data["consecutive_failures"] = 0
             status_data["last_success_time"] = now.isoformat()
             status_data["last_success_stats"] = {
@@ -1686,9 +2085,8 @@ def check_api_quota_and_alert():
         bool: API 사용 가능 여부
     """
     try:
-        data = _load_api_usage_data()
-        usage = data.get("count", 0)
-        alerts_sent = data.get("alerts_sent", [])
+        usage = quota_ledger.usage()
+        alerts_sent = quota_ledger.alerts_sent()
         remaining = MAX_API_CALLS_PER_DAY - usage
         usage_percent = (usage / MAX_API_CALLS_PER_DAY) * 100
 
@@ -1718,10 +2116,8 @@ def check_api_quota_and_alert():
 
         if label:
             send_system_alert(message)
-            # 발송 즉시 플래그 기록 (동일 라운드/타 프로세스의 재발송 방지)
-            if label not in alerts_sent:
-                alerts_sent.append(label)
-            _write_api_usage(usage, alerts_sent)
+            # 발송 즉시 플래그 기록·flush (동일 라운드/타 프로세스의 재발송 방지)
+            quota_ledger.mark_alert(label)
 
         return usage < MAX_API_CALLS_PER_DAY
 
@@ -1751,7 +2147,7 @@ def send_system_alert(message: str):
             "parse_mode": "Markdown"
         }
 
-        response = requests.post(url, json=payload, timeout=10)
+        response = http_client.post(url, json=payload, timeout=10)
         if response.status_code == 200:
             print(f"[DEBUG] ✅ 시스템 알림 전송 성공")
         else:
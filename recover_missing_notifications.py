@@ -6,6 +6,7 @@ DB에는 있지만 캐시에 없는 기사들을 찾아서 텔레그램으로 
 
 import pandas as pd
 from datetime import datetime, timedelta, timezone
+from modules import news_schema
 from news_collector import (
     load_news_db,
     load_sent_cache,
@@ -43,9 +44,9 @@ def main():
         # 캐시에 없는 기사 확인
         if url not in sent_cache and url_normalized not in sent_cache:
             # 날짜 확인 (최근 7일 이내)
-            article_date_str = row.get("날짜", "")
+            article_date_str = news_schema.format_date(row.get("날짜"))
             try:
-                article_date = pd.to_datetime(article_date_str, errors="coerce")
+                article_date = news_schema.parse_date(row.get("날짜"))
                 if pd.notna(article_date):
                     time_diff = now - article_date
                     days_diff = time_diff.total_seconds() / 86400
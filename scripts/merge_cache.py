@@ -1,61 +1,140 @@
-"""sent_articles_cache.json / pending_articles.json를 remote(origin/main)와 Union 병합.
+"""발송 이력 샤드(data/sent/) / pending 저널(pending_articles.log + .json 스냅샷)을 remote(origin/main)와 Union 병합.
 
 여러 워크플로우(heartbeat, news_monitor 백업)가 동시에 data/를 수정·push해도
 발송 이력(sent_cache)·재시도 큐(pending)가 유실되지 않도록, push 직전에
 remote 값과 local 값을 합친다. local 우선 union이라 이번 실행에서 새로 발송/추가한
 항목이 보존된다.
 
+발송 이력 로그(epoch\tURL, 일자별 샤드)는 .gitattributes의 merge=union으로 rebase 때 줄 단위로 합쳐지고,
+여기서는 remote 줄과 한 번 더 합쳐 URL당 한 줄(가장 이른 epoch)·시간순으로 정리한다.
+새 발송분은 오늘·어제 샤드에만 들어가므로 그 두 샤드와 매니페스트(샤드 이름 목록)만 합친다.
+
+pending 큐는 이벤트 저널이라 저널 줄은 merge=union으로 합쳐지고, 여기서는 로컬에 없는
+원격 이벤트(원격 스냅샷 포함)만 저널 끝에 덧붙인다. 스냅샷 재작성·저널 비우기는
+PendingJournal과 같은 기준(저널 줄 수 > max(200, 2×살아있는 이벤트))을 넘을 때만 한다.
+
 GitHub Actions의 push 단계에서 `git rebase origin/main` 직후 호출한다.
 """
-import json
 import os
 import subprocess
 import sys
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from modules import pending_journal, sent_store  # noqa: E402
+
 DATA = "data"
+PENDING_TTL_HOURS = 48  # news_collector.PENDING_TTL_HOURS와 동일
 
 
-def git_show(path):
-    """origin/main의 해당 파일 내용을 JSON으로 반환. 실패 시 None."""
+def git_show_text(path):
+    """origin/main의 해당 파일 내용(텍스트). 실패 시 None."""
     r = subprocess.run(
         ["git", "show", f"origin/main:{path}"],
         capture_output=True, text=True,
     )
     if r.returncode != 0:
         return None
-    try:
-        return json.loads(r.stdout)
-    except Exception:
-        return None
+    return r.stdout
 
 
-def merge_dict_key(local_path, top_key):
+def parse_log(text):
+    """epoch\tURL 로그 → {URL: epoch} (URL당 가장 이른 epoch)"""
+    out = {}
+    for line in text.splitlines():
+        ts, sep, url = line.partition("\t")
+        if not sep or not url:
+            continue
+        try:
+            epoch = int(float(ts))
+        except ValueError:
+            continue
+        if url not in out or epoch < out[url]:
+            out[url] = epoch
+    return out
+
+
+def merge_log(local_path):
     if not os.path.exists(local_path):
         return
-    remote = git_show(local_path)
-    if not remote:
+    remote_text = git_show_text(local_path)
+    if remote_text is None:
         return
     try:
         with open(local_path, "r", encoding="utf-8") as f:
-            local = json.load(f)
-        remote_items = remote.get(top_key, {})
-        local_items = local.get(top_key, {})
-        merged = {**remote_items, **local_items}  # local 우선 union
-        local[top_key] = merged
-        if top_key == "url_timestamps":
-            local["urls"] = list(merged.keys())
-        local["count"] = len(merged)
-        with open(local_path, "w", encoding="utf-8") as f:
-            json.dump(local, f, ensure_ascii=False, indent=2)
+            local_text = f.read()
+        remote_items = parse_log(remote_text)
+        local_items = parse_log(local_text)
+        merged = dict(remote_items)
+        for url, epoch in local_items.items():
+            if url not in merged or epoch < merged[url]:
+                merged[url] = epoch
+        out = "".join(f"{e}\t{u}\n" for u, e in sorted(merged.items(), key=lambda x: (x[1], x[0])))
+        if out != local_text:
+            with open(local_path, "w", encoding="utf-8") as f:
+                f.write(out)
         print(f"Merged {local_path}: remote={len(remote_items)}, "
               f"local={len(local_items)}, total={len(merged)}")
     except Exception as e:
         print(f"Merge skipped ({local_path}): {e}", file=sys.stderr)
 
 
+def merge_manifest(local_path):
+    """샤드 이름 목록 union (정렬·중복 제거)"""
+    if not os.path.exists(local_path):
+        return
+    remote_text = git_show_text(local_path) or ""
+    try:
+        with open(local_path, "r", encoding="utf-8") as f:
+            local_text = f.read()
+        names = sorted(set(sent_store.parse_manifest(remote_text)) | set(sent_store.parse_manifest(local_text)))
+        out = "".join(f"{n}\n" for n in names)
+        if out != local_text:
+            with open(local_path, "w", encoding="utf-8") as f:
+                f.write(out)
+        print(f"Merged {local_path}: shards={len(names)}")
+    except Exception as e:
+        print(f"Merge skipped ({local_path}): {e}", file=sys.stderr)
+
+
+def merge_pending(snapshot_path, journal_path):
+    """로컬에 없는 원격 이벤트만 저널에 덧붙이고, 압축 기준을 넘으면 스냅샷으로 압축"""
+    if not os.path.exists(snapshot_path) and not os.path.exists(journal_path):
+        return
+    try:
+        local = {}
+        for path in (snapshot_path, journal_path):
+            if os.path.exists(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    local[path] = pending_journal.parse_events(f.read())
+        known = {e["id"] for events in local.values() for e in events}
+        remote = [e for path in (snapshot_path, journal_path)
+                  for e in pending_journal.parse_events(git_show_text(path) or "")]
+        fresh = {e["id"]: e for e in remote if e["id"] not in known}
+        journal_events = local.get(journal_path, [])
+        if fresh:
+            added = list(fresh.values())  # 재생 때 (ts, op, id) 순으로 정렬되므로 순서 무관
+            with open(journal_path, "a", encoding="utf-8") as f:
+                f.write(pending_journal.format_events(added))
+            journal_events = journal_events + added
+        all_events = local.get(snapshot_path, []) + journal_events
+        live, _, tomb = pending_journal.replay(all_events)
+        compacted = pending_journal.should_compact(len(journal_events), len(live) + len(tomb))
+        if compacted:
+            events = pending_journal.compact_events(all_events, PENDING_TTL_HOURS * 3600)
+            pending_journal.write_atomic(snapshot_path, pending_journal.format_snapshot(events))
+            pending_journal.write_atomic(journal_path, "")
+        queue, _, _ = pending_journal.replay(all_events, PENDING_TTL_HOURS * 3600)
+        print(f"Merged {journal_path}: remote={len(remote)} events, fresh={len(fresh)}, "
+              f"queue={len(queue)}{', compacted' if compacted else ''}")
+    except Exception as e:
+        print(f"Merge skipped ({journal_path}): {e}", file=sys.stderr)
+
+
 def main():
-    merge_dict_key(f"{DATA}/sent_articles_cache.json", "url_timestamps")
-    merge_dict_key(f"{DATA}/pending_articles.json", "queue")
+    for name in sent_store.recent_shards(2):
+        merge_log(f"{DATA}/sent/{name}{sent_store.SHARD_SUFFIX}")
+    merge_manifest(f"{DATA}/sent/{sent_store.MANIFEST_NAME}")
+    merge_pending(f"{DATA}/pending_articles.json", f"{DATA}/pending_articles.log")
 
 
 if __name__ == "__main__":
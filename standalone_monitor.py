@@ -4,33 +4,52 @@ Streamlit 없이 독립적으로 뉴스를 수집하고 텔레그램 알림을 
 3분마다 GitHub Actions에서 자동 실행됩니다 (*/3 * * * *).
 """
 import os
+import threading
+import time
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 # 공통 모듈 import
+from modules import news_schema, sent_store
+from modules.lexicon import Lexicon
+from modules.poll_scheduler import PollScheduler
 from news_collector import (
     KEYWORDS,
     EXCLUDE_KEYWORDS,
+    REAL_ESTATE_WORDS,
+    POSCO_EXTRA_EXCLUDE_WORDS,
+    LEXICON,
     MAX_ITEMS_PER_RUN,
+    MAX_API_CALLS_PER_DAY,
     tag_priority,
     crawl_naver_news,
     crawl_google_news_rss,
     merge_news_sources,
+    enrich_articles,
     load_news_db,
     save_news_db,
+    load_keyword_watermarks,
+    save_keyword_watermarks,
+    seed_watermark,
+    load_rss_cache,
+    save_rss_cache,
     load_sent_cache,
     save_sent_cache,
+    merge_sent_log,
+    merge_sent_manifest,
     load_pending_queue,  # Pending 큐 로드
     save_pending_queue,  # Pending 큐 저장
+    merge_pending_journal,  # 원격 Pending 저널 병합
     add_to_pending,  # Pending 큐에 기사 추가
     process_pending_queue_and_send,  # Pending 큐 처리 및 텔레그램 전송
     detect_new_articles,
+    build_story_seed,
     send_telegram_notification,
     _naver_headers,
     _normalize_url,
     load_api_usage,
-    increment_api_usage,
-    check_api_quota,
+    flush_api_usage,
     is_first_run,
     mark_initialized,
     update_run_status,
@@ -80,6 +99,15 @@ KEYWORD_PRIORITY = {
     "포스코": 4,
 }
 
+# 키워드 병렬 수집 워커 수 (네이버 호출은 news_collector의 호스트 동시성 상한·초당 호출 상한이 별도로 제어)
+COLLECT_WORKERS = int(os.getenv("COLLECT_WORKERS", "6"))
+API_CALLS_PER_KEYWORD = 2  # 키워드당 예상 API 호출 수 (평균 페이지네이션)
+# 키워드별 적응형 폴링 (도착률 기반 간격). "0"이면 매 라운드 전체 키워드 폴링
+ADAPTIVE_POLLING = os.getenv("ADAPTIVE_POLLING", "1") != "0"
+# 라운드 발송 마감 (라운드 시작 기준 초). 즉시 발송·Pending 재시도·라운드 끝 발송이 남은 시간을 나눠 쓰고,
+# 나머지 시간(heartbeat timeout 240초까지)은 DB·워터마크·스케줄러 저장과 동기화 몫
+ROUND_SEND_DEADLINE = float(os.getenv("ROUND_SEND_DEADLINE", "180"))
+
 # 로거 import
 try:
     from logger import logger
@@ -100,126 +128,187 @@ def safe_print(text: str):
 
 
 def apply_keyword_filters(df: pd.DataFrame, keyword: str) -> pd.DataFrame:
-    """키워드별 필터링 로직 적용"""
+    """키워드별 필터링 로직 적용 (제목·요약을 LEXICON으로 1회씩 훑은 그룹 플래그의 컬럼 연산)"""
     if df.empty:
         return df
 
-    # "포스코인터내셔널" 정확한 매칭
-    if keyword == "포스코인터내셔널":
-        def should_include(row):
-            title = str(row.get("기사제목", ""))
-            description = str(row.get("주요기사 요약", ""))
-            return "포스코인터내셔널" in title or "포스코인터내셔널" in description
-
-        mask = df.apply(should_include, axis=1)
-        df = df[mask].reset_index(drop=True)
-        if not df.empty:
-            safe_print(f"[MONITOR] '포스코인터내셔널' 정확 매칭: {len(df)}건")
-
-    # "포스코모빌리티솔루션" 정확한 매칭
-    elif keyword == "포스코모빌리티솔루션":
-        def should_include(row):
-            title = str(row.get("기사제목", ""))
-            description = str(row.get("주요기사 요약", ""))
-            return "포스코모빌리티솔루션" in title or "포스코모빌리티솔루션" in description
-
-        mask = df.apply(should_include, axis=1)
-        df = df[mask].reset_index(drop=True)
-        if not df.empty:
-            safe_print(f"[MONITOR] '포스코모빌리티솔루션' 정확 매칭: {len(df)}건")
-
-    # "포스코플로우" 정확한 매칭
-    elif keyword == "포스코플로우":
-        def should_include(row):
-            title = str(row.get("기사제목", ""))
-            description = str(row.get("주요기사 요약", ""))
-            return "포스코플로우" in title or "포스코플로우" in description
-
-        mask = df.apply(should_include, axis=1)
-        df = df[mask].reset_index(drop=True)
-        if not df.empty:
-            safe_print(f"[MONITOR] '포스코플로우' 정확 매칭: {len(df)}건")
+    kw_groups = [f"kw:{tok}" for tok in keyword.split() if tok]
+    if not all(g in LEXICON.group_names for g in kw_groups):
+        # KEYWORDS 밖의 임의 키워드 — 해당 토큰만 담은 일회성 사전으로 보충
+        lex = Lexicon({"exclude": EXCLUDE_KEYWORDS, "realestate": REAL_ESTATE_WORDS,
+                       "interior": POSCO_EXTRA_EXCLUDE_WORDS, "brand": ["포스코", "posco"],
+                       **{g: [g[3:]] for g in kw_groups}},
+                      case_sensitive=["exclude", "realestate", "interior"] + kw_groups)
+    else:
+        lex = LEXICON
+    groups = ["exclude", "realestate", "interior", "brand"] + kw_groups
+    title = lex.flags(df.get("기사제목", pd.Series("", index=df.index)), groups)
+    desc = lex.flags(df.get("주요기사 요약", pd.Series("", index=df.index)), groups)
+    either = title | desc
 
     # "포스코" 키워드 특별 처리
-    elif keyword == "포스코":
-        def should_include(row):
-            title = str(row.get("기사제목", ""))
-            title_lower = title.lower()
-            description = str(row.get("주요기사 요약", ""))
-
-            # "포스코" 또는 "posco" 포함 체크
-            if "포스코" not in title and "posco" not in title_lower:
-                return False
-
-            # 자체 키워드로 별도 수집되는 계열사/브랜드는 범용 '포스코' 버킷에서 제외
-            # → 해당 계열사 키워드로 분류되도록 함 (카테고리 정확도 향상)
-            for ex in EXCLUDE_KEYWORDS:
-                if ex in title:
-                    return False
-
-            # 부동산 키워드 제외
-            exclude_words = ["청약", "분양", "입주", "재건축", "정비구역", "인테리어"]
-            for exclude_word in exclude_words:
-                if exclude_word in title or exclude_word in description:
-                    return False
-
-            return True
-
-        mask = df.apply(should_include, axis=1)
-        df = df[mask].reset_index(drop=True)
-        if not df.empty:
-            safe_print(f"[MONITOR] '포스코' 필터링 완료: {len(df)}건")
+    if keyword == "포스코":
+        # "포스코" 또는 "posco" 제목 포함 +
+        # 자체 키워드로 별도 수집되는 계열사/브랜드는 범용 '포스코' 버킷에서 제외
+        # → 해당 계열사 키워드로 분류되도록 함 (카테고리 정확도 향상) + 부동산 키워드 제외
+        mask = title["brand"] & ~title["exclude"] & ~either["realestate"] & ~either["interior"]
+        label = "'포스코' 필터링 완료"
+
+    # "포스코인터내셔널" / "포스코모빌리티솔루션" / "포스코플로우" 정확한 매칭
+    elif keyword in ("포스코인터내셔널", "포스코모빌리티솔루션", "포스코플로우"):
+        mask = either[f"kw:{keyword}"]
+        label = f"'{keyword}' 정확 매칭"
 
     # 기타 키워드 - 키워드가 기사에 실제로 '연속 문자열'로 등장할 때만 통과 (+ 부동산 제외)
     # 네이버 검색은 '포스코인터'를 '포스코'+'인터'로 토큰 분해해 무관 기사(예: 포스코 … 인터뷰)를
     # 반환하기도 한다. 태그 정확도를 위해 키워드의 모든 토큰이 제목/요약에 그대로 들어간 기사만 남긴다.
+    # (예: '포스코인터'는 붙어 있을 때만 매칭 — '포스코 … 인터' 분리 매칭은 배제)
     else:
-        exclude_words = ["분양", "청약", "입주", "재건축", "정비구역"]
-        kw_tokens = [t for t in keyword.split() if t]
-
-        def should_include(row):
-            title = str(row.get("기사제목", ""))
-            description = str(row.get("주요기사 요약", ""))
-            for exclude_word in exclude_words:
-                if exclude_word in title or exclude_word in description:
-                    return False
-            # 키워드(모든 토큰)가 제목 또는 요약에 연속 문자열로 실제 등장해야 함
-            # (예: '포스코인터'는 붙어 있을 때만 매칭 — '포스코 … 인터' 분리 매칭은 배제)
-            for tok in kw_tokens:
-                if tok not in title and tok not in description:
-                    return False
-            return True
-
-        mask = df.apply(should_include, axis=1)
-        df = df[mask].reset_index(drop=True)
-        if not df.empty:
-            safe_print(f"[MONITOR] '{keyword}' 키워드 포함 필터링: {len(df)}건")
-
+        mask = ~either["realestate"]
+        for g in kw_groups:
+            mask &= either[g]
+        label = f"'{keyword}' 키워드 포함 필터링"
+
+    df = df[mask].reset_index(drop=True)
+    if not df.empty:
+        safe_print(f"[MONITOR] {label}: {len(df)}건")
     return df
 
 
+def plan_keywords(keywords_sorted: list, api_usage: int) -> list:
+    """할당량 잔여량 기준 이번 라운드 수집 키워드 확정 (우선순위 순서 유지).
+
+    병렬 수집은 키워드별로 할당량을 확인할 수 없으므로, 시작 전에 잔여량을 우선순위 순서로
+    배분한다. 잔여량이 모자라면 우선순위 낮은(P3 이상) 키워드만 스킵하고 P1~P2는 계속 수집한다.
+    """
+    remaining = MAX_API_CALLS_PER_DAY - api_usage
+    planned = []
+    for kw in keywords_sorted:
+        priority = KEYWORD_PRIORITY.get(kw, 999)
+        if remaining < API_CALLS_PER_KEYWORD:
+            if priority >= 3:
+                safe_print(f"[MONITOR] ⏭️ API 할당량 부족 - 우선순위 낮은 키워드 스킵: '{kw}' (P{priority})")
+                continue
+            safe_print(f"[MONITOR] ⚠️ API 할당량 부족하지만 우선순위 높음: '{kw}' (P{priority}) - 계속 수집")
+        remaining -= API_CALLS_PER_KEYWORD
+        planned.append(kw)
+    return planned
+
+
+def _collect_keyword(kw: str, items_per_keyword: int, stop_event: threading.Event,
+                     watermark: dict = None, known_urls: set = None, rss_cache: dict = None):
+    """키워드 1개 수집: Naver (+ Google RSS) 병합 → 키워드 필터. 워커 스레드에서 실행.
+
+    Returns:
+        tuple: (키워드, 필터링된 DataFrame, 할당량 초과 여부, 수집 메타{api_calls, watermark, error, rss_cache}).
+        중단 신호 시 DataFrame은 None.
+    """
+    if stop_event.is_set():
+        return kw, None, False, {}
+
+    safe_print(f"[MONITOR] 키워드 '{kw}' 검색 중... (우선순위: {KEYWORD_PRIORITY.get(kw, 999)})")
+    naver_df = crawl_naver_news(kw, max_items=items_per_keyword, sort="date",
+                                watermark=watermark, known_urls=known_urls, enrich=False)
+    meta = {
+        "api_calls": naver_df.attrs.get('api_calls', API_CALLS_PER_KEYWORD),
+        "watermark": naver_df.attrs.get('watermark'),
+        "error": naver_df.attrs.get('error'),
+    }
+
+    if naver_df.attrs.get('quota_exceeded', False):
+        stop_event.set()  # 대기 중인 나머지 키워드 수집 중단
+        return kw, naver_df, True, meta
+
+    # Google News RSS 추가 수집 (POSCO International 키워드일 때만)
+    google_df = pd.DataFrame()
+    if "posco" in kw.lower() and "international" in kw.lower():
+        try:
+            safe_print(f"[MONITOR] Google News RSS 수집 중: {kw}")
+            google_df = crawl_google_news_rss(query="POSCO International", max_items=50,
+                                              rss_cache=rss_cache, enrich=False)
+            meta["rss_cache"] = google_df.attrs.get('rss_cache')
+        except Exception as e:
+            safe_print(f"[MONITOR] Google News RSS 실패: {e}")
+            google_df = pd.DataFrame()
+
+    # Naver + Google 병합 → 키워드별 필터링
+    df_kw = merge_news_sources(naver_df, google_df)
+    df_kw = apply_keyword_filters(df_kw, kw)
+    return kw, df_kw, False, meta
+
+
+def stream_keywords_concurrently(keywords: list, items_per_keyword: int,
+                                 max_workers: int = COLLECT_WORKERS,
+                                 watermarks: dict = None, known_urls: set = None,
+                                 rss_cache: dict = None):
+    """키워드 병렬 수집 (bounded thread pool) — 끝나는 키워드부터 바로 내보내는 제너레이터.
+
+    순차 수집은 키워드마다 네이버 응답(최대 10초)을 기다려 라운드가 수십 초 걸렸다.
+    워커 풀로 동시에 요청하되, 네이버 호스트 동시 연결·초당 호출 상한은 fetch_naver_news가 지킨다.
+    제출은 우선순위 순서라 T1 키워드가 먼저 끝나는 경우가 많고, 호출자가 한 키워드를 처리(감지·발송)하는
+    동안에도 나머지 키워드 수집은 계속된다. 할당량 초과가 감지되면 아직 시작하지 않은 키워드는 건너뛴다.
+
+    watermarks가 주어지면 키워드별 증분 수집(이미 본 기사 이후만)으로 동작한다.
+    rss_cache가 주어지면 Google RSS도 조건부(ETag/Last-Modified) 증분 수집한다.
+
+    Yields:
+        tuple: (키워드, DataFrame, 수집 메타, 할당량 초과 여부) — 완료 순서.
+        할당량 초과 키워드를 내보낸 뒤에는 더 내보내지 않는다.
+    """
+    stop_event = threading.Event()
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {
+            executor.submit(_collect_keyword, kw, items_per_keyword, stop_event,
+                            watermarks.get(kw) if watermarks is not None else None,
+                            known_urls, rss_cache): kw
+            for kw in keywords
+        }
+        for future in as_completed(futures):
+            kw = futures[future]
+            try:
+                _, df_kw, quota_hit, meta = future.result()
+            except Exception as e:
+                safe_print(f"[MONITOR] ⚠️ 키워드 '{kw}' 수집 실패: {e}")
+                df_kw, quota_hit, meta = pd.DataFrame(), False, {}
+            if quota_hit:
+                stop_event.set()
+                yield kw, df_kw, meta, True
+                return
+            if df_kw is not None:
+                yield kw, df_kw, meta, False
+
+
+def _is_urgent(article: dict) -> bool:
+    """즉시 발송(fast path) 대상: 부정 기사 또는 T1(포스코인터내셔널) 태그"""
+    return article.get("sentiment") == "neg" or tag_priority(article.get("keyword", "")) == 0
+
+
+def _round_keys(df: pd.DataFrame) -> pd.Series:
+    """라운드 내 중복 판정 키 (URL, 없으면 제목|날짜)"""
+    return df["URL"].where(df["URL"].astype(bool), df["기사제목"] + "|" + news_schema.date_strings(df["날짜"]))
+
+
 def _sync_state_to_github(sent_cache: set, pending_queue: dict) -> bool:
-    """발송 이력(sent_cache)·pending을 GitHub Contents API로 origin/main에 반영한다.
+    """발송 이력(sent_cache)·pending을 Git Data API 커밋 1개로 origin/main에 반영한다.
 
     [중복 재전송 근본 해결]
     Streamlit Cloud는 로컬 파일시스템이 휘발성이라, 발송(텔레그램) 성공 뒤에도 sent_cache가
-    repo에 반영되지 않아 재배포 시 '이미 보냄'을 잊고 재전송한다. 발송 직후 이 두 파일을
+    repo에 반영되지 않아 재배포 시 '이미 보냄'을 잊고 재전송한다. 발송 직후 이 파일들을
     repo에 커밋하면 repo가 발송 상태의 단일 진실원이 되어 재배포/재시작에도 중복이 사라진다.
 
     - 토큰(GH_PAT) 없으면 no-op (기존 동작 유지 → age-window 백스톱이 방어).
-    - 로컬 git 트리를 건드리지 않고 Contents API만 사용(배포 체크아웃에 안전).
+    - 로컬 git 트리를 건드리지 않고 API만 사용(배포 체크아웃에 안전).
     - 어떤 예외도 발송 흐름을 막지 않도록 조용히 무시한다.
-    - 동시 커밋(Actions 하트비트)과의 충돌은 sha 기반 409 재시도로 처리.
+    - repo_writer.commit_files: 원격 내용과 병합한 결과 중 바뀐 파일만 올려 커밋 1개로 반영하고,
+      동시 커밋(Actions 하트비트)과 겹쳐 ref 갱신이 거절되면 최신 원격과 다시 병합해 재시도.
     """
-    import base64
-    import json as _json
     import time as _time
 
     token = os.getenv("GH_PAT", "").strip()
     if not token:
         return False
     try:
-        import requests
+        from modules import repo_writer
     except Exception:
         return False
 
@@ -238,108 +327,55 @@ def _sync_state_to_github(sent_cache: set, pending_queue: dict) -> bool:
         pass
 
     from news_collector import (
-        save_sent_cache, save_pending_queue, _normalize_url,
+        save_sent_cache, merge_sent_log, merge_sent_manifest, save_pending_queue,
+        remove_from_pending,
     )
 
-    REPO = os.getenv("GH_REPO", "kimwoss/Risk_management")
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Accept": "application/vnd.github+json",
-        "X-GitHub-Api-Version": "2022-11-28",
-    }
-    SENT_PATH = "data/sent_articles_cache.json"
-    PENDING_PATH = "data/pending_articles.json"
-
-    def _get(path):
-        r = requests.get(
-            f"https://api.github.com/repos/{REPO}/contents/{path}",
-            headers=headers, params={"ref": "main"}, timeout=20,
-        )
-        if r.status_code == 200:
-            j = r.json()
-            return j.get("sha"), base64.b64decode(j.get("content", ""))
-        if r.status_code == 404:
-            return None, b""
-        raise RuntimeError(f"GET {path} -> {r.status_code}")
-
-    def _put(path, content_bytes, sha, msg):
-        payload = {
-            "message": msg, "branch": "main",
-            "content": base64.b64encode(content_bytes).decode(),
-        }
-        if sha:
-            payload["sha"] = sha
-        r = requests.put(
-            f"https://api.github.com/repos/{REPO}/contents/{path}",
-            headers=headers, json=payload, timeout=20,
-        )
-        return r.status_code
+    # 발송 이력은 일자별 샤드 — 이번 발송분이 들어가는 오늘·어제 샤드와 매니페스트만 주고받는다
+    SENT_PATHS = tuple(f"data/sent/{name}{sent_store.SHARD_SUFFIX}" for name in sent_store.recent_shards(2))
+    MANIFEST_PATH = f"data/sent/{sent_store.MANIFEST_NAME}"
+    PENDING_PATHS = ("data/pending_articles.log", "data/pending_articles.json")
 
-    def _read_local(path):
-        with open(path, "rb") as f:
-            return f.read()
-
-    sent_set = set(sent_cache)
-    ok = True
-
-    # ── sent_cache: 로컬(방금 보낸 URL 포함)이 remote의 상위집합 ──
-    #    (GitHub Actions는 sent를 '추가'하지 않으므로 union 후 덮어써도 유실 없음)
-    for _ in range(3):
-        try:
-            sha, remote_bytes = _get(SENT_PATH)
-            remote_urls = set()
+    def _build(remote) -> dict:
+        """원격 로그·저널과 합친 로컬 파일 내용 (재시도마다 최신 원격 기준으로 다시 병합)"""
+        # sent_cache: 로컬 샤드 ∪ remote 샤드 (append-only 로그 union이라 어느 쪽 발송분도 유실 없음)
+        for path in SENT_PATHS:
+            remote_bytes = remote.read(path)
             if remote_bytes:
-                try:
-                    rd = _json.loads(remote_bytes.decode("utf-8"))
-                    remote_urls = set(rd.get("url_timestamps", {}).keys()) or set(rd.get("urls", []))
-                except Exception:
-                    remote_urls = set()
-            save_sent_cache(sent_set | remote_urls)  # 정확한 포맷으로 로컬 기록
-            code = _put(SENT_PATH, _read_local(os.path.join("data", "sent_articles_cache.json")),
-                        sha, "auto(streamlit): sync sent_cache after telegram send")
-            if code in (200, 201):
-                break
-            if code == 409:
-                continue  # 다른 커밋과 충돌 → 최신 sha로 재시도
-            ok = False
-            break
-        except Exception as e:
-            safe_print(f"[SYNC] sent_cache 동기화 오류(무시): {e}")
-            ok = False
-            break
+                merge_sent_log(remote_bytes.decode("utf-8", errors="replace"))
+        remote_bytes = remote.read(MANIFEST_PATH)
+        if remote_bytes:
+            merge_sent_manifest(remote_bytes.decode("utf-8", errors="replace"))
+        save_sent_cache(sent_cache)
 
-    # ── pending: remote(Actions 신규 추가분 포함) ∪ local, 단 이미 보낸 것은 제거 ──
-    for _ in range(3):
-        try:
-            sha, remote_bytes = _get(PENDING_PATH)
-            remote_queue = {}
+        # pending: remote 저널·스냅샷 이벤트를 합친 뒤 이미 보낸 것은 success로 기록
+        # (이벤트 합집합 재생이라 Actions 신규 추가분·이쪽 발송 완료가 모두 보존)
+        for path in PENDING_PATHS:
+            remote_bytes = remote.read(path)
             if remote_bytes:
-                try:
-                    rd = _json.loads(remote_bytes.decode("utf-8"))
-                    remote_queue = rd.get("queue", {}) or {}
-                except Exception:
-                    remote_queue = {}
-            merged = {**remote_queue, **pending_queue}
-            pruned = {}
-            for k, v in merged.items():
-                link = (v.get("link") or k) if isinstance(v, dict) else k
-                if (link in sent_set or _normalize_url(link) in sent_set
-                        or k in sent_set or _normalize_url(k) in sent_set):
-                    continue  # 이미 전송됨 → 큐에서 제외
-                pruned[k] = v
-            save_pending_queue(pruned)
-            code = _put(PENDING_PATH, _read_local(os.path.join("data", "pending_articles.json")),
-                        sha, "auto(streamlit): sync pending after telegram send")
-            if code in (200, 201):
-                break
-            if code == 409:
-                continue
-            ok = False
-            break
-        except Exception as e:
-            safe_print(f"[SYNC] pending 동기화 오류(무시): {e}")
-            ok = False
-            break
+                merge_pending_journal(remote_bytes.decode("utf-8", errors="replace"))
+        merged = load_pending_queue()
+        for k, v in list(merged.items()):
+            link = (v.get("link") or k) if isinstance(v, dict) else k
+            if link in sent_cache or k in sent_cache:  # 지문 조회라 정규화 형태도 함께 매칭
+                merged = remove_from_pending(k, merged, "success")  # 이미 전송됨 → 큐에서 제외
+        save_pending_queue(merged)
+
+        files = {}
+        for path in SENT_PATHS + (MANIFEST_PATH,) + PENDING_PATHS:
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    files[path] = f.read()
+        return files
+
+    try:
+        ok, info = repo_writer.commit_files(
+            "public", _build, "auto(streamlit): sync sent_cache + pending after telegram send")
+        if not ok:
+            safe_print(f"[SYNC] 발송 상태 동기화 실패(무시): {info}")
+    except Exception as e:
+        safe_print(f"[SYNC] 발송 상태 동기화 오류(무시): {e}")
+        ok = False
 
     # throttle 타임스탬프 기록 (다음 최소 간격 내 재커밋 방지)
     try:
@@ -372,14 +408,25 @@ def main(send_telegram: bool = None):
     error_count = 0
     total_collected = 0
     telegram_success = 0
-    run_success = False
+    new_articles = []
+    send_deadline = time.monotonic() + ROUND_SEND_DEADLINE
+    remote_merged = False   # 원격 발송 이력 병합은 라운드당 1회 (첫 발송 직전)
+
+    def _send(pending_queue, sent_cache, urls=None):
+        nonlocal remote_merged
+        result = process_pending_queue_and_send(
+            pending_queue, sent_cache, urls=urls,
+            budget=max(0.0, send_deadline - time.monotonic()), merge_remote=not remote_merged)
+        remote_merged = True
+        return result
 
     try:
         safe_print("=" * 80)
         safe_print(f"[MONITOR] 뉴스 수집 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         safe_print("=" * 80)
 
-        # API 할당량 확인 및 경고
+        # API 할당량 장부 동기화(타 프로세스 사용량 반영) 후 확인 및 경고
+        flush_api_usage()
         check_api_quota_and_alert()
 
         # 전송 캐시 로드
@@ -400,27 +447,37 @@ def main(send_telegram: bool = None):
                 capture_output=True, text=True, timeout=30
             )
             if fetch_result.returncode == 0:
-                subprocess.run(
-                    ["git", "checkout", "origin/main", "--",
-                     "data/sent_articles_cache.json",
-                     "data/pending_articles.json"],
+                # 발송 이력은 append-only 로그라 덮어쓰지 않고 remote 줄을 합친다
+                # (일자별 샤드 중 최근 발송분이 들어가는 오늘·어제 샤드만)
+                for name in sent_store.recent_shards(2):
+                    shown = subprocess.run(
+                        ["git", "show", f"origin/main:data/sent/{name}{sent_store.SHARD_SUFFIX}"],
+                        capture_output=True, text=True, timeout=15
+                    )
+                    if shown.returncode == 0:
+                        merge_sent_log(shown.stdout)
+                shown = subprocess.run(
+                    ["git", "show", f"origin/main:data/sent/{sent_store.MANIFEST_NAME}"],
                     capture_output=True, text=True, timeout=15
                 )
+                if shown.returncode == 0:
+                    merge_sent_manifest(shown.stdout)
+                # pending도 이벤트 저널이라 remote 스냅샷·저널의 새 이벤트만 합치고 재생한다
+                # (다른 job의 발송 완료(success)가 반영되어 이미 보낸 항목은 큐에서 빠짐)
+                for path in ("data/pending_articles.json", "data/pending_articles.log"):
+                    shown = subprocess.run(
+                        ["git", "show", f"origin/main:{path}"],
+                        capture_output=True, text=True, timeout=15
+                    )
+                    if shown.returncode == 0:
+                        merge_pending_journal(shown.stdout)
                 remote_sent = load_sent_cache()
-                remote_pending = load_pending_queue()
 
                 # sent_cache: union (양쪽 모두 보존)
-                merged_sent = sent_cache | remote_sent
-
-                # pending_queue: remote 기본에 로컬 신규 항목 추가
-                # (이미 전송된 항목은 remote에서 제거되어 있을 것)
-                merged_pending = {**remote_pending, **pending_queue}
-
-                sent_cache = merged_sent
-                pending_queue = merged_pending
+                sent_cache = sent_cache | remote_sent
+                pending_queue = load_pending_queue()
 
                 save_sent_cache(sent_cache)
-                save_pending_queue(pending_queue)
                 safe_print(f"[MONITOR] 🔄 캐시 갱신 완료: sent={len(sent_cache)}, pending={len(pending_queue)}")
         except Exception as _e:
             safe_print(f"[MONITOR] ⚠️ 캐시 갱신 실패 (계속 진행): {_e}")
@@ -429,7 +486,7 @@ def main(send_telegram: bool = None):
         # 기존 Pending 큐 먼저 처리 (재시도) — 텔레그램 발송 경로에서만
         if pending_queue and send_telegram:
             safe_print(f"[MONITOR] 📤 기존 Pending 큐 처리 시작...")
-            pending_queue, sent_cache, retry_success = process_pending_queue_and_send(pending_queue, sent_cache)
+            pending_queue, sent_cache, retry_success = _send(pending_queue, sent_cache)
             telegram_success += retry_success
             safe_print(f"[MONITOR] 📤 Pending 큐 재시도 완료: {retry_success}건 전송")
 
@@ -467,112 +524,143 @@ def main(send_telegram: bool = None):
         keywords_sorted = sorted(KEYWORDS, key=lambda k: KEYWORD_PRIORITY.get(k, 999))
         safe_print(f"[MONITOR] 우선순위 정렬: {', '.join([f'{kw}(P{KEYWORD_PRIORITY.get(kw, 999)})' for kw in keywords_sorted[:3]])}...")
 
+        # 키워드 워터마크 (증분 수집 기준점) — 없는 키워드는 기존 DB에서 시드
+        watermarks = load_keyword_watermarks()
         for kw in keywords_sorted:
-            # API 할당량 확인 (2회 호출 필요 - 평균 페이지네이션)
-            if not check_api_quota(required_calls=2):
-                priority = KEYWORD_PRIORITY.get(kw, 999)
-
-                # 우선순위가 낮은 키워드는 스킵
-                if priority >= 3:
-                    safe_print(f"[MONITOR] ⏭️ API 할당량 부족 - 우선순위 낮은 키워드 스킵: '{kw}' (P{priority})")
-                    continue
-                else:
-                    safe_print(f"[MONITOR] ⚠️ API 할당량 부족하지만 우선순위 높음: '{kw}' (P{priority}) - 계속 수집")
-
-            safe_print(f"[MONITOR] 키워드 '{kw}' 검색 중... (우선순위: {KEYWORD_PRIORITY.get(kw, 999)})")
-            naver_df = crawl_naver_news(kw, max_items=items_per_keyword, sort="date")
-
-            # Google News RSS 추가 수집 (POSCO International 키워드일 때만)
-            google_df = pd.DataFrame()
-            if "posco" in kw.lower() and "international" in kw.lower():
-                try:
-                    safe_print(f"[MONITOR] Google News RSS 수집 중: {kw}")
-                    google_df = crawl_google_news_rss(query="POSCO International", max_items=50)
-                except Exception as e:
-                    safe_print(f"[MONITOR] Google News RSS 실패: {e}")
-                    google_df = pd.DataFrame()
-
-            # Naver + Google 병합
-            df_kw = merge_news_sources(naver_df, google_df)
-            if naver_df.attrs.get('quota_exceeded', False):
-                df_kw.attrs['quota_exceeded'] = True
-
-            # API 사용량 증가
-            current_api_usage = increment_api_usage(calls=2)
-
-            # API 할당량 초과 체크
-            if df_kw.attrs.get('quota_exceeded', False):
-                safe_print(f"[MONITOR] ⚠️ API 할당량 초과 감지 - 뉴스 수집 중단")
+            if kw not in watermarks:
+                watermarks[kw] = seed_watermark(existing_db, kw)
+
+        # 적응형 폴링: 도착률·우선순위 기반 간격이 도래한 키워드만 이번 라운드에 수집
+        scheduler = None
+        if ADAPTIVE_POLLING:
+            scheduler = PollScheduler(KEYWORD_PRIORITY, MAX_API_CALLS_PER_DAY)
+            scheduler.bootstrap(keywords_sorted, existing_db)
+            keywords_due = scheduler.due(keywords_sorted)
+            safe_print(f"[MONITOR] 적응형 폴링: {len(keywords_due)}/{len(keywords_sorted)}개 키워드 폴링 "
+                       f"({scheduler.summary(keywords_sorted)})")
+            keywords_sorted = keywords_due
+
+        # 할당량 배분 후 키워드 스트리밍 파이프라인: 수집 → 필터 → 라운드 중복 제거 → 보강 → 감지·대기열
+        # 키워드 하나가 끝날 때마다 바로 처리하고, 부정·T1 기사는 그 자리에서 발송(fast path).
+        # DB 병합(태그 우선순위 중복 해소)·저장은 라운드 끝에 1회.
+        keywords_planned = plan_keywords(keywords_sorted, current_api_usage)
+        rss_cache = load_rss_cache()
+        alerting = not is_first_run()   # 첫 실행은 알림 없이 초기화만 (라운드 끝 detect_new_articles가 표시)
+        fast_path = send_telegram and alerting
+        story_seed = build_story_seed(existing_db, sent_cache) if alerting else None  # 스토리 묶음 상태는 라운드당 1회
+        seen_keys = set()               # 이번 라운드에 앞서 처리한 기사 키
+        enriched_frames = []            # 보강(매체명·감성) 끝난 프레임 — 라운드 끝 병합에서 값 재사용
+        fast_sent = 0
+        _t0 = datetime.now()
+        for kw, df_kw, meta, quota_hit in stream_keywords_concurrently(
+            keywords_planned, items_per_keyword, watermarks=watermarks, known_urls=sent_cache,
+            rss_cache=rss_cache
+        ):
+            if quota_hit:
                 quota_exceeded = True
-                if LOGGER_AVAILABLE:
-                    logger.log_error("api_quota_exceeded", "Naver API 할당량 초과")
-                error_count += 1
                 break
+            # 실제 호출 수는 http_client 훅이 할당량 장부에 기록 (여기서는 로깅·스케줄러용)
+            api_calls = meta.get("api_calls", API_CALLS_PER_KEYWORD)
+            if meta.get("watermark") is not None:
+                watermarks[kw] = meta["watermark"]
+            if meta.get("rss_cache"):
+                rss_cache.update(meta["rss_cache"])
+            if scheduler is not None and meta and not meta.get("error"):
+                # 실패한 수집은 '0건 도착'이 아니라 관측 없음 — 도착률을 끌어내려 간격이 늘지 않도록 제외
+                scheduler.observe(kw, len(df_kw), api_calls)
+
+            if df_kw.empty:
+                continue
+            all_news.append(df_kw)
+            total_collected += len(df_kw)
+            safe_print(f"[MONITOR] '{kw}': {len(df_kw)}건 수집")
+
+            # 수집 로깅
+            if LOGGER_AVAILABLE:
+                logger.log_collection(kw, len(df_kw), api_calls=api_calls, incremental=True)
+
+            # 앞서 끝난 키워드가 이미 처리한 기사는 건너뜀 (DB 태그는 라운드 끝 병합에서 우선순위로 결정)
+            keys = _round_keys(df_kw)
+            fresh = ~keys.isin(seen_keys) & ~keys.duplicated()
+            if not fresh.any():
+                continue
+            seen_keys.update(keys[fresh])
+            df_fresh = enrich_articles(df_kw.loc[fresh].reset_index(drop=True), existing_db)
+            enriched_frames.append(df_fresh)
+            if not alerting:
+                continue
 
-            # 키워드별 필터링 적용
-            df_kw = apply_keyword_filters(df_kw, kw)
+            # 신규 기사 감지 (pending_queue도 함께 전달 → 이미 대기 중인 기사 재추가 방지)
+            found = detect_new_articles(existing_db, df_fresh, sent_cache, pending_queue, story_seed)
+            if not found:
+                continue
+            safe_print(f"[MONITOR] ✅ '{kw}' 신규 기사 {len(found)}건 감지 - Pending 큐에 추가")
+            for article in found:
+                pending_queue = add_to_pending(article, pending_queue)
+            new_articles.extend(found)
+            save_pending_queue(pending_queue)  # 즉시 저장 (데이터 손실 방지)
+
+            urgent = [a["link"] for a in found if _is_urgent(a)]
+            if fast_path and urgent:
+                safe_print(f"[MONITOR] ⚡ 즉시 발송: 부정·T1 기사 {len(urgent)}건 ('{kw}')")
+                pending_queue, sent_cache, n = _send(pending_queue, sent_cache, urls=urgent)
+                telegram_success += n
+                fast_sent += n
+                save_pending_queue(pending_queue)
+                save_sent_cache(sent_cache)
 
-            if not df_kw.empty:
-                all_news.append(df_kw)
-                total_collected += len(df_kw)
-                safe_print(f"[MONITOR] '{kw}': {len(df_kw)}건 수집")
+        safe_print(f"[MONITOR] 키워드 파이프라인 완료: {len(all_news)}개 키워드, "
+                   f"{(datetime.now() - _t0).total_seconds():.1f}초 (워커 {COLLECT_WORKERS}개, 즉시 발송 {fast_sent}건)")
 
-                # 수집 로깅
-                if LOGGER_AVAILABLE:
-                    logger.log_collection(kw, len(df_kw), api_calls=2)
+        # API 할당량 초과 체크
+        if quota_exceeded:
+            safe_print(f"[MONITOR] ⚠️ API 할당량 초과 감지 - 뉴스 수집 중단")
+            if LOGGER_AVAILABLE:
+                logger.log_error("api_quota_exceeded", "Naver API 할당량 초과")
+            error_count += 1
 
-        # API 할당량 초과 시 처리
+        # API 할당량 초과 시 처리 — 수집만 멈추고, 이미 수집·발송한 분의 DB·발송 상태·워터마크는 아래에서 저장
         if quota_exceeded:
-            safe_print(f"[MONITOR] ❌ API 할당량 초과로 뉴스 수집 실패")
+            safe_print(f"[MONITOR] ❌ API 할당량 초과로 뉴스 수집 중단 (수집분·발송 상태는 저장)")
             safe_print(f"[MONITOR] 💡 매일 자정(KST) 이후 할당량 재설정")
-            return
 
         # 통합 정리 & 저장
-        df_new = pd.concat(all_news, ignore_index=True) if all_news else pd.DataFrame()
+        df_new = news_schema.combine(all_news)
         if not df_new.empty:
             safe_print(f"[MONITOR] 총 수집: {len(df_new)}건")
 
             # 정렬: 태그 우선순위(포스코인터내셔널>포스코>계열사) → 최신순
             # 같은 URL 중복 시 우선순위 높은 태그(검색키워드) 행이 keep="first"로 유지됨
-            df_new["_tagpri"] = df_new["검색키워드"].map(tag_priority)
-            df_new["날짜_datetime"] = pd.to_datetime(df_new["날짜"], errors="coerce")
-            df_new = df_new.sort_values(["_tagpri", "날짜_datetime"], ascending=[True, False], na_position="last").reset_index(drop=True)
+            df_new["_tagpri"] = df_new["검색키워드"].astype(str).map(tag_priority)
+            df_new = df_new.sort_values(["_tagpri", "날짜"], ascending=[True, False], na_position="last").reset_index(drop=True)
 
             # 중복 제거 (우선순위 높은 태그 유지)
-            key = df_new["URL"].where(df_new["URL"].astype(bool), df_new["기사제목"] + "|" + df_new["날짜"])
-            df_new = df_new.loc[~key.duplicated()].reset_index(drop=True)
-            df_new = df_new.drop(columns=["_tagpri", "날짜_datetime"])
+            df_new = df_new.loc[~_round_keys(df_new).duplicated()].reset_index(drop=True)
+            df_new = df_new.drop(columns=["_tagpri"])
+
+            # 매체명·감성: 파이프라인에서 보강한 값 → 기존 DB 값 순으로 재사용 (새로 판정할 행 없음)
+            df_new = enrich_articles(df_new, news_schema.combine(enriched_frames + [existing_db]))
 
             # 기존 DB와 병합 (병합 후에도 태그 우선순위로 중복 해소)
-            merged = pd.concat([df_new, existing_db], ignore_index=True) if not existing_db.empty else df_new
-            merged["_tagpri"] = merged["검색키워드"].map(tag_priority)
+            merged = news_schema.combine([df_new, existing_db])
+            merged["_tagpri"] = merged["검색키워드"].astype(str).map(tag_priority)
             merged = merged.sort_values("_tagpri", kind="stable").reset_index(drop=True)
             merged = merged.drop_duplicates(subset=["URL", "기사제목"], keep="first").reset_index(drop=True)
             merged = merged.drop(columns=["_tagpri"])
             if not merged.empty:
-                merged["날짜"] = pd.to_datetime(merged["날짜"], errors="coerce")
                 merged = merged.sort_values("날짜", ascending=False, na_position="last").reset_index(drop=True)
-                merged["날짜"] = merged["날짜"].dt.strftime("%Y-%m-%d %H:%M")
 
-            # 신규 기사 감지 (pending_queue도 함께 전달 → 이미 대기 중인 기사 재추가 방지)
-            new_articles = detect_new_articles(existing_db, df_new, sent_cache, pending_queue)
+            if not alerting:
+                detect_new_articles(existing_db, df_new, sent_cache, pending_queue)  # 첫 실행 초기화 표시
 
-            # 신규 기사를 Pending 큐에 추가 (누락 방지)
+            # 나머지 신규 기사(즉시 발송 대상 외) 발송 — 발송 경로(GitHub Actions)에서만
             if new_articles:
-                safe_print(f"[MONITOR] ✅ 신규 기사 {len(new_articles)}건 감지 - Pending 큐에 추가")
-                for article in new_articles:
-                    pending_queue = add_to_pending(article, pending_queue)
-
-                # Pending 큐 즉시 저장 (데이터 손실 방지)
-                save_pending_queue(pending_queue)
-                safe_print(f"[MONITOR] 💾 Pending 큐 저장 완료: {len(pending_queue)}건")
-
-                # Pending 큐 처리 (텔레그램 전송) — 발송 경로(GitHub Actions)에서만
-                if send_telegram and not is_first_run():
+                safe_print(f"[MONITOR] 💾 Pending 큐: {len(pending_queue)}건 (이번 라운드 신규 {len(new_articles)}건)")
+                if send_telegram and alerting:
                     safe_print(f"[MONITOR] 📤 Pending 큐 처리 시작 (신규 기사 전송)...")
-                    pending_queue, sent_cache, new_success = process_pending_queue_and_send(pending_queue, sent_cache)
+                    pending_queue, sent_cache, new_success = _send(pending_queue, sent_cache)
                     telegram_success += new_success
-                    safe_print(f"[MONITOR] 📤 신규 기사 전송 완료: {new_success}건")
+                    safe_print(f"[MONITOR] 📤 신규 기사 전송 완료: {new_success}건 (즉시 발송 {fast_sent}건 별도)")
 
                     # Pending 큐 및 캐시 즉시 저장
                     save_pending_queue(pending_queue)
@@ -580,8 +668,8 @@ def main(send_telegram: bool = None):
 
                     # 텔레그램 로깅
                     if LOGGER_AVAILABLE:
-                        failed = len(new_articles) - new_success
-                        logger.log_telegram(new_success, failed, len(new_articles))
+                        sent_now = new_success + fast_sent
+                        logger.log_telegram(sent_now, max(0, len(new_articles) - sent_now), len(new_articles))
                 else:
                     _reason = "발송 비활성(Streamlit 수집 전용)" if not send_telegram else "첫 실행 감지"
                     safe_print(f"[MONITOR] ⏭️ 텔레그램 전송 스킵 ({_reason})")
@@ -598,6 +686,13 @@ def main(send_telegram: bool = None):
         else:
             safe_print(f"[MONITOR] ℹ️ 새로 수집된 기사가 없습니다.")
 
+        # 워터마크·RSS 캐시는 DB·Pending 반영이 끝난 뒤 라운드당 1회 저장
+        # (중간에 라운드가 죽으면 다음 라운드가 같은 구간을 다시 수집 → 누락 없음)
+        save_keyword_watermarks(watermarks)
+        save_rss_cache(rss_cache)
+        if scheduler is not None:
+            scheduler.save()
+
         # 마지막 캐시 및 Pending 큐 저장 (안전성 확보)
         safe_print(f"[MONITOR] 최종 캐시 저장 중... (현재 {len(sent_cache)}건)")
         save_sent_cache(sent_cache)
@@ -622,7 +717,7 @@ def main(send_telegram: bool = None):
         if LOGGER_AVAILABLE:
             logger.log_run_summary(
                 total_articles=total_collected,
-                new_articles=len(new_articles) if 'new_articles' in locals() else 0,
+                new_articles=len(new_articles),
                 telegram_sent=telegram_success,
                 errors=error_count
             )
@@ -630,12 +725,23 @@ def main(send_telegram: bool = None):
             logger.print_daily_summary()
             logger.save_daily_stats()
 
+        if quota_exceeded:
+            # 할당량 초과 라운드는 성공으로 기록하지 않되, 헬스체크가 볼 수 있게 플래그로 남김
+            update_run_status(
+                success=False,
+                articles_collected=total_collected,
+                new_articles=len(new_articles),
+                telegram_sent=telegram_success,
+                error_message="API 할당량 초과",
+                quota_exceeded=True
+            )
+            return
+
         # 실행 성공 상태 업데이트
-        run_success = True
         update_run_status(
             success=True,
             articles_collected=total_collected,
-            new_articles=len(new_articles) if 'new_articles' in locals() else 0,
+            new_articles=len(new_articles),
             telegram_sent=telegram_success
         )
 
@@ -662,6 +768,10 @@ def main(send_telegram: bool = None):
             error_message=str(e)
         )
 
+    finally:
+        # 할당량 장부는 라운드당 1회 flush (조기 종료·예외 경로 포함)
+        flush_api_usage()
+
 
 if __name__ == "__main__":
     main()
@@ -21,7 +21,6 @@ from news_collector import (
     crawl_google_news_rss,
     merge_news_sources,
     load_news_db,
-    _publisher_from_link,
     _clean_text,
     _naver_headers,
     load_sent_cache,
@@ -40,6 +39,7 @@ from dotenv import load_dotenv
 from bs4 import BeautifulSoup  # NEW
 
 from data_based_llm import DataBasedLLM
+from modules import http_client, media_registry, news_schema
 from components.status_dashboard import render_status_dashboard
 from components.publisher_dashboard import render_publisher_dashboard
 from components.news_dashboard import render_news_dashboard
@@ -803,278 +803,8 @@ def _clean_text(s: str) -> str:
     return s
 
 def _publisher_from_link(u: str) -> str:
-    """뉴스 원문 URL에서 매체명을 통일해서 반환한다."""
-    try:
-        host = urllib.parse.urlparse(u).netloc.lower().replace("www.", "")
-        if not host:
-            return ""
-
-        # 1) 서브도메인까지 정확 매핑(서브도메인 자체가 매체인 케이스 우선)
-        host_map = {
-            "en.yna.co.kr": "연합뉴스",
-            "news.kbs.co.kr": "KBS",
-            "news.mtn.co.kr": "MTN",
-            "starin.edaily.co.kr": "이데일리",
-            "sports.donga.com": "동아일보",
-            "biz.heraldcorp.com": "헤럴드경제",
-            "daily.hankooki.com": "데일리한국",
-            "news.dealsitetv.com": "딜사이트TV",
-        }
-        if host in host_map:
-            return host_map[host]
-
-        # 2) 기본 도메인(eTLD+1) 추출: *.co.kr 등 한국형 2레벨 도메인 처리
-        parts = host.split(".")
-        if len(parts) >= 3 and parts[-1] == "kr" and parts[-2] in {
-            "co","or","go","ne","re","pe","ac","hs","kg","sc",
-            "seoul","busan","incheon","daegu","daejeon","gwangju","ulsan",
-            "gyeonggi","gangwon","chungbuk","chungnam","jeonbuk","jeonnam",
-            "gyeongbuk","gyeongnam","jeju"
-        }:
-            base = ".".join(parts[-3:])   # 예) en.yna.co.kr → yna.co.kr
-        else:
-            base = ".".join(parts[-2:])   # 예) starnewskorea.com → starnewskorea.com
-
-        # 3) 기본 도메인 → 매체명 매핑
-        base_map = {
-            # 주요 종합지 / 방송
-            "chosun.com": "조선일보",
-            "donga.com": "동아일보",
-            "joongang.co.kr": "중앙일보",
-            "joins.com": "중앙일보",
-            "hani.co.kr": "한겨레",
-            "khan.co.kr": "경향신문",
-            "mk.co.kr": "매일경제",
-            "fnnews.com": "파이낸셜뉴스",
-            "hankyung.com": "한국경제",
-            "kmib.co.kr": "국민일보",
-            "seoul.co.kr": "서울신문",
-            "segye.com": "세계일보",
-            "naeil.com": "내일신문",
-            "imaeil.com": "매일신문",
-            "nongmin.com": "농민신문",
-            "yeongnam.com": "영남일보",
-            "kwnews.co.kr": "강원일보",
-            "kado.net": "강원도민일보",
-            "kihoilbo.co.kr": "기호일보",
-            "ksmnews.co.kr": "경상매일신문",
-            "kbmaeil.com": "경북매일",
-            "idaegu.co.kr": "IDN대구신문",
-            "hidomin.com": "하이도민",
-            "incheonilbo.com": "인천일보",
-            "incheonnews.com": "인천뉴스",
-            "ggilbo.com": "금강일보",
-            "joongdo.co.kr": "중도일보",
-            "dnews.co.kr": "대한경제",
-            "jeonmae.co.kr": "전국매일신문",
-
-            # 방송사
-            "kbs.co.kr": "KBS",
-            "mbc.co.kr": "MBC",
-            "sbs.co.kr": "SBS",
-            "ytn.co.kr": "YTN",
-            "yonhapnewstv.co.kr": "연합뉴스TV",
-            "ifm.kr": "경인방송",
-            "kbsm.net": "KBS부산·경남",
-            "spotvnews.co.kr": "스포TV",
-
-            # 통신사
-            "yna.co.kr": "연합뉴스",
-            "news1.kr": "뉴스1",
-            "newsis.com": "뉴시스",
-            "nocutnews.co.kr": "노컷뉴스",
-            "newspim.com": "뉴스핌",
-
-            # 경제 / 금융
-            "asiae.co.kr": "아시아경제",
-            "heraldcorp.com": "헤럴드경제",
-            "herald.co.kr": "헤럴드경제",
-            "sedaily.com": "서울경제",
-            "etoday.co.kr": "이투데이",
-            "edaily.co.kr": "이데일리",
-            "bizwatch.co.kr": "비즈워치",
-            "businesspost.co.kr": "비즈니스포스트",
-            "businesskorea.co.kr": "비즈니스코리아",
-            "finomy.com": "현대경제신문",
-            "econovill.com": "이코노빌",
-            "econonews.co.kr": "이코노뉴스",
-            "ezyeconomy.com": "이지경제",
-            "queen.co.kr": "이코노미퀸",
-            "widedaily.com": "와이드경제",
-            "goodkyung.com": "굿모닝경제",
-            "smartfn.co.kr": "스마트경제",
-            "megaeconomy.co.kr": "메가경제",
-            "pointe.co.kr": "포인트경제",
-            "pointdaily.co.kr": "포인트데일리",
-            "marketnews.co.kr": "마켓뉴스",
-            "womaneconomy.co.kr": "여성경제신문",
-
-            # 조선 계열
-            "chosunbiz.com": "조선비즈",
-            "investchosun.com": "인베스트조선",
-            "futurechosun.com": "더나은미래",
-            "it.chosun.com": "IT조선",
-            "dizzo.com": "디지틀조선일보",
-            "economist.co.kr": "이코노미스트",
-
-            # IT / 테크
-            "zdnet.co.kr": "지디넷코리아",
-            "ddaily.co.kr": "디지털데일리",
-            "bloter.net": "블로터",
-            "digitaltoday.co.kr": "디지털투데이",
-            "thelec.kr": "더일렉",
-            "theguru.co.kr": "더구루",
-            "techholic.co.kr": "테크홀릭",
-            "e-science.co.kr": "e사이언스",
-            "e-platform.net": "e플랫폼",
-            "irobotnews.com": "로봇신문사",
-            "koit.co.kr": "정보통신신문",
-
-            # 정치 / 시사
-            "polinews.co.kr": "폴리뉴스",
-            "sisajournal.com": "시사저널",
-            "sisajournal-e.com": "시사저널e",
-            "sisaweek.com": "시사위크",
-            "sisaon.co.kr": "시사ON",
-            "sisafocus.co.kr": "시사포커스",
-            "sisacast.kr": "시사캐스트",
-            "sateconomy.co.kr": "시사경제",
-            "straightnews.co.kr": "스트레이트뉴스",
-            "thepublic.kr": "더퍼블릭",
-            "mediapen.com": "미디어펜",
-            "newdaily.co.kr": "뉴데일리",
-            "breaknews.com": "브레이크뉴스",
-
-            # 온라인 / 기타
-            "wikitree.co.kr": "위키트리",
-            "insight.co.kr": "인사이트",
-            "insightkorea.co.kr": "인사이트코리아",
-            "newstapa.org": "뉴스타파",
-            "tf.co.kr": "더팩트",
-            "newsway.co.kr": "뉴스웨이",
-            "newspost.kr": "뉴스포스트",
-            "newswatch.kr": "뉴스워치",
-            "newsprime.co.kr": "뉴스프라임",
-            "newsinside.kr": "뉴스인사이드",
-            "news2day.co.kr": "뉴스2데이",
-            "newsquest.co.kr": "뉴스퀘스트",
-            "newsworker.co.kr": "뉴스워커",
-            "newsdream.kr": "뉴스드림",
-            "newsbrite.net": "뉴스브라이트",
-            "newsmaker.or.kr": "뉴스메이커",
-
-            # 산업 / 에너지
-            "ekn.kr": "에너지경제",
-            "energy-news.co.kr": "에너지뉴스",
-            "energydaily.co.kr": "에너지데일리",
-            "todayenergy.kr": "투데이에너지",
-            "gasnews.com": "가스신문",
-            "epj.co.kr": "일렉트릭파워",
-            "amenews.kr": "신소재경제신문",
-            "ferrotimes.com": "철강금속신문",
-
-            # 스포츠 / 엔터
-            "sportsseoul.com": "스포츠서울",
-            "xportsnews.com": "엑스포츠뉴스",
-            "starnewskorea.com": "스타뉴스",
-            "topstarnews.net": "탑스타뉴스",
-            "isplus.com": "일간스포츠",
-            "swtvnews.com": "스포츠W",
-
-            # 종교 / 특수
-            "bbsi.co.kr": "불교방송",
-            "bzeronews.com": "불교공뉴스",
-
-            # 기타
-            "kpinews.kr": "KPI뉴스",
-            "nbnews.kr": "NBN뉴스",
-            "nbntv.co.kr": "NBN뉴스",
-            "dkilbo.com": "대경일보",
-            "asiatime.co.kr": "아시아타임즈",
-            "kukinews.com": "쿠키뉴스",
-            "wikileaks-kr.org": "위키리크스한국",
-            "thepowernews.co.kr": "더파워",
-            "shinailbo.co.kr": "신아일보",
-            "pinpointnews.co.kr": "핀포인트뉴스",
-            "newsworks.co.kr": "뉴스웍스",
-            "newstomato.com": "뉴스토마토",
-            "munhwa.com": "문화일보",
-            "mt.co.kr": "머니투데이",
-            "metroseoul.co.kr": "메트로서울",
-            "m-i.kr": "매일일보",
-            "lawissue.co.kr": "법률저널",
-            "joongangenews.com": "중앙이코노미뉴스",
-            "hellot.net": "헬로티",
-            "enewstoday.co.kr": "이뉴스투데이",
-            "dt.co.kr": "디지털타임스",
-            "bokuennews.com": "복지뉴스",
-            "snmnews.com": "철강금속신문",
-            "whitepaper.co.kr": "화이트페이퍼",
-            "theviewers.co.kr": "더뷰어스",
-            "thevaluenews.co.kr": "더밸류뉴스",
-            "thebigdata.co.kr": "더빅데이터",
-            "stardailynews.co.kr": "스타데일리뉴스",
-            "smedaily.co.kr": "SME데일리",
-            "smarttoday.co.kr": "스마트투데이",
-            "pressian.com": "프레시안",
-            "ntoday.co.kr": "엔투데이",
-            "nspna.com": "NSP통신",
-            "moneys.co.kr": "머니S",
-            "klnews.co.kr": "물류신문",
-            "job-post.co.kr": "잡포스트",
-            "ilyosisa.co.kr": "일요시사",
-            "greened.kr": "녹색경제신문",
-            "globalepic.co.kr": "글로벌이코노믹",
-            "electimes.com": "전기신문",
-            "einfomax.co.kr": "연합인포맥스",
-            "dealsite.co.kr": "딜사이트",
-            "dailycar.co.kr": "데일리카",
-            "cnbnews.com": "CNB뉴스",
-            "ceoscoredaily.com": "CEO스코어데일리",
-            "autodaily.co.kr": "오토데일리",
-            "weeklytoday.com": "위클리투데이",
-            "viva100.com": "브릿지경제",
-            "veritas-a.com": "베리타스알파",
-            "thetracker.co.kr": "더트래커",
-            "sportschosun.com": "스포츠조선",
-            "seoulfn.com": "서울파이낸스",
-            "nextdaily.co.kr": "넥스트데일리",
-            "newscj.com": "천지일보",
-            "newscape.co.kr": "뉴스스케이프",
-            "mhj21.com": "문화저널21",
-            "kpenews.com": "한국정치경제신문",
-            "iminju.net": "경기민주언론시민연합",
-            "ilyoseoul.co.kr": "일요서울",
-            "ibabynews.com": "베이비뉴스",
-            "hansbiz.co.kr": "한스경제",
-            "gukjenews.com": "국제뉴스",
-            "ftoday.co.kr": "퓨쳐데일리",
-            "financialpost.co.kr": "파이낸셜포스트",
-            "fetv.co.kr": "FETV",
-            "etnews.com": "전자신문",
-            "dailian.co.kr": "데일리안",
-            "cstimes.com": "컨슈머타임스",
-            "bizwork.co.kr": "비즈웍스",
-            "betanews.net": "베타뉴스",
-            "banronbodo.com": "반론보도닷컴",
-            "topdaily.kr": "톱데일리",
-            "thebell.co.kr": "더벨",
-            "the-pr.co.kr": "더피알",
-            "stoo.com": "스포츠투데이",
-            "sportsworldi.com": "스포츠월드",
-            "seoulwire.com": "서울와이어",
-            "press9.kr": "프레스나인",
-            "newstown.co.kr": "뉴스타운",
-            "mhnse.com": "MHN스포츠(경제)",
-            "koreastocknews.com": "코리아스탁뉴스",
-            "fntimes.com": "파이낸셜뉴스타임즈",
-            "choicenews.co.kr": "초이스경제",
-            "asiatoday.co.kr": "아시아투데이",
-        }
-
-        return base_map.get(base, base)  # 모르는 도메인은 '기본 도메인'으로 통일
-    except Exception:
-        return ""
+    """뉴스 원문 URL에서 매체명을 통일해서 반환한다. (모르는 도메인은 '기본 도메인'으로 표시)"""
+    return media_registry.publisher(u, fallback_to_domain=True)
 
 # --- OpenAI 키 조회 (OPENAI_API_KEY 또는 OPEN_API_KEY 둘 다 지원) ---
 def _get_openai_key():
@@ -1090,7 +820,7 @@ def _post_with_retry(url, *, headers, json_body, timeout=25, max_retries=2):
     for attempt in range(len(delays) + 1):
         r = None
         try:
-            r = requests.post(url, headers=headers, json=json_body, timeout=timeout)
+            r = http_client.post(url, headers=headers, json=json_body, timeout=timeout)
             if r.status_code == 429 or r.status_code >= 500:
                 last_err = f"HTTP {r.status_code}"
             else:
@@ -1173,7 +903,7 @@ def _extract_article_text_and_title(url: str):
     html = ""
     resp = None
     try:
-        resp = requests.get(url, timeout=12, headers={
+        resp = http_client.get(url, timeout=12, headers={
             # 완전한 데스크톱 UA 사용: 네이버 등은 짧은 UA에 JS 셸만 반환해 본문 추출이 실패함
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
                           "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -1481,7 +1211,7 @@ def fetch_naver_news(query: str, start: int = 1, display: int = 50, sort: str =
             return {"items": [], "error": "missing_keys"}
 
         print(f"[DEBUG] Starting API request...")
-        r = requests.get(url, headers=headers, params=params, timeout=5)
+        r = http_client.get(url, headers=headers, params=params, timeout=5)
         print(f"[DEBUG] API Response status: {r.status_code}")
 
         # 429 에러 (할당량 초과) 명시적 처리
@@ -1569,7 +1299,7 @@ def crawl_naver_news(query: str, max_items: int = 200, sort: str = "date") -> pd
             break
     
     print(f"[DEBUG] crawl_naver_news completed for {query}: {len(items)} items")
-    df = pd.DataFrame(items, columns=["날짜", "매체명", "검색키워드", "기사제목", "주요기사 요약", "URL", "sentiment"])
+    df = news_schema.typed(pd.DataFrame(items, columns=news_schema.COLUMNS))
 
     # API 할당량 초과 정보를 DataFrame 속성으로 저장
     if quota_exceeded:
@@ -1578,12 +1308,10 @@ def crawl_naver_news(query: str, max_items: int = 200, sort: str = "date") -> pd
 
     if not df.empty:
         # 최신순 정렬 먼저 수행
-        df["날짜_datetime"] = pd.to_datetime(df["날짜"], errors="coerce")
-        df = df.sort_values("날짜_datetime", ascending=False, na_position="last").reset_index(drop=True)
-        df = df.drop("날짜_datetime", axis=1)
+        df = df.sort_values("날짜", ascending=False, na_position="last").reset_index(drop=True)
 
         # 중복 제거 (URL 우선, 없으면 제목+날짜)
-        key = df["URL"].where(df["URL"].astype(bool), df["기사제목"] + "|" + df["날짜"])
+        key = df["URL"].where(df["URL"].astype(bool), df["기사제목"] + "|" + news_schema.date_strings(df["날짜"]))
         df = df.loc[~key.duplicated()].reset_index(drop=True)
     return df
 
@@ -1645,11 +1373,9 @@ def load_news_db(force_refresh: bool = False) -> pd.DataFrame:
         try:
             if not os.path.exists(NEWS_DB_FILE):
                 return None
-            df = pd.read_csv(NEWS_DB_FILE, encoding="utf-8")
-            if "sentiment" not in df.columns:
-                df["sentiment"] = "pos"
-            if not df.empty and "날짜" in df.columns:
-                latest_date = df["날짜"].iloc[0]
+            df = news_schema.read_csv(NEWS_DB_FILE)
+            if not df.empty:
+                latest_date = news_schema.format_date(df["날짜"].iloc[0])
                 print(f"[DEBUG] ✅ 로컬 파일 로드: {len(df)}건, 최신: {latest_date}")
             return df
         except Exception as e:
@@ -1662,15 +1388,13 @@ def load_news_db(force_refresh: bool = False) -> pd.DataFrame:
             cache_buster = int(time.time()) if force_refresh else int(time.time() // 30)
             url = f"{GITHUB_RAW_URL}?t={cache_buster}"
             print(f"[DEBUG] GitHub 폴백 로드: {url}")
-            resp = requests.get(url, timeout=10)
+            resp = http_client.get(url, timeout=10)
             resp.raise_for_status()
             from io import StringIO
-            df = pd.read_csv(StringIO(resp.text), encoding="utf-8")
+            df = news_schema.read_csv(StringIO(resp.text))
             resp.close()
-            if "sentiment" not in df.columns:
-                df["sentiment"] = "pos"
-            if not df.empty and "날짜" in df.columns:
-                print(f"[DEBUG] ✅ GitHub 로드: {len(df)}건, 최신: {df['날짜'].iloc[0]}")
+            if not df.empty:
+                print(f"[DEBUG] ✅ GitHub 로드: {len(df)}건, 최신: {news_schema.format_date(df['날짜'].iloc[0])}")
             return df
         except Exception as e:
             print(f"[WARNING] GitHub 로드 실패: {e}")
@@ -1681,7 +1405,7 @@ def load_news_db(force_refresh: bool = False) -> pd.DataFrame:
         try:
             if d is None or d.empty or "날짜" not in d.columns:
                 return ""
-            return str(d["날짜"].astype(str).max())
+            return news_schema.format_date(d["날짜"].max())
         except Exception:
             return ""
 
@@ -1700,7 +1424,7 @@ def load_news_db(force_refresh: bool = False) -> pd.DataFrame:
         if gh_df is not None and _latest_ts(gh_df) > _latest_ts(local_df):
             df = gh_df
             try:
-                df.head(200).to_csv(NEWS_DB_FILE, index=False, encoding="utf-8")
+                news_schema.to_storage(df.head(200)).to_csv(NEWS_DB_FILE, index=False, encoding="utf-8")
                 print(f"[DEBUG] GitHub본이 더 신선({_latest_ts(gh_df)}) → 로컬 캐시 갱신")
             except Exception as e:
                 print(f"[WARNING] 로컬 캐시 갱신 실패: {e}")
@@ -1711,17 +1435,16 @@ def load_news_db(force_refresh: bool = False) -> pd.DataFrame:
         return df
 
     print("[ERROR] 모든 로드 시도 실패")
-    return pd.DataFrame(columns=["날짜","매체명","검색키워드","기사제목","주요기사 요약","URL","sentiment"])
+    return news_schema.empty_frame()
 
 def save_news_db(df: pd.DataFrame):
     if df.empty:
         print("[DEBUG] save_news_db skipped: empty dataframe")
         return
-    # 매체명 정리 (URL 기반)
-    if "매체명" in df.columns and "URL" in df.columns:
-        for idx, row in df.iterrows():
-            if pd.notna(row["URL"]):
-                df.at[idx, "매체명"] = _publisher_from_link(row["URL"])
+    df = news_schema.to_storage(df)
+    # 매체명 정리 (URL 기반, 같은 URL은 1회만 해석)
+    has_url = df["URL"].notna()
+    df.loc[has_url, "매체명"] = media_registry.publishers(df.loc[has_url, "URL"], fallback_to_domain=True)
 
     # 날짜 컬럼이 이미 정렬되어 있으므로 추가 정렬 생략
     # 상위 200개 저장 (50개에서 증가 - 중복 알림 방지)
@@ -1933,7 +1656,7 @@ def send_telegram_notification(new_articles: list):
 
             for attempt in range(max_retries):
                 try:
-                    response = requests.post(url, json=payload, timeout=10)
+                    response = http_client.post(url, json=payload, timeout=10)
                     if response.status_code == 200:
                         success_count += 1
                         print(f"[DEBUG] ✅ 메시지 전송 성공: {title[:30]}...")
@@ -1941,10 +1664,6 @@ def send_telegram_notification(new_articles: list):
                         # 전송 성공한 기사는 캐시에 추가
                         with _sent_articles_lock:
                             _sent_articles_cache.add(link)
-                            # 캐시 크기 제한
-                            if len(_sent_articles_cache) > _MAX_SENT_CACHE:
-                                # 오래된 항목 제거 (set이므로 임의 제거)
-                                _sent_articles_cache.pop()
                         break  # 성공하면 재시도 루프 탈출
                     else:
                         print(f"[DEBUG] ❌ 메시지 전송 실패 (시도 {attempt + 1}/{max_retries}): {response.status_code}")
@@ -2044,10 +1763,9 @@ def detect_new_articles(old_df: pd.DataFrame, new_df: pd.DataFrame) -> list:
             # URL이 기존 DB에 없으면 신규
             if url not in old_urls:
                 # 날짜 파싱 시도
-                article_date_str = row.get("날짜", "")
+                article_date_str = news_schema.format_date(row.get("날짜"))
                 try:
-                    # 날짜 형식: "YYYY-MM-DD HH:MM"
-                    article_date = pd.to_datetime(article_date_str, errors="coerce")
+                    article_date = news_schema.parse_date(row.get("날짜"))
 
                     # 날짜가 유효하면 최근 6시간 이내인지 확인
                     if pd.notna(article_date):
@@ -2095,10 +1813,9 @@ def detect_new_articles(old_df: pd.DataFrame, new_df: pd.DataFrame) -> list:
         print(f"[DEBUG] 상세 오류:\n{traceback.format_exc()}")
         return []
 
-# 전송된 기사 URL 추적 (파일 기반 초기화 + 메모리 캐시, 최근 1000개)
+# 전송된 기사 URL 추적 (파일 기반 초기화 + 64비트 지문 집합 — 건당 8바이트라 크기 제한·임의 제거 불필요, 만료는 TTL)
 _sent_articles_cache = load_sent_cache()  # GitHub Actions가 저장한 캐시 파일에서 로드
 _sent_articles_lock = threading.Lock()
-_MAX_SENT_CACHE = 1000
 
 # ----------------------------- 스타일 -----------------------------
 # CSS 캐시 비활성화 - 즉시 반영
@@ -3535,7 +3252,7 @@ def page_news_monitor():
         try:
             _df = st.session_state.get('news_display_data')
             if _df is not None and not _df.empty and "날짜" in _df.columns:
-                _latest = pd.to_datetime(str(_df["날짜"].astype(str).max()), errors="coerce")
+                _latest = news_schema.parse_dates(_df["날짜"]).max()
                 if pd.notna(_latest):
                     # 기사 시각은 KST 기준, 컨테이너는 UTC → KST now로 비교해야 함
                     _now_kst = datetime.now(timezone(timedelta(hours=9))).replace(tzinfo=None)
@@ -3613,11 +3330,9 @@ def page_news_monitor():
         return
 
     if "URL" in df_show.columns:
-        df_show["매체명"] = df_show["URL"].apply(_publisher_from_link)
-    if "매체명" in df_show.columns:
-        df_show["매체명"] = df_show.apply(
-            lambda row: _publisher_from_link(row["URL"]) if pd.notna(row["URL"]) else row["매체명"], axis=1
-        )
+        has_url = df_show["URL"].notna() & df_show["URL"].ne("")
+        df_show["매체명"] = media_registry.publishers(df_show["URL"].where(has_url), fallback_to_domain=True).where(
+            has_url, df_show["매체명"].astype(object))
 
     with c_download:
         st.download_button(
@@ -3768,7 +3483,7 @@ def page_news_monitor():
             media   = str(row.get("매체명", ""))
             keyword = str(row.get("검색키워드", ""))
             url = str(row.get("URL", ""))
-            dt = str(row.get("날짜", ""))
+            dt = news_schema.format_date(row.get("날짜"))
             sentiment = str(row.get("sentiment", "pos"))
             if " " in dt:
                 d, t = dt.split(" ", 1)
@@ -3850,7 +3565,9 @@ def page_news_monitor():
                 )
 
     else:
-        df_table = df_show[["날짜","매체명","검색키워드","기사제목","주요기사 요약","URL"]].rename(columns={
+        df_table = df_show[["날짜","매체명","검색키워드","기사제목","주요기사 요약","URL"]].assign(
+            날짜=news_schema.date_strings(df_show["날짜"])
+        ).rename(columns={
             "날짜":"📅 발행일시","매체명":"📰 언론사","검색키워드":"🔍 키워드","기사제목":"📰 제목","주요기사 요약":"📝 요약","URL":"🔗 링크"
         })
         st.dataframe(